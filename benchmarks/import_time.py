@@ -0,0 +1,90 @@
+# benchmarks/import_time.py
+
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+import subprocess
+import importlib.util
+from benchmarks.run_benchmarks import git_commit
+
+# What each CLI entry point has to import before it can start working
+TARGETS = {
+    'cli': 'import main',
+    'scan/report': 'import parsers.pipeline',
+    'batch': 'import parsers.batch',
+    'query': 'import parsers.graph_query',
+}
+HEAVY_MODULES = ('matplotlib', 'pandas', 'yaml', 'networkx', 'numpy')
+# What every entry point used to pay up front, before plotting/pandas/YAML were imported lazily
+REFERENCE = ('matplotlib.pyplot', 'networkx', 'pandas', 'yaml')
+DEFAULT_REPEAT = 7
+DEFAULT_MAX_FRACTION = 0.25
+
+PROBE = """
+import sys, time, json
+start = time.perf_counter()
+{statement}
+seconds = time.perf_counter() - start
+print(json.dumps({{'seconds': seconds, 'heavy': [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def measure(statement, repeat=DEFAULT_REPEAT):
+    """Median import time of statement over repeat fresh interpreters, and the heavy modules it loaded."""
+    samples, heavy = [], []
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, '-c', PROBE.format(statement=statement, heavy=HEAVY_MODULES)],
+                                cwd=root, capture_output=True, text=True, check=True).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        samples.append(result['seconds'])
+        heavy = result['heavy']
+    return statistics.median(samples), heavy
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Time the imports each entry point needs in fresh interpreters, against importing "
+                    "matplotlib.pyplot, networkx, pandas and yaml up front.")
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT, help="Fresh interpreters per target")
+    parser.add_argument('--max-fraction', type=float, default=DEFAULT_MAX_FRACTION,
+                        help="Fail if a target takes more than this fraction of the reference import time")
+    parser.add_argument('--output', help="Also save the results as JSON")
+    args = parser.parse_args(argv)
+
+    reference_modules = [name for name in REFERENCE if importlib.util.find_spec(name.split('.')[0])]
+    reference, _ = measure('import ' + ', '.join(reference_modules), args.repeat)
+    print(f"📏 reference ({', '.join(reference_modules)}): {reference * 1000:8.1f} ms")
+
+    results = {
+        'commit': git_commit(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'python': sys.version.split()[0],
+        'repeat': args.repeat,
+        'reference_seconds': reference,
+        'targets': [],
+    }
+    failed = False
+    for name, statement in TARGETS.items():
+        seconds, heavy = measure(statement, args.repeat)
+        fraction = seconds / reference if reference else 0.0
+        ok = fraction <= args.max_fraction and not heavy
+        failed = failed or not ok
+        loaded = f"  loads {', '.join(heavy)}" if heavy else ""
+        print(f"{'✅' if ok else '❌'} {name:<12} {seconds * 1000:8.1f} ms  ({fraction:.0%} of reference){loaded}")
+        results['targets'].append({'name': name, 'statement': statement, 'seconds': seconds,
+                                   'fraction': fraction, 'heavy_modules': heavy})
+
+    if args.output:
+        os.makedirs(os.path.dirname(args.output) or '.', exist_ok=True)
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"✅ Import-time results saved to {args.output}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+# benchmarks/run_benchmarks.py
+
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+import subprocess
+from benchmarks.synthetic_project import generate_project
+from parsers.pipeline import UIPipeline, StageTimings
+
+DEFAULT_SIZES = [100, 1000, 10000]
+DEFAULT_WORK_DIR = 'outputs/benchmarks'
+RENDER_LIMIT = 20000  # rendering is skipped for projects with more files than this by default
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def project_for(work_dir, files, seed):
+    """Generate the synthetic project for this size once and reuse it on later runs."""
+    root = os.path.join(work_dir, 'projects', f"synthetic_{files}_{seed}")
+    marker = os.path.join(root, '.generated')
+    if not os.path.exists(marker):
+        start = time.perf_counter()
+        summary = generate_project(root, files=files, seed=seed)
+        with open(marker, 'w') as f:
+            json.dump(summary, f)
+        print(f"🏗  Generated {files} files in {time.perf_counter() - start:.1f} s")
+    return root
+
+
+def run_size(root, files, jobs, trace_memory, render, work_dir):
+    timings = StageTimings(trace_memory=trace_memory)
+    pipeline = UIPipeline(root, jobs=jobs, rebuild_index=True, timings=timings,
+                          index_path=os.path.join(work_dir, 'script_index.json'))
+    pipeline.report(os.path.join(work_dir, f"dead_ui_report_{files}.csv"))
+    if render:
+        pipeline.render(os.path.join(work_dir, f"ui_graph_{files}.png"))
+    return {
+        'files': files,
+        'nodes': pipeline.graph.number_of_nodes(),
+        'edges': pipeline.graph.number_of_edges(),
+        'reachable': len(pipeline.reachable_ids),
+        'dead': len(pipeline.dead_ids),
+        'total_seconds': timings.total_seconds(),
+        'stages': timings.stages,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time and memory-profile every pipeline stage on synthetic projects.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help="Project sizes in files")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--jobs', type=int, default=1, help="Number of worker processes used for parsing")
+    parser.add_argument('--work-dir', default=DEFAULT_WORK_DIR, help="Where projects, reports and results go")
+    parser.add_argument('--output', help="Results JSON path (default: <work-dir>/results-<commit>.json)")
+    parser.add_argument('--trace-memory', action='store_true', help="Also record tracemalloc peaks per stage")
+    parser.add_argument('--render', choices=['auto', 'always', 'never'], default='auto',
+                        help=f"Render the graph ('auto': only up to {RENDER_LIMIT} files)")
+    args = parser.parse_args(argv)
+
+    os.makedirs(args.work_dir, exist_ok=True)
+    results = {
+        'commit': None,
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'python': sys.version.split()[0],
+        'platform': None,
+        'cpu_count': os.cpu_count(),
+        'jobs': args.jobs,
+        'trace_memory': args.trace_memory,
+        'runs': [],
+    }
+    for files in args.sizes:
+        root = project_for(args.work_dir, files, args.seed)
+        render = args.render == 'always' or (args.render == 'auto' and files <= RENDER_LIMIT)
+        print(f"📏 {files} files")
+        results['runs'].append(run_size(root, files, args.jobs, args.trace_memory, render, args.work_dir))
+
+    # Asked last: both start child processes that would show up in the stages' child peak memory
+    results['platform'] = platform.platform()
+    commit = results['commit'] = git_commit()
+    output = args.output or os.path.join(args.work_dir, f"results-{commit or 'unknown'}.json")
+    with open(output, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f"✅ Benchmark results saved to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,285 @@
+# benchmarks/synthetic_project.py
+
+import os
+import random
+import argparse
+
+# Built-in UnityEngine.UI.Button script, see parsers/script_index.BUILTIN_UI_SCRIPTS
+BUTTON_SCRIPT_GUID = '4e29b1a8efbd4b44bb3f3716e73f07ff'
+SCENES_PER_PREFAB = 20  # one scene for every 20 prefabs
+FAMILY_SIZE = 40  # prefabs are nested in trees of this many
+FANOUT = 3  # nested prefab instances per prefab
+FILES_PER_FOLDER = 1000
+
+YAML_HEADER = "%YAML 1.1\n%TAG !u! tag:unity3d.com,2011:\n"
+
+PROJECT_SETTINGS = """%YAML 1.1
+%TAG !u! tag:unity3d.com,2011:
+--- !u!129 &1
+PlayerSettings:
+  m_ObjectHideFlags: 0
+  serializedVersion: 23
+  productGUID: {product_guid}
+  companyName: Synthetic
+  productName: Synthetic UI Project {files}
+  defaultScreenWidth: 1024
+  defaultScreenHeight: 768
+  AndroidBundleVersionCode: 1
+  AndroidMinSdkVersion: 22
+  AndroidTargetSdkVersion: 0
+  applicationIdentifier:
+    {platform}: com.synthetic.ui
+  m_BuildTargetIcons:
+  - m_BuildTarget: {platform}
+    m_Icons: []
+"""
+
+CONTROLLER_SCRIPT = """using UnityEngine;
+using UnityEngine.SceneManagement;
+
+public class {name} : MonoBehaviour
+{{
+    public GameObject panel;
+
+{methods}
+    public void Show() {{ panel.SetActive(true); }}
+    public void Hide() {{ panel.SetActive(false); }}
+}}
+"""
+
+CONTROLLER_METHOD = '    public void Open{scene}() {{ SceneManager.LoadScene("{scene}"); }}\n'
+
+
+class _FileWriter:
+    """Builds one scene or prefab as a list of `--- !u!` documents with unique fileIDs."""
+
+    def __init__(self, rng):
+        self.rng = rng
+        self.parts = [YAML_HEADER]
+        self.used_ids = set()
+
+    def new_id(self):
+        while True:
+            file_id = self.rng.getrandbits(62) + 1
+            if file_id not in self.used_ids:
+                self.used_ids.add(file_id)
+                return file_id
+
+    def reserve(self, file_id):
+        self.used_ids.add(file_id)
+        return file_id
+
+    def game_object(self, file_id, name, component_ids):
+        components = ''.join(f"  - component: {{fileID: {c}}}\n" for c in component_ids)
+        self.parts.append(
+            f"--- !u!1 &{file_id}\nGameObject:\n  m_ObjectHideFlags: 0\n  serializedVersion: 6\n"
+            f"  m_Component:\n{components}  m_Layer: 5\n  m_Name: {name}\n  m_TagString: Untagged\n"
+            f"  m_IsActive: 1\n"
+        )
+
+    def rect_transform(self, file_id, game_object_id, father_id, child_ids=()):
+        children = ''.join(f"  - {{fileID: {c}}}\n" for c in child_ids) or ''
+        self.parts.append(
+            f"--- !u!224 &{file_id}\nRectTransform:\n  m_ObjectHideFlags: 0\n"
+            f"  m_GameObject: {{fileID: {game_object_id}}}\n  m_LocalScale: {{x: 1, y: 1, z: 1}}\n"
+            f"  m_Children:{' []' if not children else ''}\n{children}"
+            f"  m_Father: {{fileID: {father_id}}}\n  m_AnchorMin: {{x: 0, y: 0}}\n"
+        )
+
+    def canvas(self, file_id, game_object_id):
+        self.parts.append(
+            f"--- !u!223 &{file_id}\nCanvas:\n  m_ObjectHideFlags: 0\n"
+            f"  m_GameObject: {{fileID: {game_object_id}}}\n  m_Enabled: 1\n  m_RenderMode: 0\n"
+        )
+
+    def mono_behaviour(self, file_id, game_object_id, script_guid, body=''):
+        self.parts.append(
+            f"--- !u!114 &{file_id}\nMonoBehaviour:\n  m_ObjectHideFlags: 0\n"
+            f"  m_GameObject: {{fileID: {game_object_id}}}\n  m_Enabled: 1\n"
+            f"  m_Script: {{fileID: 11500000, guid: {script_guid}, type: 3}}\n"
+            f"  m_Name: \n  m_EditorClassIdentifier: \n{body}"
+        )
+
+    def button(self, file_id, game_object_id, calls):
+        """calls: (target file_id, method name, target asset guid or None) tuples for m_OnClick."""
+        entries = []
+        for target_id, method, guid in calls:
+            target = f"{{fileID: {target_id}, guid: {guid}, type: 3}}" if guid else f"{{fileID: {target_id}}}"
+            entries.append(
+                f"      - m_Target: {target}\n"
+                f"        m_TargetAssemblyTypeName: Controller, Assembly-CSharp\n"
+                f"        m_MethodName: {method}\n        m_Mode: 1\n"
+                f"        m_Arguments:\n          m_ObjectArgument: {{fileID: 0}}\n"
+                f"          m_StringArgument: \n        m_CallState: 2\n"
+            )
+        self.mono_behaviour(file_id, game_object_id, BUTTON_SCRIPT_GUID,
+                            "  m_Interactable: 1\n  m_OnClick:\n    m_PersistentCalls:\n"
+                            f"      m_Calls:{' []' if not entries else ''}\n{''.join(entries)}")
+
+    def prefab_instance(self, file_id, parent_transform_id, prefab, name):
+        """Instance of a nested prefab plus the stripped root GameObject and controller standing for it."""
+        source_guid = prefab['guid']
+        self.parts.append(
+            f"--- !u!1001 &{file_id}\nPrefabInstance:\n  m_ObjectHideFlags: 0\n  serializedVersion: 2\n"
+            f"  m_Modification:\n    m_TransformParent: {{fileID: {parent_transform_id}}}\n"
+            f"    m_Modifications:\n"
+            f"    - target: {{fileID: {prefab['root_id']}, guid: {source_guid}, type: 3}}\n"
+            f"      propertyPath: m_Name\n      value: {name}\n      objectReference: {{fileID: 0}}\n"
+            f"    m_RemovedComponents: []\n"
+            f"  m_SourcePrefab: {{fileID: 100100000, guid: {source_guid}, type: 3}}\n"
+        )
+        stripped_root, stripped_controller = self.new_id(), self.new_id()
+        for stripped_id, class_id, class_name, source_id in (
+                (stripped_root, 1, 'GameObject', prefab['root_id']),
+                (stripped_controller, 114, 'MonoBehaviour', prefab['controller_id'])):
+            self.parts.append(
+                f"--- !u!{class_id} &{stripped_id} stripped\n{class_name}:\n"
+                f"  m_CorrespondingSourceObject: {{fileID: {source_id}, guid: {source_guid}, type: 3}}\n"
+                f"  m_PrefabInstance: {{fileID: {file_id}}}\n"
+            )
+        return stripped_controller
+
+    def text(self):
+        return ''.join(self.parts)
+
+
+def _guid(rng):
+    return f"{rng.getrandbits(128):032x}"
+
+
+def _write(path, text, guid=None):
+    with open(path, 'w', encoding='utf-8', newline='\n') as f:
+        f.write(text)
+    if guid is not None:
+        with open(path + '.meta', 'w', encoding='utf-8', newline='\n') as f:
+            f.write(f"fileFormatVersion: 2\nguid: {guid}\n")
+
+
+def _panel_file(rng, prefab, children, controller_guid, buttons, scenes):
+    """A prefab: root panel with a controller, some buttons, and nested prefab instances."""
+    writer = _FileWriter(rng)
+    root_id = writer.reserve(prefab['root_id'])
+    controller_id = writer.reserve(prefab['controller_id'])
+    root_transform = writer.new_id()
+    button_ids = [(writer.new_id(), writer.new_id(), writer.new_id()) for _ in range(buttons)]
+    instance_ids = [writer.new_id() for _ in children]
+
+    writer.game_object(root_id, prefab['name'], [root_transform, controller_id])
+    writer.rect_transform(root_transform, root_id, 0, [t for _, t, _ in button_ids])
+    writer.mono_behaviour(controller_id, root_id, controller_guid, "  panel: {fileID: %d}\n" % root_id)
+
+    stripped_controllers = [
+        writer.prefab_instance(instance_id, root_transform, child, f"{child['name']} (Nested)")
+        for instance_id, child in zip(instance_ids, children)
+    ]
+    for index, (go_id, transform_id, button_id) in enumerate(button_ids):
+        writer.game_object(go_id, f"{prefab['name']} Button {index}", [transform_id, button_id])
+        writer.rect_transform(transform_id, go_id, root_transform)
+        if stripped_controllers and index < len(stripped_controllers):
+            calls = [(stripped_controllers[index], 'Show', None)]
+        elif index % 2 and scenes:
+            calls = [(controller_id, f"Open{rng.choice(scenes)['name']}", None)]
+        else:
+            calls = [(controller_id, 'Hide', None)]
+        writer.button(button_id, go_id, calls)
+    return writer.text()
+
+
+def _scene_file(rng, scene, roots, controller_guid, buttons):
+    """A scene: a Canvas with a controller and buttons that open the prefab families placed in it."""
+    writer = _FileWriter(rng)
+    canvas_go, canvas_transform, canvas_id, controller_id = (writer.new_id() for _ in range(4))
+    writer.game_object(canvas_go, 'Canvas', [canvas_transform, canvas_id, controller_id])
+    writer.rect_transform(canvas_transform, canvas_go, 0)
+    writer.canvas(canvas_id, canvas_go)
+    writer.mono_behaviour(controller_id, canvas_go, controller_guid, "  panel: {fileID: %d}\n" % canvas_go)
+
+    stripped_controllers = [
+        writer.prefab_instance(writer.new_id(), canvas_transform, root, root['name']) for root in roots
+    ]
+    for index in range(max(buttons, len(stripped_controllers))):
+        go_id, transform_id, button_id = writer.new_id(), writer.new_id(), writer.new_id()
+        writer.game_object(go_id, f"{scene['name']} Button {index}", [transform_id, button_id])
+        writer.rect_transform(transform_id, go_id, canvas_transform)
+        if index < len(stripped_controllers):
+            calls = [(stripped_controllers[index], 'Show', None)]
+        else:
+            calls = [(controller_id, 'Hide', None)]
+        writer.button(button_id, go_id, calls)
+    return writer.text()
+
+
+def generate_project(root, files=1000, buttons=4, dead_ratio=0.2, seed=0, platform='Android'):
+    """
+    Write a synthetic Unity project with `files` scenes and prefabs under root/Assets.
+
+    Prefabs come in families of FAMILY_SIZE, nested FANOUT-ary through PrefabInstances
+    (with stripped objects, as Unity writes them). Each scene places the roots of some
+    families and has buttons whose m_OnClick calls show them; about dead_ratio of the
+    families are never placed in any scene, so their UI is dead. Every asset and
+    script gets a .meta GUID, and ProjectSettings targets `platform`.
+    Returns a summary dict.
+    """
+    rng = random.Random(seed)
+    scene_count = max(1, files // SCENES_PER_PREFAB)
+    prefab_count = max(0, files - scene_count)
+
+    for folder in ('Assets/Scenes', 'Assets/Scripts', 'ProjectSettings', 'Library/ShaderCache'):
+        os.makedirs(os.path.join(root, folder), exist_ok=True)
+    _write(os.path.join(root, 'ProjectSettings', 'ProjectSettings.asset'),
+           PROJECT_SETTINGS.format(product_guid=_guid(rng), files=files, platform=platform))
+    # Editor cache content that discovery must skip
+    _write(os.path.join(root, 'Library', 'ShaderCache', 'Cached.prefab'), YAML_HEADER)
+
+    scenes = [{'name': 'MainMenu' if i == 0 else f"Scene{i}", 'guid': _guid(rng)} for i in range(scene_count)]
+    scripts = []
+    for i in range(max(1, files // 100)):
+        name = f"Controller{i}"
+        guid = _guid(rng)
+        methods = ''.join(CONTROLLER_METHOD.format(scene=s['name']) for s in rng.sample(scenes, min(3, len(scenes))))
+        _write(os.path.join(root, 'Assets', 'Scripts', f"{name}.cs"),
+               CONTROLLER_SCRIPT.format(name=name, methods=methods), guid)
+        scripts.append(guid)
+
+    prefabs = []
+    for i in range(prefab_count):
+        guid = _guid(rng)
+        prefabs.append({
+            'name': f"Panel{i}", 'guid': guid,
+            'root_id': int(guid[:15], 16) + 1, 'controller_id': int(guid[15:30], 16) + 2,
+            'folder': os.path.join('Assets', 'Prefabs', f"Group{i // FILES_PER_FOLDER}"),
+        })
+
+    families = [prefabs[i:i + FAMILY_SIZE] for i in range(0, prefab_count, FAMILY_SIZE)]
+    live_families = [f for f in families if rng.random() >= dead_ratio] or families[:1]
+    for family in families:
+        for index, prefab in enumerate(family):
+            children = family[index * FANOUT + 1:index * FANOUT + 1 + FANOUT]
+            os.makedirs(os.path.join(root, prefab['folder']), exist_ok=True)
+            _write(os.path.join(root, prefab['folder'], f"{prefab['name']}.prefab"),
+                   _panel_file(rng, prefab, children, rng.choice(scripts), buttons, scenes), prefab['guid'])
+
+    placed = {i: [] for i in range(scene_count)}
+    for index, family in enumerate(live_families):
+        placed[index % scene_count].append(family[0])
+    for index, scene in enumerate(scenes):
+        _write(os.path.join(root, 'Assets', 'Scenes', f"{scene['name']}.unity"),
+               _scene_file(rng, scene, placed[index], rng.choice(scripts), buttons), scene['guid'])
+
+    return {'root': root, 'files': scene_count + prefab_count, 'scenes': scene_count,
+            'prefabs': prefab_count, 'scripts': len(scripts), 'families': len(families),
+            'dead_families': len(families) - len(live_families)}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Write a synthetic Unity project for benchmarks.")
+    parser.add_argument('output_dir')
+    parser.add_argument('--files', type=int, default=1000, help="Number of scenes + prefabs")
+    parser.add_argument('--buttons', type=int, default=4, help="Buttons per scene/prefab")
+    parser.add_argument('--dead-ratio', type=float, default=0.2, help="Share of prefab families never placed")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--platform', default='Android', help="Build target written to ProjectSettings")
+    args = parser.parse_args()
+    summary = generate_project(args.output_dir, args.files, args.buttons, args.dead_ratio, args.seed, args.platform)
+    print(f"✅ {summary['files']} files ({summary['scenes']} scenes, {summary['prefabs']} prefabs) "
+          f"written to {args.output_dir}")
@@ -1,28 +1,187 @@
-import os
-from parsers.android_filter import is_android_project
-from parsers.ui_reachability_analyzer import find_reachable_ui_nodes
-from parsers.dead_ui_report import generate_dead_ui_report
+import sys
+import argparse
+from parsers.android_filter import detect_platform
+from parsers.parse_cache import ParseCache, DEFAULT_CACHE_DIR
+from parsers.ui_reachability_analyzer import ENTRY_KEYWORDS
+from parsers.pipeline import UIPipeline, PartitionedUIPipeline, StageTimings
+from parsers.partitioned_graph import DEFAULT_PARTITION_DIR
+from parsers.batch import run_batch, DEFAULT_BATCH_DIR
+from parsers.dead_ui_report import REPORT_FORMATS
+from parsers.instrumentation import Instrumentation, DEFAULT_TOP
+from parsers.revision_diff import RevisionDiff, DEFAULT_DIFF_REPORT
 
+DEFAULT_PROJECT_ROOT = 'datasets/open-project-1-main/UOP1_Project'
+DEFAULT_SNAPSHOT = 'outputs/ui_navigation.uigraph'
+DEFAULT_REPORT = 'outputs/dead_ui_report.csv'
+DEFAULT_IMAGE = 'outputs/ui_navigation_graph.png'
 
-def main(project_root='datasets/open-project-1-main/UOP1_Project',
-         gexf_path='outputs/ui_navigation_graph.gexf',
-         output_csv='outputs/dead_ui_report.csv'):
+COMMANDS = {
+    'scan': "Discover and parse every scene and prefab",
+    'graph': "Build the navigation graph and save it as a snapshot",
+    'reach': "Count reachable and dead UI nodes",
+    'report': "Write the dead UI report",
+    'render': "Draw the graph, colored by reachability",
+    'all': "Run every stage and write the report and the drawing",
+    'batch': "Write dead UI reports for many projects, parsed on one shared worker pool",
+    'diff': "Report UI nodes that became dead or reachable between two git revisions",
+}
 
-    print("🔍 Checking if the Unity project targets Android...")
-    if not is_android_project(project_root):
-        print("❌ Not an Android-targeted Unity project. Skipping analysis.")
+
+def run(args, cache=None, timings=None, instrumentation=None):
+    timings = timings if timings is not None else StageTimings()
+    if args.command == 'batch':
+        run_batch(args.projects, args.output_dir, entry_keywords=args.entry or ENTRY_KEYWORDS, jobs=args.jobs,
+                  cache=cache, threads=args.threads, any_platform=args.any_platform,
+                  rebuild_index=args.rebuild_index, report_format=args.report_format,
+                  scripts=not args.no_scripts, timings=timings, instrumentation=instrumentation)
+        print(f"⏱  total    {timings.total_seconds():8.3f} s")
+        return
+
+    if args.command == 'diff':
+        diff = RevisionDiff(args.project_root, args.base, args.head, entry_keywords=args.entry or ENTRY_KEYWORDS,
+                            jobs=args.jobs, cache=cache, timings=timings)
+        try:
+            diff.report(args.output, args.report_format)
+        except ValueError as error:
+            print(f"❌ {error}")
+            sys.exit(2)
+        print(f"⏱  total    {timings.total_seconds():8.3f} s")
+        if args.fail_on_dead and diff.newly_dead:
+            sys.exit(1)
         return
 
-    print("✅ Android project detected. Proceeding with UI analysis.")
+    options = dict(entry_keywords=args.entry or ENTRY_KEYWORDS, jobs=args.jobs, cache=cache,
+                   rebuild_index=args.rebuild_index, threads=args.threads, timings=timings,
+                   scripts=not args.no_scripts, instrumentation=instrumentation)
+    if getattr(args, 'partition_dir', None):
+        pipeline = PartitionedUIPipeline(args.project_root, args.partition_dir, **options)
+    else:
+        pipeline = UIPipeline(args.project_root, **options)
+
+    if args.graph and args.command != 'scan':
+        from parsers.graph_snapshot import load_graph
+        with timings.stage('load'):
+            pipeline.use_graph(load_graph(args.graph))
+    elif args.command != 'scan' and not args.any_platform:
+        with timings.stage('platform'):
+            platform = detect_platform(args.project_root)
+        if not platform.is_android:
+            target = f" (active target: {platform.target})" if platform.target else ""
+            print(f"❌ Not an Android-targeted Unity project{target}. Skipping analysis.")
+            return
+        print(f"🤖 Android project ({platform.evidence})")
+
+    if args.command == 'scan':
+        model = pipeline.scan()
+        objects = sum(len(unity_file.objects) for unity_file in model.files.values())
+        print(f"📂 {len(model.files)} files, {objects} objects")
+
+    if args.command in ('graph', 'all'):
+        graph = pipeline.build_graph()
+        print(f"🕸  {graph.number_of_nodes()} nodes, {graph.number_of_edges()} edges")
+        if isinstance(pipeline, PartitionedUIPipeline):
+            print(f"🧩 {graph.number_of_partitions()} partitions in {pipeline.partition_dir}, "
+                  f"{graph.boundary_count} boundary edges")
+        if args.snapshot or args.export:
+            from parsers.graph_snapshot import save_snapshot, export_graph
+            with timings.stage('save'):
+                if args.snapshot:
+                    save_snapshot(graph, args.snapshot)
+                if args.export:
+                    export_graph(graph.to_networkx(), args.snapshot_stem, args.export)
+
+    if args.command in ('reach', 'report', 'render', 'all'):
+        reachable, dead = pipeline.reach_counts()
+        print(f"✅ {reachable} reachable, {dead} dead UI nodes")
+
+    if args.command in ('report', 'all'):
+        pipeline.report(args.output, args.report_format)
+
+    if args.command in ('render', 'all'):
+        pipeline.render(args.image)
+
+    print(f"⏱  total    {timings.total_seconds():8.3f} s")
+
+
+def build_parser():
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('--project-root', default=DEFAULT_PROJECT_ROOT, help="Unity project to analyze")
+    common.add_argument('--entry', action='append', metavar='PATTERN',
+                        help=f"Substring marking entry nodes; repeatable (default: {', '.join(ENTRY_KEYWORDS)})")
+    common.add_argument('--graph', metavar='PATH',
+                        help="Start from a saved graph (.uigraph/.gexf/.graphml) instead of scanning")
+    common.add_argument('--jobs', type=int, default=1, help="Number of worker processes used for parsing")
+    common.add_argument('--threads', type=int, default=4, help="Threads listing directories during discovery")
+    common.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR, help="Directory of the persistent parse cache")
+    common.add_argument('--no-cache', action='store_true', help="Reparse every file")
+    common.add_argument('--hash', action='store_true', help="Also compare content hashes when mtime/size changed")
+    common.add_argument('--rebuild-index', action='store_true', help="Rebuild the .meta script GUID index")
+    common.add_argument('--no-scripts', action='store_true',
+                        help="Do not scan C# scripts for scene loads, SetActive calls and event channels")
+    common.add_argument('--any-platform', action='store_true', help="Skip the Android project check")
+    common.add_argument('--output', default=DEFAULT_REPORT, help="Dead UI report path")
+    common.add_argument('--report-format', choices=REPORT_FORMATS,
+                        help="Report format (default: from the --output extension, else csv)")
+    common.add_argument('--image', default=DEFAULT_IMAGE, help="Rendered graph path")
+    common.add_argument('--snapshot', help="Save the graph as a binary snapshot here")
+    common.add_argument('--trace', metavar='PATH', help="Write stage, counter and per-file statistics as JSON")
+    common.add_argument('--profile', metavar='PATH',
+                        help="cProfile this process and save the stats (parse workers of --jobs > 1 are not included)")
+    common.add_argument('--trace-memory', action='store_true', help="Also record tracemalloc peaks per stage")
+    common.add_argument('--top', type=int, metavar='N',
+                        help=f"Print the N slowest and largest files at the end (default {DEFAULT_TOP} "
+                             f"with --trace or --profile)")
+    common.add_argument('--export', nargs='+', choices=['gexf', 'graphml'],
+                        help="Also export the graph for Gephi, next to the snapshot")
+
+    parser = argparse.ArgumentParser(description="Find dead UI in a Unity project.")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    for command, help_text in COMMANDS.items():
+        subparsers.add_parser(command, parents=[common], help=help_text, description=help_text)
+    batch = subparsers.choices['batch']
+    batch.add_argument('projects', nargs='+', metavar='ROOT', help="Project roots or glob patterns of them")
+    batch.add_argument('--output-dir', default=DEFAULT_BATCH_DIR,
+                       help="Per-project reports and summary.csv go here")
+    diff = subparsers.choices['diff']
+    diff.add_argument('base', help="Base revision (branch, tag or commit)")
+    diff.add_argument('head', nargs='?', default='HEAD', help="Head revision (default: HEAD)")
+    diff.add_argument('--fail-on-dead', action='store_true', help="Exit with status 1 if any UI node became dead")
+    diff.set_defaults(output=DEFAULT_DIFF_REPORT)
+    for command in ('graph', 'reach', 'report'):
+        subparsers.choices[command].add_argument(
+            '--partition-dir', nargs='?', const=DEFAULT_PARTITION_DIR, metavar='DIR',
+            help=f"Build the graph out of core, one partition per scene or prefab spilled to DIR "
+                 f"(default {DEFAULT_PARTITION_DIR}); C# scripts are not linked")
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if getattr(args, 'partition_dir', None) and (args.graph or args.snapshot or args.export):
+        parser.error("--partition-dir builds partitions instead of a single graph; "
+                     "it cannot be combined with --graph, --snapshot or --export")
+    if args.command == 'graph' and not args.snapshot and not args.export and not getattr(args, 'partition_dir', None):
+        args.snapshot = DEFAULT_SNAPSHOT
+    args.snapshot_stem = (args.snapshot or DEFAULT_SNAPSHOT).rsplit('.', 1)[0]
 
-    print("📊 Running reachability analysis...")
-    reachable_nodes, dead_nodes = analyze_ui_reachability(gexf_path)
+    timings = StageTimings(trace_memory=args.trace_memory)
+    instrumentation = None
+    if args.trace or args.profile or args.top:
+        instrumentation = Instrumentation(timings, profile=bool(args.profile))
 
-    print(f"✅ Analysis complete: {len(dead_nodes)} dead UI elements found.")
+    if args.no_cache or args.graph:
+        run(args, timings=timings, instrumentation=instrumentation)
+    else:
+        with ParseCache(args.cache_dir, hash_contents=args.hash) as cache:
+            run(args, cache, timings, instrumentation)
 
-    print("📝 Writing report...")
-    generate_dead_ui_report(reachable_nodes, dead_nodes, output_csv)
-    print(f"✅ Report saved to {output_csv}")
+    if instrumentation is not None:
+        instrumentation.report(args.top or DEFAULT_TOP)
+        if args.profile:
+            instrumentation.save_profile(args.profile)
+        if args.trace:
+            instrumentation.write_trace(args.trace, args.profile)
 
 
 if __name__ == '__main__':
@@ -1,37 +1,131 @@
 import os
+import re
+from collections import namedtuple
+from functools import lru_cache
 
-def is_android_project(project_root):
+# UnityEditor.BuildTarget values as serialized in the settings files
+BUILD_TARGETS = {
+    2: 'StandaloneOSX', 5: 'StandaloneWindows', 9: 'iOS', 13: 'Android', 19: 'StandaloneWindows64',
+    20: 'WebGL', 21: 'WSAPlayer', 24: 'StandaloneLinux64', 31: 'PS4', 33: 'XboxOne', 37: 'tvOS',
+    38: 'Switch', 42: 'GameCoreXboxSeries', 43: 'GameCoreXboxOne', 44: 'PS5',
+}
+ANDROID = 'Android'
+
+# Keys naming the active build target; the settings file scan stops at the first one
+ACTIVE_TARGET_KEYS = (b'm_ActiveBuildTarget', b'selectedBuildTarget')
+SETTINGS_LINE_PATTERN = re.compile(rb'^( *)(- )?([A-Za-z_][\w]*):[ \t]*(.*?)\s*$')
+
+PlatformInfo = namedtuple('PlatformInfo', ['is_android', 'target', 'evidence'])
+PlatformInfo.__doc__ = """
+is_android: whether the project builds for Android
+target: the active build target name if the settings record one, else None
+evidence: the indicator that decided, e.g. 'Assets/Plugins/Android' or 'ProjectSettings.asset: applicationIdentifier.Android'
+"""
+
+
+def _target_name(value):
+    value = value.strip()
+    if value.isdigit():
+        return BUILD_TARGETS.get(int(value), value)
+    return value or None
+
+
+def _scan_settings(path, android_blocks):
     """
-    Checks whether the Unity project targets Android by scanning for:
-    - Android-specific plugin folders
-    - AndroidManifest.xml
-    - Gradle-related files
-    - Android platform metadata in ProjectSettings
+    Stream a text-serialized settings file line by line, looking only at the keys that
+    matter. Returns (active target or None, Android evidence or None) and stops as soon
+    as Android evidence is found. Binary-serialized files are skipped.
     """
-    indicators = []
+    target = None
+    block = None  # top-level PlayerSettings key whose entries are being read
+    with open(path, 'rb') as f:
+        for line in f:
+            if b'\0' in line:
+                return None, None
+            match = SETTINGS_LINE_PATTERN.match(line)
+            if match is None:
+                continue
+            indent, item, key, value = len(match.group(1)), match.group(2), match.group(3), match.group(4)
+            if indent <= 2 and not item:
+                block = key
+            if key in ACTIVE_TARGET_KEYS and value:
+                target = _target_name(value.decode('utf-8', 'replace'))
+                if target == ANDROID:
+                    return target, f"{os.path.basename(path)}: {key.decode()}"
+                continue
+            evidence = android_blocks(block, key, value, item)
+            if evidence:
+                return target, f"{os.path.basename(path)}: {evidence}"
+    return target, None
+
+
+def _player_settings_android(block, key, value, item):
+    """
+    PlayerSettings entries that only exist once someone configured an Android build.
+    Unity writes defaults such as AndroidMinSdkVersion or the Android rows of
+    m_BuildTargetGraphicsAPIs into every project, so those are deliberately ignored.
+    """
+    if block == b'applicationIdentifier' and key == b'Android' and value:
+        return 'applicationIdentifier.Android'
+    if block == b'm_BuildTargetIcons' and key == b'm_BuildTarget' and value == b'Android':
+        return 'm_BuildTargetIcons.Android'
+    if key == b'AndroidKeystoreName' and value not in (b'', b"''", b'""'):
+        return 'AndroidKeystoreName'
+    if key == b'androidUseCustomKeystore' and value == b'1':
+        return 'androidUseCustomKeystore'
+    return None
 
-    # Plugins/Android folder
-    plugins_android = os.path.join(project_root, 'Assets', 'Plugins', 'Android')
-    indicators.append(os.path.exists(plugins_android))
 
-    # AndroidManifest.xml in Plugins/Android
-    manifest = os.path.join(plugins_android, 'AndroidManifest.xml')
-    indicators.append(os.path.exists(manifest))
+def _no_android_blocks(block, key, value, item):
+    return None
 
-    # Gradle build files (Unity export path)
-    gradle_project_path = os.path.join(project_root, 'Temp', 'gradleOut')
-    gradle_build = os.path.join(gradle_project_path, 'build.gradle')
-    indicators.append(os.path.exists(gradle_build))
 
-    # Android platform setting in ProjectSettings.asset
-    settings_file = os.path.join(project_root, 'ProjectSettings', 'ProjectSettings.asset')
-    if os.path.exists(settings_file):
+@lru_cache(maxsize=None)
+def _detect(project_root):
+    # Cheapest first: single stat() calls for Android-only folders and build output
+    plugins_android = os.path.join(project_root, 'Assets', 'Plugins', 'Android')
+    for path in (plugins_android, os.path.join(project_root, 'Temp', 'gradleOut', 'build.gradle')):
+        if os.path.exists(path):
+            return PlatformInfo(True, None, os.path.relpath(path, project_root))
+
+    # Small editor-state file holding the active target (only when text-serialized)
+    target = None
+    user_settings = os.path.join(project_root, 'Library', 'EditorUserBuildSettings.asset')
+    if os.path.exists(user_settings):
+        try:
+            target, evidence = _scan_settings(user_settings, _no_android_blocks)
+        except OSError as e:
+            print(f"⚠️ Could not read EditorUserBuildSettings.asset: {e}")
+        else:
+            if evidence:
+                return PlatformInfo(True, target, evidence)
+
+    player_settings = os.path.join(project_root, 'ProjectSettings', 'ProjectSettings.asset')
+    if os.path.exists(player_settings):
         try:
-            with open(settings_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-                if 'Android' in content or 'defaultPlatform: Android' in content:
-                    indicators.append(True)
-        except Exception as e:
+            settings_target, evidence = _scan_settings(player_settings, _player_settings_android)
+        except OSError as e:
             print(f"⚠️ Could not read ProjectSettings.asset: {e}")
+        else:
+            target = target or settings_target
+            if evidence:
+                return PlatformInfo(True, target, evidence)
+    return PlatformInfo(False, target, None)
+
+
+def detect_platform(project_root):
+    """
+    PlatformInfo for a Unity project, checking the cheapest indicators first and
+    returning at the first one that shows an Android target. Results are cached per
+    project root for the life of the process; call detect_platform.cache_clear() after
+    changing a project's settings.
+    """
+    return _detect(os.path.abspath(project_root))
+
 
-    return any(indicators)
+detect_platform.cache_clear = _detect.cache_clear
+
+
+def is_android_project(project_root):
+    """Whether the Unity project targets Android; see detect_platform()."""
+    return detect_platform(project_root).is_android
@@ -0,0 +1,185 @@
+# parsers/asset_discovery.py
+
+import os
+import re
+import json
+import fnmatch
+import argparse
+from collections import namedtuple
+from itertools import repeat
+from concurrent.futures import ThreadPoolExecutor
+
+UNITY_ASSET_PATTERNS = ('*.prefab', '*.unity')
+
+# Editor caches, build output and VCS metadata at the project root: often far more files
+# than Assets/ itself. Folders with these names deeper in the tree are ordinary assets.
+PRUNED_DIRS = {'Library', 'Temp', 'Logs', 'obj', 'Build', 'Builds', 'PackageCache', 'UserSettings',
+               '.git', '.vs', '.idea'}
+
+AssetEntry = namedtuple('AssetEntry', ['path', 'size', 'mtime_ns'])
+
+
+class GlobSet:
+    """
+    A set of globs compiled into at most two regular expressions. Patterns containing
+    '/' are matched against the root-relative path, the others against the file name.
+    """
+
+    def __init__(self, patterns):
+        name_patterns = [p for p in patterns if '/' not in p]
+        path_patterns = [p for p in patterns if '/' in p]
+        self.name_regex = re.compile('|'.join(map(fnmatch.translate, name_patterns))) if name_patterns else None
+        self.path_regex = re.compile('|'.join(map(fnmatch.translate, path_patterns))) if path_patterns else None
+
+    def __bool__(self):
+        return self.name_regex is not None or self.path_regex is not None
+
+    def match(self, name, rel_dir):
+        if self.name_regex is not None and self.name_regex.match(name):
+            return True
+        if self.path_regex is not None:
+            return self.path_regex.match(f"{rel_dir}/{name}" if rel_dir else name) is not None
+        return False
+
+
+def _is_pruned(name, rel_dir, pruned_dirs, exclude):
+    # Unity itself never imports hidden folders or folders ending in '~' (e.g. "Samples~"), at any depth
+    return (not rel_dir and name in pruned_dirs) or name.startswith('.') or name.endswith('~') or \
+        (exclude and exclude.match(name, rel_dir))
+
+
+class AssetManifest:
+    """
+    (path, size, mtime_ns) of every discovered asset, sorted by path. Later stages take
+    paths from here, and parse_cache.ParseCache can take the stats instead of calling
+    os.stat() on every file again.
+    """
+
+    def __init__(self, root, entries):
+        self.root = root
+        self.entries = entries
+        self._by_path = None
+
+    def paths(self):
+        return [entry.path for entry in self.entries]
+
+    def get(self, path):
+        if self._by_path is None:
+            self._by_path = {entry.path: entry for entry in self.entries}
+        return self._by_path.get(path)
+
+    def total_bytes(self):
+        return sum(entry.size for entry in self.entries)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def save(self, manifest_path):
+        os.makedirs(os.path.dirname(manifest_path) or '.', exist_ok=True)
+        with open(manifest_path, 'w', encoding='utf-8') as f:
+            json.dump({'root': self.root, 'entries': [list(entry) for entry in self.entries]}, f)
+
+    @classmethod
+    def load(cls, manifest_path):
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return cls(data['root'], [AssetEntry(*entry) for entry in data['entries']])
+
+
+def _scan_directory(directory, rel_dir, include, exclude, pruned_dirs):
+    """List one directory: matching files with their stats, and the subdirectories to descend into."""
+    files, subdirs = [], []
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                name = entry.name
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not _is_pruned(name, rel_dir, pruned_dirs, exclude):
+                            subdirs.append((entry.path, f"{rel_dir}/{name}" if rel_dir else name))
+                    elif include.match(name, rel_dir) and not (exclude and exclude.match(name, rel_dir)):
+                        stat = entry.stat()
+                        files.append(AssetEntry(entry.path, stat.st_size, stat.st_mtime_ns))
+                except OSError:
+                    continue  # vanished or unreadable entry, like os.walk
+    except OSError:
+        pass
+    return files, subdirs
+
+
+def discover_assets(root, include=UNITY_ASSET_PATTERNS, exclude=(), pruned_dirs=PRUNED_DIRS, threads=1):
+    """
+    Walk root with os.scandir and return an AssetManifest of the files matching an
+    include glob and no exclude glob. Top-level directories in pruned_dirs, hidden
+    directories and directories matching an exclude glob are never entered. With
+    threads > 1 every level of the tree is listed by a thread pool, so independent
+    subtrees are scanned concurrently; the manifest is the same either way.
+    """
+    include, exclude = GlobSet(include), GlobSet(exclude)
+    entries = []
+    frontier = [(root, '')]
+    executor = ThreadPoolExecutor(max_workers=threads) if threads and threads > 1 else None
+    try:
+        while frontier:
+            arguments = ([d for d, _ in frontier], [r for _, r in frontier],
+                         repeat(include), repeat(exclude), repeat(pruned_dirs))
+            listings = (executor.map if executor else map)(_scan_directory, *arguments)
+            frontier = []
+            for files, subdirs in listings:
+                entries.extend(files)
+                frontier.extend(subdirs)
+    finally:
+        if executor:
+            executor.shutdown()
+    entries.sort()
+    return AssetManifest(root, entries)
+
+
+def select_paths(rel_paths, include=UNITY_ASSET_PATTERNS, exclude=(), pruned_dirs=PRUNED_DIRS):
+    """
+    The '/'-separated root-relative paths that discover_assets() would list, for file
+    listings that do not come from the file system, such as a git tree.
+    """
+    include, exclude = GlobSet(include), GlobSet(exclude)
+    pruned = {}  # rel_dir -> whether it or a parent is pruned
+    selected = []
+    for rel_path in rel_paths:
+        rel_dir, _, name = rel_path.rpartition('/')
+        if _is_pruned_dir(rel_dir, pruned, pruned_dirs, exclude):
+            continue
+        if include.match(name, rel_dir) and not (exclude and exclude.match(name, rel_dir)):
+            selected.append(rel_path)
+    return selected
+
+
+def _is_pruned_dir(rel_dir, pruned, pruned_dirs, exclude):
+    if not rel_dir:
+        return False
+    result = pruned.get(rel_dir)
+    if result is None:
+        parent, _, name = rel_dir.rpartition('/')
+        result = pruned[rel_dir] = _is_pruned_dir(parent, pruned, pruned_dirs, exclude) or \
+            _is_pruned(name, parent, pruned_dirs, exclude)
+    return result
+
+
+def find_unity_files(root_folder, threads=1):
+    """Paths of every .prefab and .unity file under root_folder, skipping editor caches."""
+    return discover_assets(root_folder, threads=threads).paths()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="List the assets of a Unity project and write a manifest.")
+    parser.add_argument('project_path', nargs='?', default="datasets/open-project-1-main/")
+    parser.add_argument('--include', nargs='+', default=list(UNITY_ASSET_PATTERNS), help="File globs to list")
+    parser.add_argument('--exclude', nargs='+', default=[], help="File or directory globs to skip")
+    parser.add_argument('--threads', type=int, default=8, help="Threads listing directories")
+    parser.add_argument('--manifest', default='outputs/.cache/asset_manifest.json', help="Manifest output path")
+    args = parser.parse_args()
+
+    manifest = discover_assets(args.project_path, args.include, args.exclude, threads=args.threads)
+    manifest.save(args.manifest)
+    print(f"✅ {len(manifest)} assets ({manifest.total_bytes() / (1 << 20):.1f} MB) listed in {args.manifest}")
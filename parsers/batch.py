@@ -0,0 +1,160 @@
+# parsers/batch.py
+
+import os
+import csv
+import glob
+from concurrent.futures import ThreadPoolExecutor
+from parsers.android_filter import detect_platform
+from parsers.asset_discovery import AssetManifest, discover_assets
+from parsers.unity_model import UnityProjectModel
+from parsers.script_index import load_script_index
+from parsers.script_scanner import find_scripts, scan_script
+from parsers.parallel_parse import map_files
+from parsers.ui_reachability_analyzer import ENTRY_KEYWORDS
+from parsers.pipeline import UIPipeline, StageTimings
+
+DEFAULT_BATCH_DIR = 'outputs/batch'
+REPORT_FILE_STEM = 'dead_ui_report'
+SUMMARY_FILE_NAME = 'summary.csv'
+SUMMARY_FIELDS = ['project', 'root', 'status', 'target', 'evidence', 'files', 'nodes', 'edges',
+                  'reachable', 'dead', 'dead_ratio', 'seconds', 'report']
+
+
+def expand_project_roots(patterns):
+    """Directories named by paths or glob patterns, in the order given, without duplicates."""
+    roots, seen = [], set()
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern)) if glob.has_magic(pattern) else [pattern]
+        for path in matches:
+            key = os.path.abspath(path)
+            if os.path.isdir(path) and key not in seen:
+                seen.add(key)
+                roots.append(path)
+    return roots
+
+
+def _project_names(roots):
+    """A distinct output directory name per root: its base name, numbered on collisions."""
+    names, used = [], {}
+    for root in roots:
+        name = os.path.basename(os.path.normpath(os.path.abspath(root))) or 'project'
+        used[name] = used.get(name, 0) + 1
+        names.append(name if used[name] == 1 else f"{name}-{used[name]}")
+    return names
+
+
+class BatchProject:
+    """One project of a batch run: where it lives, where its outputs go, and its summary row."""
+
+    def __init__(self, root, name, output_dir, report_format=None):
+        self.root = root
+        self.name = name
+        self.output_dir = output_dir
+        self.report_format = report_format or 'csv'
+        self.platform = None
+        self.manifest = None
+        self.pipeline = None
+        self.row = {'project': name, 'root': root}
+
+    @property
+    def report_path(self):
+        return os.path.join(self.output_dir, f"{REPORT_FILE_STEM}.{self.report_format}")
+
+
+def run_batch(patterns, output_dir=DEFAULT_BATCH_DIR, entry_keywords=ENTRY_KEYWORDS, jobs=1, cache=None,
+              threads=4, any_platform=False, rebuild_index=False, report_format=None, scripts=True,
+              timings=None, instrumentation=None):
+    """
+    Dead UI analysis of many projects at once. Every Android project's scenes and prefabs
+    go through one parse over a single shared process pool, so small projects do not
+    leave workers idle between them; graphs, reachability and reports are then done per
+    project from the shared results. Writes <output_dir>/<project>/dead_ui_report.csv
+    (.jsonl/.parquet/.arrow with another report_format) for each project and
+    <output_dir>/summary.csv with one row per root, skipped ones included. Returns the
+    summary rows.
+    """
+    timings = timings if timings is not None else StageTimings()
+    roots = expand_project_roots(patterns)
+    projects = [BatchProject(root, name, os.path.join(output_dir, name), report_format)
+                for root, name in zip(roots, _project_names(roots))]
+    print(f"📚 {len(projects)} project roots")
+
+    with timings.stage('platform'):
+        for project in projects:
+            project.platform = detect_platform(project.root)
+            project.row.update(target=project.platform.target, evidence=project.platform.evidence)
+    selected = []
+    for project in projects:
+        if any_platform or project.platform.is_android:
+            selected.append(project)
+        else:
+            project.row['status'] = 'skipped: not Android'
+
+    with timings.stage('discover'):
+        with ThreadPoolExecutor(max_workers=max(1, threads)) as executor:
+            manifests = executor.map(discover_assets, [project.root for project in selected])
+            for project, manifest in zip(selected, manifests):
+                project.manifest = manifest
+        entries = sorted(entry for project in selected for entry in project.manifest)
+        if cache is not None:
+            cache.use_manifest(AssetManifest(None, entries))
+
+    with timings.stage('parse'):
+        shared = UnityProjectModel().parse_all([entry.path for entry in entries], jobs, cache)
+    if instrumentation is not None:
+        for project in selected:
+            instrumentation.record_discovery(project.manifest)
+        instrumentation.record_parse([shared.files[entry.path] for entry in entries], cache)
+
+    script_paths = {project.root: [] for project in selected}
+    with timings.stage('scripts'):
+        if scripts:
+            with ThreadPoolExecutor(max_workers=max(1, threads)) as executor:
+                script_paths = dict(zip(script_paths, executor.map(find_scripts, script_paths)))
+        scanned = map_files(scan_script, [path for paths in script_paths.values() for path in paths], jobs,
+                            cache=cache)
+    script_files = {script.path: script for script in scanned}
+    if instrumentation is not None:
+        instrumentation.count('scripts', len(script_files))
+
+    project_timings = StageTimings(verbose=False)
+    for project in selected:
+        start = project_timings.total_seconds()
+        files = project.manifest.paths()
+        model = UnityProjectModel()
+        model.files = {path: shared.files[path] for path in files}
+        pipeline = project.pipeline = UIPipeline(project.root, entry_keywords=entry_keywords,
+                                                 threads=threads, timings=project_timings,
+                                                 instrumentation=instrumentation)
+        script_index = load_script_index(project.root, os.path.join(project.output_dir, 'script_index.json'),
+                                         rebuild=rebuild_index)
+        pipeline.use_model(project.manifest, model, script_index,
+                           [script_files[path] for path in script_paths[project.root]])
+        os.makedirs(project.output_dir, exist_ok=True)
+        with timings.stage(f"project {project.name}"):
+            pipeline.report(project.report_path, project.report_format)
+        graph = pipeline.graph
+        reachable, dead = len(pipeline.reachable_ids), len(pipeline.dead_ids)
+        project.row.update(status='analyzed', files=len(files), nodes=graph.number_of_nodes(),
+                           edges=graph.number_of_edges(), reachable=reachable, dead=dead,
+                           dead_ratio=round(dead / (reachable + dead), 4) if reachable + dead else 0.0,
+                           seconds=round(project_timings.total_seconds() - start, 3),
+                           report=project.report_path)
+
+    rows = [project.row for project in projects]
+    write_batch_summary(rows, os.path.join(output_dir, SUMMARY_FILE_NAME))
+    return rows
+
+
+def write_batch_summary(rows, summary_path):
+    os.makedirs(os.path.dirname(summary_path) or '.', exist_ok=True)
+    with open(summary_path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=SUMMARY_FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+
+    analyzed = [row for row in rows if row.get('status') == 'analyzed']
+    dead = sum(row['dead'] for row in analyzed)
+    total = dead + sum(row['reachable'] for row in analyzed)
+    print(f"✅ {len(analyzed)}/{len(rows)} projects analyzed, {dead} of {total} UI nodes dead. "
+          f"Summary written to: {summary_path}")
@@ -0,0 +1,252 @@
+# parsers/compact_graph.py
+
+from array import array
+from parsers.ui_reachability_analyzer import ENTRY_KEYWORDS, multi_source_bfs, bfs_tree
+
+NODE_SEPARATOR = '::'
+NO_STRING = -1
+NO_FILE_ID = 0  # Unity never assigns fileID 0 to an object
+METHOD_KIND = 'method'
+
+
+class StringTable:
+    """Interns strings so every distinct file or object name is stored once."""
+
+    def __init__(self, strings=()):
+        self.strings = list(strings)
+        self._ids = dict(zip(self.strings, range(len(self.strings))))
+
+    def intern(self, value):
+        string_id = self._ids.get(value)
+        if string_id is None:
+            string_id = len(self.strings)
+            self._ids[value] = string_id
+            self.strings.append(value)
+        return string_id
+
+    def lookup(self, value):
+        return self._ids.get(value, NO_STRING)
+
+    def __getitem__(self, string_id):
+        return self.strings[string_id]
+
+    def __len__(self):
+        return len(self.strings)
+
+
+class CompactGraph:
+    """
+    Directed graph whose nodes are int32 ids. A node is a (file, name) pair of interned
+    strings, written "file::name" when exported; edges are two parallel int32 arrays.
+    Each node also carries optional details: its source asset path and component type
+    (interned, NO_STRING when unknown) and the Unity fileID it came from (NO_FILE_ID).
+    Convert with to_networkx() only for export or drawing.
+    """
+
+    def __init__(self):
+        self.strings = StringTable()
+        self.node_file = array('i')
+        self.node_name = array('i')
+        self.node_path = array('i')
+        self.node_kind = array('i')
+        self.node_file_id = array('q')
+        self.edge_src = array('i')
+        self.edge_dst = array('i')
+        self._node_ids = {}
+        self._edge_keys = set()
+        self._csr = None
+
+    @classmethod
+    def from_arrays(cls, strings, node_file, node_name, edge_src, edge_dst, csr=None, details=None):
+        """
+        Wrap already-built arrays (e.g. from graph_snapshot) without re-adding nodes one
+        by one. details is (node_path, node_kind, node_file_id); without it every node's
+        details are unknown. The label and edge lookup tables are only rebuilt if the
+        graph is looked up by label or extended.
+        """
+        graph = cls()
+        graph.strings = strings
+        graph.node_file, graph.node_name = node_file, node_name
+        if details is None:
+            n = len(node_name)
+            details = (array('i', [NO_STRING]) * n, array('i', [NO_STRING]) * n, array('q', [NO_FILE_ID]) * n)
+        graph.node_path, graph.node_kind, graph.node_file_id = details
+        graph.edge_src, graph.edge_dst = edge_src, edge_dst
+        graph._node_ids = None
+        graph._edge_keys = None
+        graph._csr = csr
+        return graph
+
+    def _node_index(self):
+        if self._node_ids is None:
+            self._node_ids = {(file_sid << 32) | name_sid: node_id
+                              for node_id, (file_sid, name_sid) in enumerate(zip(self.node_file, self.node_name))}
+        return self._node_ids
+
+    def _edge_index(self):
+        if self._edge_keys is None:
+            self._edge_keys = {(src << 32) | dst for src, dst in zip(self.edge_src, self.edge_dst)}
+        return self._edge_keys
+
+    # --- Building ---
+
+    def add_node(self, file_label, name):
+        file_sid = self.strings.intern(file_label) if file_label is not None else NO_STRING
+        name_sid = self.strings.intern(name)
+        key = (file_sid << 32) | name_sid
+        node_ids = self._node_index()
+        node_id = node_ids.get(key)
+        if node_id is None:
+            node_id = len(self.node_name)
+            node_ids[key] = node_id
+            self.node_file.append(file_sid)
+            self.node_name.append(name_sid)
+            self.node_path.append(NO_STRING)
+            self.node_kind.append(NO_STRING)
+            self.node_file_id.append(NO_FILE_ID)
+            self._csr = None
+        return node_id
+
+    def set_details(self, node_id, path=None, kind=None, file_id=None):
+        """Record a node's source path, component type and fileID; the first value recorded wins."""
+        if path is not None and self.node_path[node_id] == NO_STRING:
+            self.node_path[node_id] = self.strings.intern(path)
+        if kind is not None and self.node_kind[node_id] == NO_STRING:
+            self.node_kind[node_id] = self.strings.intern(kind)
+        if file_id and self.node_file_id[node_id] == NO_FILE_ID:
+            self.node_file_id[node_id] = file_id
+
+    def add_label(self, label):
+        """Add a node from its exported "file::name" form."""
+        file_label, separator, name = label.partition(NODE_SEPARATOR)
+        if not separator:
+            return self.add_node(None, label)
+        return self.add_node(file_label, name)
+
+    def add_edge(self, src, dst):
+        key = (src << 32) | dst
+        edge_keys = self._edge_index()
+        if key not in edge_keys:
+            edge_keys.add(key)
+            self.edge_src.append(src)
+            self.edge_dst.append(dst)
+            self._csr = None
+
+    def add_parse_result(self, nodes, edges, details=()):
+        """
+        Merge the (nodes, edges) label lists returned by a parser. details, if given, has
+        a (path, kind, file_id) tuple per entry of nodes, and edge targets without a
+        file part are then recorded as handler methods.
+        """
+        for label, node_details in zip(nodes, details):
+            self.set_details(self.add_label(label), *node_details)
+        for label in nodes[len(details):]:
+            self.add_label(label)
+        for edge in edges:
+            target = self.add_label(edge[1])
+            if details and self.node_file[target] == NO_STRING:
+                self.set_details(target, kind=METHOD_KIND)
+            self.add_edge(self.add_label(edge[0]), target)
+
+    def drop_lookups(self):
+        """
+        Free the label and edge lookup tables, one Python object per node and per edge,
+        once the graph is built. They are rebuilt on demand if the graph is later looked
+        up by label or extended.
+        """
+        self._node_ids = None
+        self._edge_keys = None
+        return self
+
+    # --- Queries ---
+
+    def number_of_nodes(self):
+        return len(self.node_name)
+
+    def number_of_edges(self):
+        return len(self.edge_src)
+
+    def node_id(self, label):
+        """Return the id of the node with the given "file::name" label, or None."""
+        file_label, separator, name = label.partition(NODE_SEPARATOR)
+        if not separator:
+            file_sid, name_sid = NO_STRING, self.strings.lookup(label)
+        else:
+            file_sid, name_sid = self.strings.lookup(file_label), self.strings.lookup(name)
+            if file_sid == NO_STRING:
+                return None
+        if name_sid == NO_STRING:
+            return None
+        return self._node_index().get((file_sid << 32) | name_sid)
+
+    def node_label(self, node_id):
+        file_sid = self.node_file[node_id]
+        name = self.strings[self.node_name[node_id]]
+        if file_sid == NO_STRING:
+            return name
+        return f"{self.strings[file_sid]}{NODE_SEPARATOR}{name}"
+
+    def node_details(self, node_id):
+        """(source path, component type, fileID) of a node, each None when unknown."""
+        path_sid, kind_sid = self.node_path[node_id], self.node_kind[node_id]
+        return (self.strings[path_sid] if path_sid != NO_STRING else None,
+                self.strings[kind_sid] if kind_sid != NO_STRING else None,
+                self.node_file_id[node_id] or None)
+
+    def csr(self):
+        """Return (offsets, targets) int32 CSR arrays, rebuilt only after mutation."""
+        if self._csr is None:
+            n = self.number_of_nodes()
+            degree = [0] * (n + 1)
+            for src in self.edge_src:
+                degree[src + 1] += 1
+            for i in range(n):
+                degree[i + 1] += degree[i]
+            offsets = array('i', degree)
+            targets = array('i', bytes(4 * len(self.edge_src)))
+            cursor = list(degree[:n])
+            for src, dst in zip(self.edge_src, self.edge_dst):
+                targets[cursor[src]] = dst
+                cursor[src] += 1
+            self._csr = (offsets, targets)
+        return self._csr
+
+    def entry_node_ids(self, keywords=ENTRY_KEYWORDS):
+        """Ids of nodes whose label contains an entry keyword, matching each string once."""
+        matches = bytearray(any(keyword in s for keyword in keywords) for s in self.strings.strings)
+        return [
+            node_id for node_id, (file_sid, name_sid) in enumerate(zip(self.node_file, self.node_name))
+            if matches[name_sid] or (file_sid != NO_STRING and matches[file_sid])
+        ]
+
+    def reachability(self, entry_ids):
+        """Return (reachable_ids, dead_ids) from one multi-source BFS."""
+        offsets, targets = self.csr()
+        visited = multi_source_bfs(offsets, targets, entry_ids)
+        reachable = [i for i, seen in enumerate(visited) if seen]
+        dead = [i for i, seen in enumerate(visited) if not seen]
+        return reachable, dead
+
+    def reachability_tree(self, entry_ids):
+        """(parent, origin) int32 arrays of one BFS from entry_ids; see ui_reachability_analyzer.bfs_tree."""
+        offsets, targets = self.csr()
+        return bfs_tree(offsets, targets, entry_ids)
+
+    # --- Export ---
+
+    def to_networkx(self):
+        import networkx as nx
+        G = nx.DiGraph()
+        labels = [self.node_label(i) for i in range(self.number_of_nodes())]
+        G.add_nodes_from(labels)
+        G.add_edges_from((labels[src], labels[dst]) for src, dst in zip(self.edge_src, self.edge_dst))
+        return G
+
+    @classmethod
+    def from_networkx(cls, G):
+        graph = cls()
+        for label in G.nodes:
+            graph.add_label(label)
+        for u, v in G.edges:
+            graph.add_edge(graph.node_id(u), graph.node_id(v))
+        return graph
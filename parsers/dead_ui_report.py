@@ -1,30 +1,141 @@
 # parsers/dead_ui_report.py
 
 import csv
-from parsers.ui_reachability_analyzer import find_reachable_ui_nodes, find_dead_ui_nodes
+import json
+from parsers.ui_reachability_analyzer import ENTRY_KEYWORDS
 
-def generate_dead_ui_report(gexf_path, output_csv_path):
-    import networkx as nx
+REPORT_FIELDS = ['element', 'status', 'source_file', 'component_type', 'file_id', 'reached_from', 'dead_reason']
+REPORT_FORMATS = ('csv', 'jsonl', 'parquet', 'arrow')
+CHUNK_ROWS = 65536  # rows per record batch in columnar output
 
-    # Load the graph
-    G = nx.read_gexf(gexf_path)
+# Why a node is dead
+NO_ENTRY_NODES = 'no entry nodes'
+UNREFERENCED = 'not referenced by any node'
+DEAD_REFERRERS = 'referenced only by dead nodes'
 
-    # Identify entry points based on naming heuristics
-    entry_nodes = [n for n in G.nodes if 'Canvas' in n or 'MainMenu' in n or 'Persistent' in n]
 
-    # Compute reachable and dead nodes
-    reachable_nodes = find_reachable_ui_nodes(G, entry_nodes)
-    dead_nodes = find_dead_ui_nodes(G, entry_nodes)
+def report_format(output_path):
+    """Report format implied by the output file extension, CSV by default."""
+    extension = output_path.rsplit('.', 1)[-1].lower()
+    if extension in ('jsonl', 'ndjson'):
+        return 'jsonl'
+    if extension in ('parquet', 'arrow'):
+        return extension
+    return 'csv'
 
-    # Write report
-    with open(output_csv_path, 'w', newline='') as csvfile:
-        writer = csv.writer(csvfile)
-        writer.writerow(['UI Element', 'Status'])
 
-        for node in sorted(reachable_nodes):
-            writer.writerow([node, 'reachable'])
+def iter_report_rows(graph, origins):
+    """
+    One row per node of a compact_graph.CompactGraph, in node id order, as tuples in
+    REPORT_FIELDS order. origins is the origin array of a bfs_tree() from the entry
+    nodes: reachable rows name the entry they are reached from, dead rows say why
+    nothing reaches them. Rows are produced one at a time, nothing is sorted or copied.
+    """
+    has_referrer = bytearray(graph.number_of_nodes())
+    for dst in graph.edge_dst:
+        has_referrer[dst] = 1
+    no_entries = all(origin < 0 for origin in origins)
 
-        for node in sorted(dead_nodes):
-            writer.writerow([node, 'dead'])
+    label = graph.node_label
+    for node_id, origin in enumerate(origins):
+        source_file, component_type, file_id = graph.node_details(node_id)
+        if origin >= 0:
+            yield label(node_id), 'reachable', source_file, component_type, file_id, label(origin), None
+        else:
+            reason = NO_ENTRY_NODES if no_entries else DEAD_REFERRERS if has_referrer[node_id] else UNREFERENCED
+            yield label(node_id), 'dead', source_file, component_type, file_id, None, reason
 
-    print(f"✅ Dead UI report written to: {output_csv_path}")
+
+def _write_csv(rows, output_path, fields):
+    count = 0
+    with open(output_path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(fields)
+        for row in rows:
+            writer.writerow(row)
+            count += 1
+    return count
+
+
+def _write_jsonl(rows, output_path, fields):
+    count = 0
+    with open(output_path, 'w', encoding='utf-8') as f:
+        for row in rows:
+            f.write(json.dumps(dict(zip(fields, row)), ensure_ascii=False))
+            f.write('\n')
+            count += 1
+    return count
+
+
+def _write_columnar(rows, output_path, fmt, fields):
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError(f"{fmt} reports need pyarrow (pip install -r requirements-optional.txt)") from None
+
+    schema = pa.schema([(field, pa.int64() if field == 'file_id' else pa.string()) for field in fields])
+    if fmt == 'parquet':
+        writer = pq.ParquetWriter(output_path, schema)
+        write_batch = writer.write_batch
+    else:
+        sink = pa.OSFile(output_path, 'wb')
+        writer = pa.ipc.new_file(sink, schema)
+        write_batch = writer.write_batch
+
+    count = 0
+    try:
+        columns = [[] for _ in fields]
+        for row in rows:
+            for column, value in zip(columns, row):
+                column.append(value)
+            count += 1
+            if count % CHUNK_ROWS == 0:
+                write_batch(pa.record_batch(columns, schema=schema))
+                columns = [[] for _ in fields]
+        if columns[0]:
+            write_batch(pa.record_batch(columns, schema=schema))
+    finally:
+        writer.close()
+        if fmt == 'arrow':
+            sink.close()
+    return count
+
+
+def write_report_rows(rows, output_path, fmt=None, fields=REPORT_FIELDS):
+    """
+    Stream report rows (tuples in fields order) to output_path as CSV, JSON Lines,
+    Parquet or Arrow IPC. Returns the row count.
+    """
+    fmt = fmt or report_format(output_path)
+    if fmt == 'csv':
+        count = _write_csv(rows, output_path, fields)
+    elif fmt == 'jsonl':
+        count = _write_jsonl(rows, output_path, fields)
+    elif fmt in ('parquet', 'arrow'):
+        count = _write_columnar(rows, output_path, fmt, fields)
+    else:
+        raise ValueError(f"unknown report format {fmt!r}; expected one of {', '.join(REPORT_FORMATS)}")
+    print(f"✅ Dead UI report written to: {output_path} ({count} rows)")
+    return count
+
+
+def generate_dead_ui_report(graph_path, output_path, fmt=None, entry_keywords=ENTRY_KEYWORDS):
+    """
+    Report for a graph saved by an earlier stage: a .uigraph snapshot (fast path) or
+    a GEXF/GraphML export.
+    """
+    from parsers.graph_snapshot import load_graph
+
+    graph = load_graph(graph_path)
+    generate_compact_dead_ui_report(graph, output_path, fmt, graph.entry_node_ids(entry_keywords))
+
+
+def generate_compact_dead_ui_report(graph, output_path, fmt=None, entry_ids=None):
+    """
+    Same report for a compact_graph.CompactGraph, without building a networkx graph.
+    """
+    if entry_ids is None:
+        entry_ids = graph.entry_node_ids()
+    _, origins = graph.reachability_tree(entry_ids)
+    return write_report_rows(iter_report_rows(graph, origins), output_path, fmt)
@@ -3,66 +3,98 @@
 
 import os
 import re
-import networkx as nx
-import matplotlib.pyplot as plt
+import argparse
+from parsers.unity_model import UnityProjectModel, load_unity_file
+from parsers.asset_discovery import find_unity_files
+from parsers.parallel_parse import map_files
+from parsers.parse_cache import ParseCache, DEFAULT_CACHE_DIR
+from parsers.compact_graph import CompactGraph
+from parsers.script_index import load_script_index
+from parsers.graph_snapshot import save_snapshot, export_graph
 
 # --- Settings ---
-UI_COMPONENTS = ['Button', 'Toggle', 'Dropdown', 'Slider', 'Canvas', 'EventTrigger']
-INTERACTION_EVENTS = ['onClick', 'onValueChanged', 'onSelect', 'onDeselect']
-METHOD_CALL_PATTERN = re.compile(r"m_MethodName: (\w+)")
+METHOD_NAME_PATTERN = re.compile(r"^\w+")  # leading identifier of an m_MethodName value
 
 # --- Core Functions ---
 
-def find_unity_files(root_folder):
-    unity_files = []
-    for root, dirs, files in os.walk(root_folder):
-        for file in files:
-            if file.endswith('.prefab') or file.endswith('.unity'):
-                unity_files.append(os.path.join(root, file))
-    return unity_files
-
-
-def parse_ui_connections(file_path):
+def parse_ui_connections(file_path, model=None, script_index=None):
+    """
+    UI nodes and event edges of one scene or prefab as (nodes, edges, details): details
+    holds a (path, component type, fileID) tuple for each entry of nodes.
+    """
     nodes = []
     edges = []
-    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-        content = f.read()
-
-    raw_objects = content.split('--- !u!')
-
-    for obj in raw_objects:
-        component_found = None
-        for comp in UI_COMPONENTS:
-            if comp in obj:
-                match_name = re.search(r'm_Name: (.+)', obj)
-                if match_name:
-                    component_name = match_name.group(1).strip()
-                    full_name = f"{os.path.basename(file_path)}::{component_name}"
-                    nodes.append(full_name)
-                    component_found = full_name
-                    break  # Only one UI type per object
-
-        if component_found:
-            # Try to find event-based method connections
-            for interaction in INTERACTION_EVENTS:
-                if interaction in obj:
-                    method_matches = METHOD_CALL_PATTERN.findall(obj)
-                    for method in method_matches:
-                        edges.append((component_found, method))
-
-    return nodes, edges
-
-
-def build_navigation_graph(unity_files):
-    G = nx.DiGraph()
-    for file in unity_files:
-        nodes, edges = parse_ui_connections(file)
-        G.add_nodes_from(nodes)
-        G.add_edges_from(edges)
-    return G
-
-
-def visualize_graph(G, save_path='outputs/ui_navigation_graph.png'):
+    details = []
+    file_label = os.path.basename(file_path)
+    unity_file = load_unity_file(file_path, model)
+
+    for obj in unity_file.objects.values():
+        if script_index is not None:
+            # Classify by m_Script GUID; the node is named after the owning GameObject
+            component_type = script_index.ui_type(obj)
+            if component_type is None:
+                continue
+            name = unity_file.owner_name(obj)
+            has_events = True
+        else:
+            # Keyword heuristic: any UI component name anywhere in the document
+            if not obj.ui_components:
+                continue
+            component_type = obj.ui_components[0]
+            name = obj.name
+            has_events = bool(obj.events)
+
+        # Only one UI node per object, and only for named objects
+        if not name:
+            continue
+        component_found = f"{file_label}::{name}"
+        nodes.append(component_found)
+        details.append((file_path, component_type, obj.file_id))
+
+        # Event-based method connections
+        if has_events:
+            for method in obj.method_names():
+                match = METHOD_NAME_PATTERN.match(method)
+                if match:
+                    edges.append((component_found, match.group(0)))
+
+    return nodes, edges, details
+
+
+def build_compact_navigation_graph(unity_files, model=None, jobs=1, cache=None, script_index=None,
+                                   instrumentation=None):
+    if script_index is not None and model is None:
+        # GUID classification happens here, on the cached/parallel-parsed object model
+        model = UnityProjectModel()
+
+    if model is None:
+        # Workers return compact node/edge lists, merged below in file order
+        results = map_files(parse_ui_connections, unity_files, jobs, cache=cache)
+    else:
+        model.parse_all(unity_files, jobs, cache)
+        results = [parse_ui_connections(file, model, script_index) for file in unity_files]
+
+    graph = CompactGraph()
+    for nodes, edges, details in results:
+        graph.add_parse_result(nodes, edges, details)
+    if instrumentation is not None:
+        for file, (nodes, edges, _) in zip(unity_files, results):
+            instrumentation.record_graph_output(file, len(nodes), len(edges))
+    return graph
+
+
+def build_navigation_graph(unity_files, model=None, jobs=1, cache=None, script_index=None):
+    return build_compact_navigation_graph(unity_files, model, jobs, cache, script_index).to_networkx()
+
+
+def visualize_graph(G, save_path='outputs/ui_navigation_graph.png', headless=False):
+    from parsers.graph_render import render_graph, SPRING_LAYOUT_LIMIT
+    if headless or G.number_of_nodes() > SPRING_LAYOUT_LIMIT:
+        render_graph(G, save_path, title="Static UI Navigation Graph")
+        return
+
+    import networkx as nx
+    import matplotlib.pyplot as plt
     plt.figure(figsize=(20, 12))
     pos = nx.spring_layout(G, k=0.6, iterations=60)
     nx.draw(G, pos, with_labels=True, node_size=500, font_size=7, arrows=True)
@@ -74,21 +106,39 @@ def visualize_graph(G, save_path='outputs/ui_navigation_graph.png'):
 
 # --- Main Pipeline ---
 
-def main(root_folder):
+def main(root_folder, jobs=1, cache=None, rebuild_index=False, headless=False, exports=('graphml', 'gexf')):
     unity_files = find_unity_files(root_folder)
-    G = build_navigation_graph(unity_files)
+    script_index = load_script_index(root_folder, rebuild=rebuild_index)
+    graph = build_compact_navigation_graph(unity_files, jobs=jobs, cache=cache, script_index=script_index)
 
-    # Save graph
+    # Save graph: the binary snapshot is what later stages load, XML only for Gephi
     if not os.path.exists('outputs'):
         os.makedirs('outputs')
+    save_snapshot(graph, 'outputs/ui_navigation.uigraph')
 
-    nx.write_graphml(G, 'outputs/ui_navigation.graphml')
-    nx.write_gexf(G, 'outputs/ui_navigation.gexf')
+    G = graph.to_networkx()
+    export_graph(G, 'outputs/ui_navigation', exports)
 
-    visualize_graph(G)
+    visualize_graph(G, headless=headless)
 
 
 if __name__ == "__main__":
-    # Change path if needed
-    project_path = "datasets/open-project-1-main/"
-    main(project_path)
+    parser = argparse.ArgumentParser(description="Build the static UI navigation graph of a Unity project.")
+    parser.add_argument('project_path', nargs='?', default="datasets/open-project-1-main/")
+    parser.add_argument('--jobs', type=int, default=1, help="Number of worker processes used for parsing")
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR, help="Directory of the persistent parse cache")
+    parser.add_argument('--no-cache', action='store_true', help="Reparse every file")
+    parser.add_argument('--hash', action='store_true', help="Also compare content hashes when mtime/size changed")
+    parser.add_argument('--rebuild-index', action='store_true', help="Rebuild the .meta script GUID index")
+    parser.add_argument('--headless', action='store_true', help="Render with the fast layered layout and don't open a window")
+    parser.add_argument('--export', nargs='*', choices=['graphml', 'gexf'], default=['graphml', 'gexf'],
+                        help="XML exports written next to the binary snapshot (none if given without values)")
+    args = parser.parse_args()
+
+    if args.no_cache:
+        main(args.project_path, jobs=args.jobs, rebuild_index=args.rebuild_index, headless=args.headless,
+             exports=args.export)
+    else:
+        with ParseCache(args.cache_dir, hash_contents=args.hash) as cache:
+            main(args.project_path, jobs=args.jobs, cache=cache, rebuild_index=args.rebuild_index,
+                 headless=args.headless, exports=args.export)
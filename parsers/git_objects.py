@@ -0,0 +1,91 @@
+# parsers/git_objects.py
+
+import os
+import subprocess
+
+REGULAR_FILE_MODES = (b'100644', b'100755')  # symlinks and submodules are not assets
+
+
+class GitRepository:
+    """
+    Read-only access to the object store of the git repository containing a path:
+    revisions, tree listings, changed paths and blob contents, all without touching
+    the working tree.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.root = self._git('rev-parse', '--show-toplevel', cwd=path).decode().strip()
+        prefix = os.path.relpath(os.path.realpath(path), os.path.realpath(self.root))
+        self.prefix = '' if prefix == os.curdir else prefix.replace(os.sep, '/') + '/'  # of path in the repository
+
+    def _git(self, *args, cwd=None):
+        try:
+            return subprocess.run(['git', *args], cwd=cwd or self.root, capture_output=True, check=True).stdout
+        except FileNotFoundError:
+            raise ValueError("git is not installed") from None
+        except subprocess.CalledProcessError as error:
+            message = error.stderr.decode(errors='replace').strip().splitlines()
+            raise ValueError(message[-1] if message else f"git {args[0]} failed") from None
+
+    def resolve(self, revision):
+        """Commit id of a revision (branch, tag, SHA, HEAD~1, ...)."""
+        try:
+            return self._git('rev-parse', '--verify', '--quiet', f"{revision}^{{commit}}").decode().strip()
+        except ValueError:
+            raise ValueError(f"unknown revision {revision!r} in {self.root}") from None
+
+    def _pathspec(self):
+        return ['--', self.prefix] if self.prefix else []
+
+    def list_tree(self, revision):
+        """{path relative to self.path: blob id} of every regular file under self.path at revision."""
+        output = self._git('ls-tree', '-r', '-z', '--full-tree', revision, *self._pathspec())
+        files = {}
+        for record in output.split(b'\0'):
+            if not record:
+                continue
+            info, _, path = record.partition(b'\t')
+            mode, kind, oid = info.split(b' ')
+            if kind == b'blob' and mode in REGULAR_FILE_MODES:
+                files[path.decode('utf-8', errors='surrogateescape')[len(self.prefix):]] = oid.decode()
+        return files
+
+    def changed_paths(self, base, head):
+        """Paths relative to self.path that differ between two revisions, renames as delete + add."""
+        output = self._git('diff', '--name-only', '-z', '--no-renames', base, head, *self._pathspec())
+        return [path.decode('utf-8', errors='surrogateescape')[len(self.prefix):]
+                for path in output.split(b'\0') if path]
+
+    def blob_reader(self):
+        return BlobReader(self.root)
+
+
+class BlobReader:
+    """Blob contents from one long-running `git cat-file --batch`, one request at a time."""
+
+    def __init__(self, root):
+        self.process = subprocess.Popen(['git', 'cat-file', '--batch'], cwd=root,
+                                        stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+
+    def read(self, oid):
+        self.process.stdin.write(oid.encode() + b'\n')
+        self.process.stdin.flush()
+        header = self.process.stdout.readline().split()
+        if len(header) != 3 or header[1] != b'blob':
+            raise ValueError(f"{oid} is not a blob in this repository")
+        data = self.process.stdout.read(int(header[2]))
+        self.process.stdout.read(1)  # newline after the content
+        return data
+
+    __call__ = read
+
+    def close(self):
+        self.process.stdin.close()
+        self.process.wait()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,279 @@
+# parsers/graph_query.py
+
+import sys
+import time
+import shlex
+import argparse
+from array import array
+from bisect import bisect_left, bisect_right
+from parsers.compact_graph import NO_STRING, NODE_SEPARATOR
+from parsers.ui_reachability_analyzer import ENTRY_KEYWORDS
+from parsers.dead_ui_report import NO_ENTRY_NODES, UNREFERENCED, DEAD_REFERRERS
+
+NAME_SEPARATOR = '\n'
+DEFAULT_LIMIT = 50
+
+
+class GraphQuery:
+    """
+    Read-only indexes over a compact_graph.CompactGraph for interactive lookups. Built
+    once per graph, in time linear in its size; every query afterwards only touches
+    the nodes it returns:
+
+    - node names: sorted for prefix search, and joined into one lowercase blob that
+      substring search scans with str.find
+    - node ids per file label, per source path and per component type
+    - reachability from the entry nodes with BFS parent pointers, so the path from an
+      entry to any node is followed back in O(path length)
+    - reverse adjacency, for "who references this dead node"
+    """
+
+    def __init__(self, graph, entry_keywords=ENTRY_KEYWORDS, entry_ids=None, tree=None):
+        self.graph = graph
+        self.entry_ids = graph.entry_node_ids(entry_keywords) if entry_ids is None else list(entry_ids)
+        self.parents, self.origins = tree if tree is not None else graph.reachability_tree(self.entry_ids)
+
+        strings = graph.strings
+        self.nodes_by_name = {}
+        self.by_file = {}
+        self.by_path = {}
+        self.by_kind = {}
+        for node_id, (file_sid, name_sid, path_sid, kind_sid) in enumerate(
+                zip(graph.node_file, graph.node_name, graph.node_path, graph.node_kind)):
+            self.nodes_by_name.setdefault(name_sid, []).append(node_id)
+            if file_sid != NO_STRING:
+                self.by_file.setdefault(strings[file_sid], []).append(node_id)
+            if path_sid != NO_STRING:
+                self.by_path.setdefault(strings[path_sid], []).append(node_id)
+            if kind_sid != NO_STRING:
+                self.by_kind.setdefault(strings[kind_sid], []).append(node_id)
+
+        names = sorted((strings[sid].lower(), sid) for sid in self.nodes_by_name)
+        self._sorted_names = [name for name, _ in names]
+        self._sorted_sids = [sid for _, sid in names]
+        self._blob = NAME_SEPARATOR.join(self._sorted_names)
+        self._blob_starts = array('i')
+        position = 0
+        for name in self._sorted_names:
+            self._blob_starts.append(position)
+            position += len(name) + 1
+
+        n = graph.number_of_nodes()
+        if n:
+            graph.node_id(graph.node_label(0))  # builds the label lookup now rather than on the first query
+
+        degree = [0] * (n + 1)
+        for dst in graph.edge_dst:
+            degree[dst + 1] += 1
+        for i in range(n):
+            degree[i + 1] += degree[i]
+        self._in_offsets = array('i', degree)
+        self._in_sources = array('i', bytes(4 * graph.number_of_edges()))
+        cursor = degree[:n]
+        for src, dst in zip(graph.edge_src, graph.edge_dst):
+            self._in_sources[cursor[dst]] = src
+            cursor[dst] += 1
+
+    # --- Lookups ---
+
+    def node(self, label_or_id):
+        """Node id for a "file::name" label or an id; None if there is no such node."""
+        if isinstance(label_or_id, int):
+            return label_or_id if 0 <= label_or_id < self.graph.number_of_nodes() else None
+        return self.graph.node_id(label_or_id)
+
+    def is_reachable(self, node_id):
+        return self.origins[node_id] >= 0
+
+    def _names_to_nodes(self, sids, limit):
+        nodes = []
+        for sid in sids:
+            nodes.extend(self.nodes_by_name[sid])
+            if limit and len(nodes) >= limit:
+                return nodes[:limit]
+        return nodes
+
+    def find_prefix(self, prefix, limit=DEFAULT_LIMIT):
+        """Nodes whose name starts with prefix (case-insensitive), in name order."""
+        prefix = prefix.lower()
+        start = bisect_left(self._sorted_names, prefix)
+        end = bisect_left(self._sorted_names, prefix + '\uffff', start)
+        return self._names_to_nodes(self._sorted_sids[start:end], limit)
+
+    def find_substring(self, text, limit=DEFAULT_LIMIT):
+        """Nodes whose name contains text (case-insensitive), in name order."""
+        text = text.lower()
+        blob, starts = self._blob, self._blob_starts
+        sids = []
+        position = blob.find(text)
+        while position >= 0:
+            index = bisect_right(starts, position) - 1
+            sids.append(self._sorted_sids[index])
+            if limit and len(sids) >= limit:
+                break
+            next_name = starts[index + 1] if index + 1 < len(starts) else len(blob)
+            position = blob.find(text, next_name)
+        return self._names_to_nodes(sids, limit)
+
+    def nodes(self, file=None, kind=None, status=None, limit=None):
+        """
+        Nodes filtered by file (a file label such as "Menu.prefab" or a source path),
+        component type and status ('reachable' or 'dead'), starting from the smallest
+        index that applies.
+        """
+        candidates = []
+        if file is not None:
+            candidates.append(self.by_file.get(file) or self.by_path.get(file) or [])
+        if kind is not None:
+            candidates.append(self.by_kind.get(kind, []))
+        nodes = min(candidates, key=len) if candidates else range(self.graph.number_of_nodes())
+        kind_sid = self.graph.strings.lookup(kind) if kind is not None else None
+        file_nodes = set(candidates[0]) if file is not None and kind is not None else None
+
+        result = []
+        for node_id in nodes:
+            if kind_sid is not None and self.graph.node_kind[node_id] != kind_sid:
+                continue
+            if file_nodes is not None and node_id not in file_nodes:
+                continue
+            if status is not None and (self.origins[node_id] >= 0) != (status == 'reachable'):
+                continue
+            result.append(node_id)
+            if limit and len(result) >= limit:
+                break
+        return result
+
+    def dead(self, file=None, kind=None, limit=None):
+        return self.nodes(file, kind, 'dead', limit)
+
+    def referrers(self, node_id):
+        return self._in_sources[self._in_offsets[node_id]:self._in_offsets[node_id + 1]].tolist()
+
+    def path_to(self, node_id):
+        """Shortest path [entry, ..., node_id] along BFS parent pointers; [] if node_id is dead."""
+        if self.origins[node_id] < 0:
+            return []
+        path = [node_id]
+        while self.parents[path[-1]] >= 0:
+            path.append(self.parents[path[-1]])
+        path.reverse()
+        return path
+
+    def explain(self, node_id):
+        """Why node_id is reachable (its path) or dead (the reason, and the dead nodes referencing it)."""
+        if self.origins[node_id] >= 0:
+            return {'status': 'reachable', 'path': self.path_to(node_id)}
+        referrers = self.referrers(node_id)
+        if not self.entry_ids:
+            reason = NO_ENTRY_NODES
+        else:
+            reason = DEAD_REFERRERS if referrers else UNREFERENCED
+        return {'status': 'dead', 'reason': reason, 'referrers': referrers}
+
+    def label(self, node_id):
+        return self.graph.node_label(node_id)
+
+
+# --- Command line ---
+
+def _print_nodes(query, nodes):
+    for node_id in nodes:
+        _, kind, _ = query.graph.node_details(node_id)
+        status = 'reachable' if query.is_reachable(node_id) else 'dead'
+        print(f"{status:<9}  {kind or '-':<12}  {query.label(node_id)}")
+
+
+def _candidates(query, text):
+    """Nodes a label without an exact match may mean: its name part as a substring, within its file if it has one."""
+    file_label, separator, name = text.rpartition(NODE_SEPARATOR)
+    nodes = query.find_substring(name, limit=None)
+    if separator:
+        nodes = [node_id for node_id in nodes if query.label(node_id).startswith(file_label + NODE_SEPARATOR)]
+    return nodes
+
+
+def run_command(query, argv):
+    """Run one query command (see build_parser()) against a warm GraphQuery."""
+    args = build_parser().parse_args(argv)
+    start = time.perf_counter()
+    if args.command == 'find':
+        nodes = (query.find_prefix if args.prefix else query.find_substring)(args.text, args.limit)
+        elapsed = time.perf_counter() - start
+        _print_nodes(query, nodes)
+    elif args.command in ('dead', 'list'):
+        status = 'dead' if args.command == 'dead' else args.status
+        nodes = query.nodes(args.file, args.kind, status, args.limit)
+        elapsed = time.perf_counter() - start
+        _print_nodes(query, nodes)
+    else:
+        node_id = query.node(args.node)
+        if node_id is None:
+            candidates = _candidates(query, args.node)
+            if not candidates:
+                print(f"❌ No node matches {args.node!r}")
+                return
+            if len(candidates) > 1:
+                print(f"❓ {len(candidates)} nodes match {args.node!r}; ask again with one of these labels:")
+                _print_nodes(query, candidates[:args.limit])
+                return
+            node_id = candidates[0]
+            print(f"🔎 No node is labelled {args.node!r}; explaining its only match, {query.label(node_id)}")
+        explanation = query.explain(node_id)
+        elapsed = time.perf_counter() - start
+        if explanation['status'] == 'reachable':
+            print(f"✅ {query.label(node_id)} is reachable:")
+            for step in explanation['path']:
+                print(f"   → {query.label(step)}")
+        else:
+            print(f"💀 {query.label(node_id)} is dead: {explanation['reason']}")
+            for referrer in explanation['referrers'][:args.limit]:
+                print(f"   ← {query.label(referrer)}")
+    print(f"⏱  {elapsed * 1000:.3f} ms")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='query', description="Query a saved UI navigation graph.")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    find = subparsers.add_parser('find', help="Nodes whose name contains TEXT")
+    find.add_argument('text')
+    find.add_argument('--prefix', action='store_true', help="Match the start of the name only")
+    for name, help_text in (('dead', "Dead nodes"), ('list', "Nodes, optionally by status")):
+        command = subparsers.add_parser(name, help=help_text)
+        command.add_argument('--file', help="File label (Menu.prefab) or source path")
+        command.add_argument('--kind', help="Component type, e.g. Button")
+        if name == 'list':
+            command.add_argument('--status', choices=['reachable', 'dead'])
+    why = subparsers.add_parser('why', help="Path from an entry to NODE, or why NODE is dead")
+    why.add_argument('node', help='"file::name" label, or part of a name if only one node matches it')
+    for command in subparsers.choices.values():
+        command.add_argument('--limit', type=int, default=DEFAULT_LIMIT)
+    return parser
+
+
+def main(argv=None):
+    """
+    python -m parsers.graph_query GRAPH [COMMAND ...]: answer one query, or with no
+    command read queries from stdin against the loaded graph, one per line.
+    """
+    from parsers.graph_snapshot import load_graph
+
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] in ('-h', '--help'):
+        print("Usage: python -m parsers.graph_query <graph (.uigraph/.gexf/.graphml)> [find|dead|list|why ...]")
+        return
+    start = time.perf_counter()
+    query = GraphQuery(load_graph(argv[0]))
+    print(f"📇 {query.graph.number_of_nodes()} nodes indexed in {time.perf_counter() - start:.3f} s")
+    if len(argv) > 1:
+        run_command(query, argv[1:])
+        return
+    for line in sys.stdin:
+        if line.strip():
+            try:
+                run_command(query, shlex.split(line))
+            except SystemExit:
+                pass  # argparse already printed the usage error
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,230 @@
+# parsers/graph_render.py
+
+from collections import Counter, defaultdict
+import numpy as np
+import networkx as nx
+from parsers.ui_reachability_analyzer import build_csr, find_entry_nodes
+
+# Above this many nodes spring_layout + nx.draw is too slow; use render_graph instead
+SPRING_LAYOUT_LIMIT = 2000
+# Groups (one per scene/prefab) larger than this are collapsed on big graphs
+MAX_GROUP_SIZE = 200
+COLLAPSE_ABOVE = 5000
+LABEL_LIMIT = 300
+# Above this many edges, edges between two groups are drawn as one segment
+BUNDLE_ABOVE = 10000
+UNGROUPED = '(methods)'
+
+
+def node_group(node):
+    """Scene/prefab a "file::name" node belongs to."""
+    file_label, separator, _ = node.partition('::')
+    return file_label if separator else UNGROUPED
+
+
+# --- Layout ---
+
+def _level_bfs(offsets, targets, depth, frontier, level):
+    """Assign BFS levels from frontier to every node still at depth -1, one vectorized step per level."""
+    while frontier.size:
+        depth[frontier] = level
+        starts, ends = offsets[frontier], offsets[frontier + 1]
+        lengths = ends - starts
+        total = lengths.sum()
+        if not total:
+            break
+        gather = np.repeat(starts - np.cumsum(lengths) + lengths, lengths) + np.arange(total)
+        successors = np.unique(targets[gather])
+        frontier = successors[depth[successors] == -1]
+        level += 1
+
+
+def _bfs_depths(G, nodes, entry_nodes):
+    """
+    Hop distance of every node from the nearest entry node. Unreached nodes are layered
+    below the deepest reached level, by hop distance from the unreached nodes that
+    nothing else unreached points at.
+    """
+    _, index, offsets, targets = build_csr(G)
+    offsets = np.frombuffer(offsets, dtype=np.int32)
+    targets = np.frombuffer(targets, dtype=np.int32)
+    depth = np.full(len(nodes), -1, dtype=np.int32)
+    entries = np.array(sorted({index[n] for n in entry_nodes if n in index}), dtype=np.int32)
+    _level_bfs(offsets, targets, depth, entries, 0)
+
+    unreached = depth == -1
+    if unreached.any():
+        sources = np.repeat(np.arange(len(nodes), dtype=np.int32), np.diff(offsets))
+        inner = unreached[sources] & unreached[targets]
+        has_parent = np.bincount(targets[inner], minlength=len(nodes)) > 0
+        roots = np.flatnonzero(unreached & ~has_parent).astype(np.int32)
+        _level_bfs(offsets, targets, depth, roots, int(depth.max()) + 1)
+        # Whatever is left only sits on unreached cycles
+        depth[depth == -1] = depth.max() + 1
+    return depth
+
+
+def layered_layout(G, entry_nodes=None, column_gap=2.0):
+    """
+    Hierarchical per-scene layout in O(n + e): one column block per scene/prefab,
+    one row per BFS depth from the entry nodes. Returns {node: (x, y)}.
+    """
+    nodes = list(G.nodes)
+    if not nodes:
+        return {}
+    if entry_nodes is None:
+        entry_nodes = find_entry_nodes(G)
+
+    depth = _bfs_depths(G, nodes, entry_nodes)
+    group_names = {}
+    group = np.array([group_names.setdefault(node_group(n), len(group_names)) for n in nodes], dtype=np.int64)
+
+    # Rank of each node within its (group, depth) row
+    order = np.lexsort((depth, group))
+    key = group[order] * (int(depth.max()) + 1) + depth[order]
+    row_start = np.r_[0, np.flatnonzero(np.diff(key)) + 1]
+    row_length = np.diff(np.r_[row_start, key.size])
+    row_id = np.repeat(np.arange(row_start.size), row_length)
+    rank = np.empty(len(nodes), dtype=np.int64)
+    rank[order] = np.arange(key.size) - row_start[row_id]
+
+    # Rows longer than about twice the square root of their group wrap onto extra lines
+    group_size = np.bincount(group)
+    row_group = group[order][row_start]
+    wrap = np.maximum(8, np.ceil(2 * np.sqrt(group_size))).astype(np.int64)
+    row_lines = -(-row_length // wrap[row_group])
+    lines_before = np.cumsum(row_lines) - row_lines
+    group_first_row = np.r_[0, np.flatnonzero(np.diff(row_group)) + 1]
+    row_y = lines_before - lines_before[group_first_row][np.repeat(np.arange(group_first_row.size),
+                                                                   np.diff(np.r_[group_first_row, row_group.size]))]
+    node_row = np.empty(len(nodes), dtype=np.int64)
+    node_row[order] = row_id
+    local_x = rank % wrap[group]
+    local_y = row_y[node_row] + rank // wrap[group]
+
+    # Groups are placed left to right and wrapped into bands so the drawing stays roughly 16:9
+    width = np.zeros(len(group_names), dtype=np.int64)
+    np.maximum.at(width, group, local_x + 1)
+    height = np.bincount(row_group, weights=row_lines, minlength=len(group_names)).astype(np.int64)
+    band_width = max(float(width.max()), np.sqrt(((width + column_gap) * (height + 1)).sum() * 16 / 9))
+    group_x = np.zeros(len(group_names))
+    group_y = np.zeros(len(group_names))
+    cursor, band_top, band_height = 0.0, 0.0, 0
+    for g, (w, h) in enumerate(zip(width, height)):
+        if cursor and cursor + w > band_width:
+            cursor, band_top, band_height = 0.0, band_top + band_height + 1, 0
+        group_x[g], group_y[g] = cursor, band_top
+        cursor += w + column_gap
+        band_height = max(band_height, h)
+
+    x = group_x[group] + local_x
+    y = -(group_y[group] + local_y)
+    return {node: (float(x[i]), float(y[i])) for i, node in enumerate(nodes)}
+
+
+# --- Collapsing ---
+
+def collapse_large_groups(G, max_group_size=MAX_GROUP_SIZE, colors=None):
+    """
+    Replace every scene/prefab group with more than max_group_size nodes by one
+    summary node. Returns (collapsed graph, colors for it, {node: node in collapsed
+    graph}). A summary node takes the most common color of its members.
+    """
+    members = defaultdict(list)
+    for node in G.nodes:
+        members[node_group(node)].append(node)
+
+    mapping = {}
+    collapsed_colors = {}
+    H = nx.DiGraph()
+    for group, group_nodes in members.items():
+        if len(group_nodes) > max_group_size:
+            summary = f"{group}::[{len(group_nodes)} nodes]"
+            H.add_node(summary, collapsed=len(group_nodes))
+            for node in group_nodes:
+                mapping[node] = summary
+            if colors:
+                collapsed_colors[summary] = Counter(colors.get(n) for n in group_nodes).most_common(1)[0][0]
+        else:
+            for node in group_nodes:
+                mapping[node] = node
+                H.add_node(node)
+                if colors:
+                    collapsed_colors[node] = colors.get(node)
+
+    H.add_edges_from((mapping[u], mapping[v]) for u, v in G.edges if mapping[u] != mapping[v])
+    return H, collapsed_colors, mapping
+
+
+# --- Drawing ---
+
+def _edge_segments(G, nodes, xy, edge_index, bundle_above):
+    """
+    Line segments for all edges. Agg time grows with segment length, so on big graphs
+    edges between different groups are bundled into one segment between the group
+    centroids instead of being drawn one by one across the canvas.
+    """
+    if len(edge_index) <= bundle_above:
+        return np.stack((xy[edge_index[:, 0]], xy[edge_index[:, 1]]), axis=1)
+
+    group_names = {}
+    group = np.array([group_names.setdefault(node_group(n), len(group_names)) for n in nodes], dtype=np.int64)
+    counts = np.bincount(group, minlength=len(group_names))
+    centroid = np.stack([np.bincount(group, weights=xy[:, axis]) / counts for axis in (0, 1)], axis=1)
+
+    source_group, target_group = group[edge_index[:, 0]], group[edge_index[:, 1]]
+    inner = source_group == target_group
+    pairs = np.unique(np.stack((source_group[~inner], target_group[~inner]), axis=1), axis=0).reshape(-1, 2)
+    inner_edges = edge_index[inner]
+    return np.concatenate((
+        np.stack((xy[inner_edges[:, 0]], xy[inner_edges[:, 1]]), axis=1),
+        np.stack((centroid[pairs[:, 0]], centroid[pairs[:, 1]]), axis=1),
+    ))
+
+
+def render_graph(G, output_path, colors=None, title=None, entry_nodes=None,
+                 collapse_above=COLLAPSE_ABOVE, label_limit=LABEL_LIMIT, bundle_above=BUNDLE_ABOVE, dpi=150):
+    """
+    Headless rendering for large graphs: layered layout, one LineCollection for all
+    edges and one scatter for all nodes, drawn on an Agg canvas so no display or
+    pyplot state is needed. colors maps node -> matplotlib color. Graphs with more
+    than collapse_above nodes have their large groups collapsed first.
+    """
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.collections import LineCollection
+
+    if entry_nodes is None:
+        entry_nodes = find_entry_nodes(G)
+    if G.number_of_nodes() > collapse_above:
+        G, colors, mapping = collapse_large_groups(G, colors=colors)
+        entry_nodes = {mapping[n] for n in entry_nodes if n in mapping}
+
+    pos = layered_layout(G, entry_nodes)
+    nodes = list(G.nodes)
+    index = {node: i for i, node in enumerate(nodes)}
+    xy = np.array([pos[n] for n in nodes], dtype=np.float64).reshape(-1, 2)
+
+    fig = Figure(figsize=(24, 14))
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot(1, 1, 1)
+    ax.set_axis_off()
+
+    if G.number_of_edges():
+        edge_index = np.array([(index[u], index[v]) for u, v in G.edges], dtype=np.int64)
+        ax.add_collection(LineCollection(_edge_segments(G, nodes, xy, edge_index, bundle_above),
+                                         colors='gray', linewidths=0.3, alpha=0.5))
+
+    node_colors = [colors.get(n) or 'lightblue' for n in nodes] if colors else 'lightblue'
+    sizes = [30 + min(G.nodes[n].get('collapsed', 0), 500) for n in nodes]
+    ax.scatter(xy[:, 0], xy[:, 1], c=node_colors, s=sizes, linewidths=0, zorder=2)
+
+    if len(nodes) <= label_limit:
+        for node, (x, y) in zip(nodes, xy):
+            ax.annotate(node, (x, y), fontsize=6, ha='center', va='bottom')
+
+    ax.autoscale_view()
+    if title:
+        ax.set_title(title)
+    fig.savefig(output_path, dpi=dpi)
+    print(f"✅ Graph saved at {output_path}")
@@ -0,0 +1,104 @@
+# parsers/graph_snapshot.py
+
+import os
+import sys
+import mmap
+import struct
+from array import array
+from parsers.compact_graph import CompactGraph, StringTable
+
+SNAPSHOT_EXTENSION = '.uigraph'
+SNAPSHOT_MAGIC = b'UIGS'
+SNAPSHOT_VERSION = 2
+READABLE_VERSIONS = (1, 2)  # version 1 has no node details
+STRING_SEPARATOR = '\0'
+
+# magic, version, byte order (0 little / 1 big), string count, string bytes, nodes, edges
+HEADER = struct.Struct('<4sIIIIII')
+
+
+def _padding(size):
+    return -size % 4
+
+
+def save_snapshot(graph, path, verbose=True):
+    """
+    Write a compact_graph.CompactGraph as one binary file: a fixed header, the
+    interned string table as a single UTF-8 blob, then the node, edge and CSR int32
+    arrays and the node detail arrays exactly as they are laid out in memory. Nothing
+    is encoded per node or edge.
+    """
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    joined = STRING_SEPARATOR.join(graph.strings.strings)
+    if joined.count(STRING_SEPARATOR) != max(len(graph.strings) - 1, 0):
+        raise ValueError("graph strings must not contain NUL characters")
+    blob = joined.encode('utf-8')
+    offsets, targets = graph.csr()
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, sys.byteorder == 'big', len(graph.strings),
+                            len(blob), graph.number_of_nodes(), graph.number_of_edges()))
+        f.write(blob)
+        f.write(bytes(_padding(len(blob))))
+        for values in (graph.node_file, graph.node_name, graph.edge_src, graph.edge_dst, offsets, targets,
+                       graph.node_path, graph.node_kind, graph.node_file_id):
+            f.write(memoryview(values).cast('B'))
+    if verbose:
+        print(f"✅ Graph snapshot saved: {path}")
+
+
+def load_snapshot(path):
+    """
+    Load a snapshot written by save_snapshot(). The file is memory-mapped and each
+    array is filled with a single copy of its bytes; no per-element parsing happens,
+    and the CSR arrays come ready for reachability.
+    """
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        view = memoryview(data)
+        try:
+            magic, version, big_endian, string_count, blob_size, node_count, edge_count = \
+                HEADER.unpack_from(view)
+            if magic != SNAPSHOT_MAGIC or version not in READABLE_VERSIONS:
+                raise ValueError(f"{path} is not a version {SNAPSHOT_VERSION} UI graph snapshot")
+
+            position = HEADER.size
+            blob = str(view[position:position + blob_size], 'utf-8')
+            strings = blob.split(STRING_SEPARATOR) if string_count else []
+            position += blob_size + _padding(blob_size)
+
+            layout = [('i', node_count), ('i', node_count), ('i', edge_count), ('i', edge_count),
+                      ('i', node_count + 1), ('i', edge_count)]
+            if version >= 2:
+                layout += [('i', node_count), ('i', node_count), ('q', node_count)]
+            arrays = []
+            for typecode, count in layout:
+                values = array(typecode)
+                size = values.itemsize * count
+                values.frombytes(view[position:position + size])
+                if big_endian != (sys.byteorder == 'big'):
+                    values.byteswap()
+                arrays.append(values)
+                position += size
+        finally:
+            view.release()
+
+    node_file, node_name, edge_src, edge_dst, offsets, targets = arrays[:6]
+    return CompactGraph.from_arrays(StringTable(strings), node_file, node_name, edge_src, edge_dst,
+                                    csr=(offsets, targets), details=tuple(arrays[6:]) or None)
+
+
+def load_graph(path):
+    """Load a CompactGraph from a snapshot, or from a GEXF/GraphML export."""
+    if path.endswith(SNAPSHOT_EXTENSION):
+        return load_snapshot(path)
+    import networkx as nx
+    G = nx.read_graphml(path) if path.endswith('.graphml') else nx.read_gexf(path)
+    return CompactGraph.from_networkx(G)
+
+
+def export_graph(G, path_stem, formats):
+    """Write networkx graph G as path_stem.<format> for each of 'gexf' and 'graphml' in formats."""
+    import networkx as nx
+    writers = {'gexf': nx.write_gexf, 'graphml': nx.write_graphml}
+    for fmt in formats:
+        writers[fmt](G, f"{path_stem}.{fmt}")
+        print(f"✅ {fmt.upper()} export saved: {path_stem}.{fmt}")
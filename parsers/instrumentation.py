@@ -0,0 +1,154 @@
+# parsers/instrumentation.py
+
+import os
+import io
+import json
+import time
+
+DEFAULT_TOP = 10
+FILE_FIELDS = ('bytes', 'documents', 'parse_seconds', 'cached', 'nodes', 'edges')
+
+
+class FileStats:
+    """What one scene or prefab cost and produced."""
+    __slots__ = ('path',) + FILE_FIELDS
+
+    def __init__(self, path):
+        self.path = path
+        self.bytes = None
+        self.documents = None
+        self.parse_seconds = None
+        self.cached = False
+        self.nodes = 0
+        self.edges = 0
+
+    def as_dict(self):
+        return {'path': self.path, **{field: getattr(self, field) for field in FILE_FIELDS}}
+
+
+class Instrumentation:
+    """
+    Structured run statistics: per-file bytes, documents, parse time and graph output,
+    named counters, the stage records of a pipeline.StageTimings, and optionally a
+    cProfile of the main process. Nothing is printed while collecting; report() prints
+    the slowest and largest files at the end and write_trace() saves everything as JSON.
+    Stages only record into it when one is passed, so uninstrumented runs pay nothing.
+    """
+
+    def __init__(self, timings=None, profile=False):
+        self.timings = timings
+        self.files = {}
+        self.counters = {}
+        self.started = time.time()
+        self.profiler = None
+        if profile:
+            import cProfile
+            self.profiler = cProfile.Profile()
+            self.profiler.enable()
+
+    def file(self, path):
+        stats = self.files.get(path)
+        if stats is None:
+            stats = self.files[path] = FileStats(path)
+        return stats
+
+    def count(self, name, amount=1):
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    # --- Stage hooks ---
+
+    def record_discovery(self, manifest):
+        for entry in manifest:
+            self.file(entry.path).bytes = entry.size
+        self.count('files_discovered', len(manifest))
+        self.count('bytes_discovered', manifest.total_bytes())
+
+    def record_parse(self, unity_files, cache=None):
+        """unity_files: the parsed unity_model.UnityFile records; with a cache, files it served are marked cached."""
+        reparsed = set(cache.last_missed) if cache is not None else None
+        documents = 0
+        for unity_file in unity_files:
+            stats = self.file(unity_file.path)
+            stats.documents = unity_file.documents
+            stats.parse_seconds = unity_file.parse_seconds
+            stats.cached = reparsed is not None and unity_file.path not in reparsed
+            if stats.bytes is None:
+                try:
+                    stats.bytes = os.path.getsize(unity_file.path)
+                except OSError:
+                    pass
+            documents += unity_file.documents or 0
+        self.count('files_parsed', len(unity_files))
+        self.count('documents', documents)
+        if reparsed is not None:
+            self.count('cache_misses', len(reparsed))
+
+    def record_graph_output(self, path, nodes, edges):
+        stats = self.file(path)
+        stats.nodes += nodes
+        stats.edges += edges
+
+    # --- Output ---
+
+    def stop_profile(self):
+        if self.profiler is not None:
+            self.profiler.disable()
+
+    def profile_summary(self, limit=15):
+        if self.profiler is None:
+            return ''
+        import pstats
+        stream = io.StringIO()
+        pstats.Stats(self.profiler, stream=stream).sort_stats('cumulative').print_stats(limit)
+        return stream.getvalue()
+
+    def top_files(self, key, top=DEFAULT_TOP):
+        values = [stats for stats in self.files.values() if getattr(stats, key) is not None]
+        values.sort(key=lambda stats: getattr(stats, key), reverse=True)
+        return values[:top]
+
+    def report(self, top=DEFAULT_TOP):
+        """Print the top-N slowest and largest files, the counters and the profile, if any."""
+        self.stop_profile()
+        parsed = [stats for stats in self.files.values() if stats.parse_seconds is not None]
+        if parsed:
+            total = sum(stats.parse_seconds for stats in parsed)
+            print(f"🐢 Slowest files to parse ({total:.3f} s over {len(parsed)} files, "
+                  f"times from when each was parsed):")
+            for stats in self.top_files('parse_seconds', top):
+                cached = "  (cached)" if stats.cached else ""
+                print(f"   {stats.parse_seconds * 1000:9.2f} ms  {stats.documents or 0:6} docs  "
+                      f"{(stats.bytes or 0) / 1024:9.1f} KB  {stats.path}{cached}")
+        sized = self.top_files('bytes', top)
+        if sized:
+            print("📦 Largest files:")
+            for stats in sized:
+                print(f"   {(stats.bytes or 0) / 1024:9.1f} KB  {stats.documents or 0:6} docs  "
+                      f"{stats.nodes:5} nodes  {stats.edges:5} edges  {stats.path}")
+        if self.counters:
+            print("🔢 " + ", ".join(f"{name} {value}" for name, value in self.counters.items()))
+        summary = self.profile_summary()
+        if summary:
+            print(summary)
+
+    def save_profile(self, profile_path):
+        """Save the cProfile stats for pstats or snakeviz."""
+        self.stop_profile()
+        os.makedirs(os.path.dirname(profile_path) or '.', exist_ok=True)
+        self.profiler.dump_stats(profile_path)
+        print(f"✅ Profile written to: {profile_path}")
+
+    def write_trace(self, trace_path, profile_path=None):
+        """Save stages, counters and every file's stats as JSON, naming the saved profile if there is one."""
+        self.stop_profile()
+        trace = {
+            'started': time.strftime('%Y-%m-%dT%H:%M:%S%z', time.localtime(self.started)),
+            'stages': self.timings.stages if self.timings is not None else [],
+            'counters': self.counters,
+            'files': [stats.as_dict() for stats in self.files.values()],
+            'profile': profile_path,
+        }
+        os.makedirs(os.path.dirname(trace_path) or '.', exist_ok=True)
+        with open(trace_path, 'w', encoding='utf-8') as f:
+            json.dump(trace, f, indent=1)
+        print(f"✅ Trace written to: {trace_path}")
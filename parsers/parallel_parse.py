@@ -0,0 +1,52 @@
+# parsers/parallel_parse.py
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+CHUNKS_PER_WORKER = 4
+BLOB_BATCH_FILES = 512  # blob contents read and held at once by map_blobs
+
+
+def default_jobs():
+    return os.cpu_count() or 1
+
+
+def map_files(parse_func, file_paths, jobs=1, chunk_size=None, cache=None):
+    """
+    Apply parse_func to every file and return the results in input order.
+    With jobs > 1 the files are fanned out to a process pool in chunks; since results
+    are merged in input order, callers get exactly what a serial loop would produce.
+    parse_func must be a module-level function so it can be pickled.
+    With a parse_cache.ParseCache, only files that changed since the last run are parsed.
+    """
+    if cache is not None:
+        return cache.map_files(parse_func, file_paths, jobs, chunk_size)
+
+    file_paths = list(file_paths)
+    if jobs is None or jobs <= 1 or len(file_paths) < 2:
+        return [parse_func(path) for path in file_paths]
+
+    jobs = min(jobs, len(file_paths))
+    if chunk_size is None:
+        chunk_size = max(1, len(file_paths) // (jobs * CHUNKS_PER_WORKER))
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        return list(executor.map(parse_func, file_paths, chunksize=chunk_size))
+
+
+def map_blobs(parse_func, blobs, read_blob, jobs=1, chunk_size=None, cache=None, batch_files=BLOB_BATCH_FILES):
+    """
+    map_files() for file versions stored in a git object store instead of on disk:
+    blobs is a list of (path, object id), read_blob(object id) returns the content, and
+    parse_func receives (path, content). Contents are read batch_files at a time and
+    dropped once parsed, so at most one batch of them is in memory. With a
+    parse_cache.ParseCache, versions parsed on an earlier run are not read again.
+    """
+    if cache is not None:
+        return cache.map_blobs(parse_func, blobs, read_blob, jobs, chunk_size, batch_files)
+    blobs = list(blobs)
+    results = []
+    for start in range(0, len(blobs), batch_files):
+        batch = [(path, read_blob(oid)) for path, oid in blobs[start:start + batch_files]]
+        results.extend(map_files(parse_func, batch, jobs, chunk_size))
+    return results
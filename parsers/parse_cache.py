@@ -0,0 +1,183 @@
+# parsers/parse_cache.py
+
+import os
+import pickle
+import sqlite3
+import hashlib
+from parsers.parallel_parse import map_files, map_blobs, BLOB_BATCH_FILES
+
+DEFAULT_CACHE_DIR = 'outputs/.cache'
+CACHE_FILE_NAME = 'parse_cache.sqlite'
+# Bump whenever a cached parser changes the shape or meaning of its results
+CACHE_VERSION = 8
+HASH_BLOCK_SIZE = 1 << 20
+
+
+def file_digest(file_path):
+    digest = hashlib.sha1()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _cache_kind(parse_func):
+    return f"{parse_func.__module__}.{parse_func.__qualname__}:v{CACHE_VERSION}"
+
+
+class ParseCache:
+    """
+    On-disk store of per-file parse results, keyed by parser, path, mtime and size.
+    With hash_contents=True a file whose stat changed but whose content did not
+    (a fresh checkout, a touch) is still served from the cache.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, hash_contents=False):
+        os.makedirs(cache_dir, exist_ok=True)
+        self.path = os.path.join(cache_dir, CACHE_FILE_NAME)
+        self.hash_contents = hash_contents
+        self.hits = 0
+        self.misses = 0
+        self.last_missed = []  # paths parsed by the latest map_files() call
+        self.manifest = None
+        self._db = sqlite3.connect(self.path)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            " kind TEXT NOT NULL, path TEXT NOT NULL,"
+            " mtime_ns INTEGER NOT NULL, size INTEGER NOT NULL, digest TEXT,"
+            " payload BLOB NOT NULL, PRIMARY KEY (kind, path))"
+        )
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS blobs ("
+            " kind TEXT NOT NULL, path TEXT NOT NULL, oid TEXT NOT NULL,"
+            " payload BLOB NOT NULL, PRIMARY KEY (kind, path, oid))"
+        )
+        # Results written by older parser versions can never be hit again
+        self._db.execute("DELETE FROM entries WHERE kind NOT LIKE ?", (f"%:v{CACHE_VERSION}",))
+        self._db.execute("DELETE FROM blobs WHERE kind NOT LIKE ?", (f"%:v{CACHE_VERSION}",))
+        self._db.commit()
+
+    def use_manifest(self, manifest):
+        """Take file sizes and mtimes from an asset_discovery.AssetManifest instead of os.stat()."""
+        self.manifest = manifest
+
+    def _stat(self, file_path):
+        entry = self.manifest.get(file_path) if self.manifest is not None else None
+        if entry is None:
+            stat = os.stat(file_path)
+            return stat.st_mtime_ns, stat.st_size
+        return entry.mtime_ns, entry.size
+
+    def close(self):
+        self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _lookup(self, kind, file_path, stat, stored):
+        """Return the cached payload for file_path, or None when it must be reparsed. stat is (mtime_ns, size)."""
+        if stored is None:
+            return None
+        mtime_ns, size, digest = stored
+        if (mtime_ns, size) == stat:
+            pass
+        elif self.hash_contents and digest and size == stat[1] and digest == file_digest(file_path):
+            self._db.execute(
+                "UPDATE entries SET mtime_ns = ? WHERE kind = ? AND path = ?",
+                (stat[0], kind, file_path),
+            )
+        else:
+            return None
+        row = self._db.execute(
+            "SELECT payload FROM entries WHERE kind = ? AND path = ?", (kind, file_path)
+        ).fetchone()
+        return pickle.loads(row[0])
+
+    def map_files(self, parse_func, file_paths, jobs=1, chunk_size=None):
+        """
+        Same contract as parallel_parse.map_files, but only files that changed since the
+        last run are parsed. Entries for files that no longer exist are evicted.
+        """
+        file_paths = list(file_paths)
+        kind = _cache_kind(parse_func)
+        stored = {
+            path: (mtime_ns, size, digest)
+            for path, mtime_ns, size, digest in self._db.execute(
+                "SELECT path, mtime_ns, size, digest FROM entries WHERE kind = ?", (kind,)
+            )
+        }
+
+        results = [None] * len(file_paths)
+        stats = {}
+        missing = []
+        for index, file_path in enumerate(file_paths):
+            stat = self._stat(file_path)
+            stats[file_path] = stat
+            cached = self._lookup(kind, file_path, stat, stored.get(file_path))
+            if cached is None:
+                missing.append(index)
+            else:
+                results[index] = cached
+        self.hits += len(file_paths) - len(missing)
+        self.misses += len(missing)
+        self.last_missed = [file_paths[index] for index in missing]
+
+        parsed = map_files(parse_func, [file_paths[index] for index in missing], jobs, chunk_size)
+        rows = []
+        for index, result in zip(missing, parsed):
+            file_path = file_paths[index]
+            stat = stats[file_path]
+            digest = file_digest(file_path) if self.hash_contents else None
+            results[index] = result
+            rows.append((kind, file_path, stat[0], stat[1], digest,
+                         pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)))
+        self._db.executemany("INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?)", rows)
+
+        requested = set(file_paths)
+        stale = [(kind, path) for path in stored if path not in requested and not os.path.exists(path)]
+        self._db.executemany("DELETE FROM entries WHERE kind = ? AND path = ?", stale)
+        self._db.commit()
+        return results
+
+    def map_blobs(self, parse_func, blobs, read_blob, jobs=1, chunk_size=None, batch_files=BLOB_BATCH_FILES):
+        """
+        Same contract as parallel_parse.map_blobs. Results are keyed by path and git object
+        id, so a file version is parsed once however many revisions contain it. Versions
+        of the requested paths that were not requested this time are evicted; pass every
+        revision's blobs in one call to keep them all.
+        """
+        blobs = list(blobs)
+        kind = _cache_kind(parse_func)
+        requested = set(blobs)
+        stored = set(self._db.execute("SELECT path, oid FROM blobs WHERE kind = ?", (kind,)))
+
+        results = [None] * len(blobs)
+        missing = []
+        for index, (path, oid) in enumerate(blobs):
+            if (path, oid) in stored:
+                row = self._db.execute(
+                    "SELECT payload FROM blobs WHERE kind = ? AND path = ? AND oid = ?", (kind, path, oid)
+                ).fetchone()
+                results[index] = pickle.loads(row[0])
+            else:
+                missing.append(index)
+        self.hits += len(blobs) - len(missing)
+        self.misses += len(missing)
+        self.last_missed = [blobs[index][0] for index in missing]
+
+        parsed = map_blobs(parse_func, [blobs[index] for index in missing], read_blob, jobs, chunk_size,
+                           batch_files=batch_files)
+        rows = []
+        for index, result in zip(missing, parsed):
+            results[index] = result
+            rows.append((kind, *blobs[index], pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)))
+        self._db.executemany("INSERT OR REPLACE INTO blobs VALUES (?, ?, ?, ?)", rows)
+
+        paths = {path for path, _ in blobs}
+        stale = [(kind, path, oid) for path, oid in stored if path in paths and (path, oid) not in requested]
+        self._db.executemany("DELETE FROM blobs WHERE kind = ? AND path = ? AND oid = ?", stale)
+        self._db.commit()
+        return results
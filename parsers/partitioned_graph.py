@@ -0,0 +1,347 @@
+# parsers/partitioned_graph.py
+
+import os
+import re
+from array import array
+from parsers.compact_graph import CompactGraph, NODE_SEPARATOR, NO_STRING, METHOD_KIND
+from parsers.graph_snapshot import save_snapshot, load_snapshot
+from parsers.unity_model import UnityProjectModel, parse_unity_file
+from parsers.parallel_parse import map_files
+from parsers.deep_ui_parser import parse_ui_connections
+from parsers.ui_reachability_analyzer import ENTRY_KEYWORDS
+from parsers.dead_ui_report import NO_ENTRY_NODES, UNREFERENCED, DEAD_REFERRERS
+
+DEFAULT_PARTITION_DIR = 'outputs/.partitions'
+PARSE_BATCH_FILES = 512  # files parsed, turned into graph data and dropped at a time
+PARTITION_FILE_PATTERN = re.compile(r'^\d+\.(uigraph|origins|out|in|boundary|referred)$')
+OUTGOING_FIELDS = 3  # source node, target label string id, whether the target is a handler method
+BOUNDARY_FIELDS = 3  # source node, target partition, target node of a resolved boundary edge
+SPILL_INTS = 1 << 16  # resolved boundary ints buffered before they are appended to their partitions' files
+
+
+def _expand(offsets, targets, origin_part, origin_node, seeds):
+    """
+    BFS inside one partition from seeds, (node, origin partition, origin node) triples,
+    skipping nodes an earlier visit already reached. Returns the newly reached nodes.
+    """
+    queue = []
+    for node, part, origin in seeds:
+        if origin_part[node] < 0:
+            origin_part[node], origin_node[node] = part, origin
+            queue.append(node)
+    for node in queue:  # queue grows while iterating
+        part, origin = origin_part[node], origin_node[node]
+        for w in targets[offsets[node]:offsets[node + 1]]:
+            if origin_part[w] < 0:
+                origin_part[w], origin_node[w] = part, origin
+                queue.append(w)
+    return queue
+
+
+class PartitionedGraph:
+    """
+    A navigation graph too large for memory, kept as one compact_graph.CompactGraph
+    per file label (one scene or prefab; files sharing a name share a partition, as
+    they share node labels in the single graph) plus one for nodes without a file
+    part, such as handler methods. Partitions are spilled to directory as .uigraph
+    snapshots (with their reachability origins next to them) and at most one is
+    loaded at a time; partition files an earlier run left in directory are removed.
+
+    Building: add_parse_result() per file, then finish(). An edge whose ends are in
+    different partitions (a boundary edge) is first kept with its source partition, as
+    the source node and the target's label interned there, and spilled with it. finish()
+    streams those edges to their target partitions and resolves the labels there, one
+    partition at a time, spilling each resolved edge back next to its source partition
+    (.boundary) and marking its target as referred to (.referred). reach() runs BFS
+    partition by partition and reads a partition's boundary edges only while expanding
+    it, carrying the nodes reached across them over to the next visit of their
+    partition. Only those reached nodes stay in memory between visits, so peak memory
+    is bounded by the largest partition rather than the whole project.
+    """
+
+    def __init__(self, directory=DEFAULT_PARTITION_DIR):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self.remove(PARTITION_FILE_PATTERN)
+        self.keys = []  # file label (None for nodes without one) of each partition
+        self.partition_ids = {}
+        self.node_counts = array('i')
+        self.edge_counts = array('i')
+        self.boundary_count = 0
+        self.entry_labels = {}  # (partition, node) -> label of every entry node, set by reach()
+        self.reachable_count = None
+        self._open_part = None
+        self._open_graph = None
+        self._outgoing = None  # OUTGOING_FIELDS ints per boundary edge leaving the open partition
+        self._outgoing_keys = None  # (source << 32) | label string id of each, built on first use
+        self._dirty = False
+
+    # --- Partitions on disk ---
+
+    def _path(self, part, suffix='.uigraph'):
+        return os.path.join(self.directory, f"{part}{suffix}")
+
+    def _read_ints(self, part, suffix):
+        ints = array('i')
+        path = self._path(part, suffix)
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                ints.frombytes(f.read())
+        return ints
+
+    def _write_ints(self, part, suffix, *arrays, mode='wb'):
+        with open(self._path(part, suffix), mode) as f:
+            for ints in arrays:
+                ints.tofile(f)
+
+    def _append_boundary(self, resolved):
+        """Append resolved boundary edges, {source partition: BOUNDARY_FIELDS ints per edge}, to their files."""
+        for part, ints in resolved.items():
+            self._write_ints(part, '.boundary', ints, mode='ab')
+
+    def _partition_of(self, label):
+        file_label, separator, _ = label.partition(NODE_SEPARATOR)
+        key = file_label if separator else None
+        part = self.partition_ids.get(key)
+        if part is None:
+            part = self.partition_ids[key] = len(self.keys)
+            self.keys.append(key)
+            self.node_counts.append(0)
+            self.edge_counts.append(0)
+        return part
+
+    def _spill(self):
+        if self._open_graph is not None and self._dirty:
+            save_snapshot(self._open_graph, self._path(self._open_part), verbose=False)
+            if self._outgoing:
+                self._write_ints(self._open_part, '.out', self._outgoing)
+            self.node_counts[self._open_part] = self._open_graph.number_of_nodes()
+            self.edge_counts[self._open_part] = self._open_graph.number_of_edges()
+        self._dirty = False
+
+    def _open(self, part):
+        """The partition's graph, loading it and spilling the previously open one if needed."""
+        if part != self._open_part:
+            self._spill()
+            path = self._path(part)
+            self._open_graph = load_snapshot(path) if os.path.exists(path) else CompactGraph()
+            self._outgoing = self._read_ints(part, '.out')
+            self._outgoing_keys = None
+            self._open_part = part
+        return self._open_graph
+
+    def _close(self):
+        self._spill()
+        self._open_part = self._open_graph = self._outgoing = self._outgoing_keys = None
+
+    def partition(self, part):
+        """Load one finished partition read-only."""
+        self._spill()
+        path = self._path(part)
+        return load_snapshot(path) if os.path.exists(path) else CompactGraph()
+
+    def _load_origins(self, part):
+        count = self.node_counts[part]
+        origins = self._read_ints(part, '.origins')
+        if not origins:
+            origins = array('i', [-1]) * (2 * count)
+        return origins[:count], origins[count:]
+
+    def _save_origins(self, part, origin_part, origin_node):
+        self._write_ints(part, '.origins', origin_part, origin_node)
+
+    # --- Building ---
+
+    def _add_outgoing(self, source, target_label, method_target):
+        """Keep a boundary edge of the open partition, once, until finish() resolves its target."""
+        outgoing = self._outgoing
+        if self._outgoing_keys is None:
+            self._outgoing_keys = {(outgoing[i] << 32) | outgoing[i + 1]
+                                   for i in range(0, len(outgoing), OUTGOING_FIELDS)}
+        label_sid = self._open_graph.strings.intern(target_label)
+        key = (source << 32) | label_sid
+        if key not in self._outgoing_keys:
+            self._outgoing_keys.add(key)
+            outgoing.extend((source, label_sid, int(method_target)))
+
+    def add_parse_result(self, nodes, edges, details=()):
+        """Same contract as CompactGraph.add_parse_result."""
+        for label, node_details in zip(nodes, details):
+            graph = self._open(self._partition_of(label))
+            graph.set_details(graph.add_label(label), *node_details)
+            self._dirty = True
+        for label in nodes[len(details):]:
+            self._open(self._partition_of(label)).add_label(label)
+            self._dirty = True
+        for edge in edges:
+            src, dst = edge[0], edge[1]
+            src_part, dst_part = self._partition_of(src), self._partition_of(dst)
+            graph = self._open(src_part)
+            self._dirty = True
+            if src_part == dst_part:
+                target = graph.add_label(dst)
+                if details and graph.node_file[target] == NO_STRING:
+                    graph.set_details(target, kind=METHOD_KIND)
+                graph.add_edge(graph.add_label(src), target)
+            else:
+                self._add_outgoing(graph.add_label(src), dst, bool(details))
+
+    def finish(self):
+        """
+        Resolve every boundary edge into its target partition. Each partition's outgoing
+        edges are appended to per-target files (.in) as labels, then every target
+        partition is loaded once to turn its incoming labels into node ids, appended in
+        batches of SPILL_INTS to their source partitions' .boundary files.
+        """
+        self._close()
+        for part in range(self.number_of_partitions()):
+            outgoing = self._read_ints(part, '.out')
+            if not outgoing:
+                continue
+            strings = self.partition(part).strings
+            lines = {}
+            for i in range(0, len(outgoing), OUTGOING_FIELDS):
+                label = strings[outgoing[i + 1]]
+                lines.setdefault(self._partition_of(label), []).append(
+                    f"{part}\t{outgoing[i]}\t{outgoing[i + 2]}\t{label}\n")
+            for target, target_lines in lines.items():
+                with open(self._path(target, '.in'), 'a', encoding='utf-8', errors='surrogateescape') as f:
+                    f.writelines(target_lines)
+            os.remove(self._path(part, '.out'))
+
+        for part in range(self.number_of_partitions()):  # including target-only partitions added above
+            path = self._path(part, '.in')
+            if not os.path.exists(path):
+                continue
+            graph = self._open(part)
+            referred = set()
+            resolved, buffered = {}, 0
+            with open(path, encoding='utf-8', errors='surrogateescape') as f:
+                for line in f:
+                    src_part, src, method_target, label = line.rstrip('\n').split('\t', 3)
+                    node = graph.add_label(label)
+                    if method_target == '1' and graph.node_file[node] == NO_STRING:
+                        graph.set_details(node, kind=METHOD_KIND)
+                    referred.add(node)
+                    resolved.setdefault(int(src_part), array('i')).extend((int(src), part, node))
+                    self.boundary_count += 1
+                    buffered += BOUNDARY_FIELDS
+                    if buffered >= SPILL_INTS:
+                        self._append_boundary(resolved)
+                        resolved, buffered = {}, 0
+            self._append_boundary(resolved)
+            self._write_ints(part, '.referred', array('i', sorted(referred)))
+            self._dirty = True
+            os.remove(path)
+        self._close()
+        return self
+
+    # --- Queries ---
+
+    def number_of_partitions(self):
+        return len(self.keys)
+
+    def number_of_nodes(self):
+        return sum(self.node_counts)
+
+    def number_of_edges(self):
+        return sum(self.edge_counts) + self.boundary_count
+
+    def reach(self, entry_keywords=ENTRY_KEYWORDS):
+        """
+        Reachability from the entry nodes, one partition at a time. The first round visits
+        every partition once, starting from its entry nodes; later rounds revisit only
+        partitions that boundary edges reached new nodes in. The (partition, node) origin
+        of every reached node is spilled next to its partition. A boundary edge is followed
+        once, in the visit that reaches its source. Returns (reachable, dead) node counts.
+        """
+        self.remove(re.compile(r'^\d+\.origins$'))
+        frontier = {}
+        self.entry_labels = {}
+        self.reachable_count = 0
+        parts = range(self.number_of_partitions())
+        first_round = True
+        while parts:
+            for part in parts:
+                seeds = frontier.pop(part, [])
+                graph = self.partition(part)
+                if first_round:
+                    for node in graph.entry_node_ids(entry_keywords):
+                        self.entry_labels[part, node] = graph.node_label(node)
+                        seeds.append((node, part, node))
+                if not seeds:
+                    continue
+                origin_part, origin_node = self._load_origins(part)
+                offsets, targets = graph.csr()
+                reached = _expand(offsets, targets, origin_part, origin_node, seeds)
+                if not reached:
+                    continue
+                self.reachable_count += len(reached)
+                self._save_origins(part, origin_part, origin_node)
+                boundary = self._read_ints(part, '.boundary')
+                if not boundary:
+                    continue
+                newly_reached = bytearray(len(origin_part))
+                for node in reached:
+                    newly_reached[node] = 1
+                for i in range(0, len(boundary), BOUNDARY_FIELDS):
+                    src = boundary[i]
+                    if newly_reached[src]:
+                        frontier.setdefault(boundary[i + 1], []).append(
+                            (boundary[i + 2], origin_part[src], origin_node[src]))
+            first_round = False
+            parts = sorted(frontier)
+        return self.reachable_count, self.number_of_nodes() - self.reachable_count
+
+    def iter_report_rows(self):
+        """
+        dead_ui_report.iter_report_rows for the partitioned graph after reach(): one row per
+        node, partition by partition, as tuples in REPORT_FIELDS order.
+        """
+        no_entries = not self.entry_labels
+        for part in range(self.number_of_partitions()):
+            graph = self.partition(part)
+            origin_part, origin_node = self._load_origins(part)
+            has_referrer = bytearray(graph.number_of_nodes())
+            for dst in graph.edge_dst:
+                has_referrer[dst] = 1
+            for dst in self._read_ints(part, '.referred'):
+                has_referrer[dst] = 1
+            label = graph.node_label
+            for node in range(graph.number_of_nodes()):
+                source_file, component_type, file_id = graph.node_details(node)
+                if origin_part[node] >= 0:
+                    yield (label(node), 'reachable', source_file, component_type, file_id,
+                           self.entry_labels[origin_part[node], origin_node[node]], None)
+                else:
+                    reason = NO_ENTRY_NODES if no_entries else DEAD_REFERRERS if has_referrer[node] else UNREFERENCED
+                    yield label(node), 'dead', source_file, component_type, file_id, None, reason
+
+    def remove(self, pattern=PARTITION_FILE_PATTERN):
+        """Delete the partition files (or those matching pattern) from directory."""
+        for name in os.listdir(self.directory):
+            if pattern.match(name):
+                os.remove(os.path.join(self.directory, name))
+
+
+def build_partitioned_graph(unity_files, directory=DEFAULT_PARTITION_DIR, jobs=1, cache=None, script_index=None,
+                            batch_files=PARSE_BATCH_FILES, instrumentation=None):
+    """
+    deep_ui_parser.build_compact_navigation_graph as a PartitionedGraph: files are parsed
+    batch_files at a time and each batch's object model is dropped once its nodes and
+    edges are in their partitions, so the whole project is never in memory at once.
+    """
+    graph = PartitionedGraph(directory)
+    for start in range(0, len(unity_files), batch_files):
+        batch = unity_files[start:start + batch_files]
+        model = UnityProjectModel()
+        for unity_file in map_files(parse_unity_file, batch, jobs, cache=cache):
+            model.files[unity_file.path] = unity_file
+        if instrumentation is not None:
+            instrumentation.record_parse([model.files[path] for path in batch], cache)
+        for file in batch:
+            nodes, edges, details = parse_ui_connections(file, model, script_index)
+            graph.add_parse_result(nodes, edges, details)
+            if instrumentation is not None:
+                instrumentation.record_graph_output(file, len(nodes), len(edges))
+    return graph.finish()
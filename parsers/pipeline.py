@@ -0,0 +1,289 @@
+# parsers/pipeline.py
+
+import os
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from parsers.deep_ui_parser import build_compact_navigation_graph
+from parsers.asset_discovery import discover_assets
+from parsers.unity_model import UnityProjectModel
+from parsers.script_index import load_script_index, DEFAULT_INDEX_PATH
+from parsers.script_scanner import scan_scripts, link_script_transitions
+from parsers.ui_reachability_analyzer import ENTRY_KEYWORDS
+from parsers.dead_ui_report import iter_report_rows, write_report_rows
+from parsers.partitioned_graph import build_partitioned_graph, DEFAULT_PARTITION_DIR
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def peak_memory_mb():
+    """
+    High-water marks of resident memory in MB since process start, as (this process,
+    largest finished child process such as a parse worker). Neither ever goes down.
+    """
+    if resource is None:
+        return None
+    scale = 1 / (1 << 20) if sys.platform == 'darwin' else 1 / (1 << 10)  # bytes on macOS, KB elsewhere
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    return own * scale, children * scale
+
+
+class StageTimings:
+    """
+    Wall time of each pipeline stage and the process memory high-water mark after it,
+    printed as the stage finishes. The high-water mark is cumulative, so each stage also
+    records how much it raised it; a stage that stayed below an earlier stage's peak
+    shows +0. With trace_memory=True the Python heap peak of each stage on its own is
+    also measured with tracemalloc, which slows allocation-heavy stages down.
+    """
+
+    def __init__(self, verbose=True, trace_memory=False):
+        self.stages = []  # one dict per finished stage, in order
+        self.verbose = verbose
+        self.trace_memory = trace_memory
+
+    @contextmanager
+    def stage(self, name):
+        if self.trace_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+        before = peak_memory_mb()
+        start = time.perf_counter()
+        yield
+        seconds = time.perf_counter() - start
+        memory = peak_memory_mb()
+        record = {'stage': name, 'seconds': seconds,
+                  'process_peak_rss_mb': memory[0] if memory else None,
+                  'stage_peak_rss_growth_mb': memory[0] - before[0] if memory else None,
+                  'child_process_peak_rss_mb': memory[1] if memory else None}
+        if self.trace_memory:
+            record['traced_peak_mb'] = tracemalloc.get_traced_memory()[1] / (1 << 20)
+        self.stages.append(record)
+        if self.verbose:
+            traced = f"   traced {record['traced_peak_mb']:.1f} MB" if self.trace_memory else ""
+            print(f"⏱  {name:<8} {seconds:8.3f} s   {format_memory(memory, before)}{traced}")
+
+    def total_seconds(self):
+        return sum(record['seconds'] for record in self.stages)
+
+
+def format_memory(memory, before=None):
+    """Process high-water mark, how much the stage raised it (with before), and the child processes' one."""
+    if memory is None:
+        return "process peak n/a"
+    own, children = memory
+    text = f"process peak {own:.0f} MB"
+    if before is not None:
+        text += f" (+{own - before[0]:.0f} MB)"
+    return text + f"   child processes {children:.0f} MB" if children else text
+
+
+class UIPipeline:
+    """
+    The whole analysis of one project, fused in memory: discovery and parsing feed one
+    UnityProjectModel, the navigation graph is built from it as a CompactGraph, and
+    reachability, the report and the drawing all reuse that graph. Every step runs its
+    prerequisites on demand and at most once, so no stage writes a file for the next.
+    With scripts=True the project's C# scripts are scanned too, and the scene loads,
+    SetActive calls and event channels they contain are linked into the graph.
+    """
+
+    def __init__(self, project_root, entry_keywords=ENTRY_KEYWORDS, jobs=1, cache=None,
+                 rebuild_index=False, index_path=DEFAULT_INDEX_PATH, threads=1, timings=None, scripts=True,
+                 instrumentation=None):
+        self.project_root = project_root
+        self.entry_keywords = list(entry_keywords)
+        self.jobs = jobs
+        self.cache = cache
+        self.rebuild_index = rebuild_index
+        self.index_path = index_path
+        self.threads = threads
+        self.timings = timings if timings is not None else StageTimings()
+        self.instrumentation = instrumentation  # instrumentation.Instrumentation, or None to collect nothing
+        self.manifest = None
+        self.files = None
+        self.model = None
+        self.script_index = None
+        self.use_scripts = scripts
+        self.scripts = None  # script_scanner.ScriptFile per .cs file
+        self.graph = None
+        self.reachable_ids = None
+        self.dead_ids = None
+        self.parents = None  # BFS tree from the entry nodes, see ui_reachability_analyzer.bfs_tree
+        self.origins = None
+
+    def use_graph(self, graph):
+        """Start from an already built CompactGraph (e.g. a loaded snapshot) instead of scanning."""
+        self.graph = graph
+        self.reachable_ids = self.dead_ids = self.parents = self.origins = None
+        return self
+
+    def use_model(self, manifest, model, script_index, scripts):
+        """
+        Start from already discovered and parsed files (e.g. shared by batch.run_batch)
+        instead of scanning: manifest lists the project's files, model holds them parsed.
+        """
+        self.manifest, self.files, self.model = manifest, manifest.paths(), model
+        self.script_index, self.scripts = script_index, scripts
+        self.graph = self.reachable_ids = self.dead_ids = self.parents = self.origins = None
+        return self
+
+    def discover(self):
+        if self.files is None:
+            with self.timings.stage('discover'):
+                self.manifest = discover_assets(self.project_root, threads=self.threads)
+                self.files = self.manifest.paths()
+                if self.cache is not None:
+                    self.cache.use_manifest(self.manifest)
+                self.script_index = load_script_index(self.project_root, self.index_path, rebuild=self.rebuild_index)
+            if self.instrumentation is not None:
+                self.instrumentation.record_discovery(self.manifest)
+        return self.files
+
+    def scan(self):
+        if self.model is None:
+            self.discover()
+            with self.timings.stage('parse'):
+                self.model = UnityProjectModel().parse_all(self.files, self.jobs, self.cache)
+            if self.instrumentation is not None:
+                self.instrumentation.record_parse([self.model.files[path] for path in self.files], self.cache)
+        return self.model
+
+    def scan_scripts(self):
+        if self.scripts is None:
+            with self.timings.stage('scripts'):
+                self.scripts = scan_scripts(self.project_root, self.jobs, self.cache, self.threads) \
+                    if self.use_scripts else []
+            if self.instrumentation is not None:
+                self.instrumentation.count('scripts', len(self.scripts))
+        return self.scripts
+
+    def build_graph(self):
+        if self.graph is None:
+            self.scan()
+            self.scan_scripts()
+            with self.timings.stage('graph'):
+                self.graph = build_compact_navigation_graph(self.files, model=self.model,
+                                                            script_index=self.script_index,
+                                                            instrumentation=self.instrumentation)
+                handlers = link_script_transitions(self.graph, self.model, self.script_index, self.scripts,
+                                                   self.project_root) if self.scripts else 0
+                self.graph.drop_lookups()
+            if self.instrumentation is not None:
+                self.instrumentation.count('script_handlers', handlers)
+                self.instrumentation.count('nodes', self.graph.number_of_nodes())
+                self.instrumentation.count('edges', self.graph.number_of_edges())
+        return self.graph
+
+    def reach(self):
+        if self.reachable_ids is None:
+            graph = self.build_graph()
+            with self.timings.stage('reach'):
+                entry_ids = graph.entry_node_ids(self.entry_keywords)
+                self.parents, self.origins = graph.reachability_tree(entry_ids)
+                self.reachable_ids = [i for i, origin in enumerate(self.origins) if origin >= 0]
+                self.dead_ids = [i for i, origin in enumerate(self.origins) if origin < 0]
+            if self.instrumentation is not None:
+                self.instrumentation.count('entry_nodes', len(entry_ids))
+                self.instrumentation.count('reachable', len(self.reachable_ids))
+                self.instrumentation.count('dead', len(self.dead_ids))
+        return self.reachable_ids, self.dead_ids
+
+    def reach_counts(self):
+        reachable_ids, dead_ids = self.reach()
+        return len(reachable_ids), len(dead_ids)
+
+    def query(self):
+        """A graph_query.GraphQuery over the graph, reusing the reachability already computed."""
+        from parsers.graph_query import GraphQuery
+
+        self.reach()
+        return GraphQuery(self.graph, self.entry_keywords, tree=(self.parents, self.origins))
+
+    def report(self, output_path, fmt=None):
+        """Write the dead UI report as CSV, JSON Lines, Parquet or Arrow (see dead_ui_report.report_format)."""
+        self.reach()
+        os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
+        with self.timings.stage('report'):
+            rows = write_report_rows(iter_report_rows(self.graph, self.origins), output_path, fmt)
+        if self.instrumentation is not None:
+            self.instrumentation.count('report_rows', rows)
+
+    def render(self, output_path):
+        from parsers.graph_render import render_graph
+
+        reachable_ids, _ = self.reach()
+        os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
+        with self.timings.stage('render'):
+            G = self.graph.to_networkx()
+            reachable = set(reachable_ids)
+            labels = [self.graph.node_label(i) for i in range(self.graph.number_of_nodes())]
+            colors = {label: 'lightgreen' if i in reachable else 'lightcoral' for i, label in enumerate(labels)}
+            entries = [labels[i] for i in self.graph.entry_node_ids(self.entry_keywords)]
+            render_graph(G, output_path, colors=colors, title="UI Navigation Graph: Reachable vs Dead UI",
+                         entry_nodes=entries)
+
+
+class PartitionedUIPipeline(UIPipeline):
+    """
+    UIPipeline for projects whose graph does not fit in memory. Files are parsed in
+    batches straight into a partitioned_graph.PartitionedGraph spilled to partition_dir,
+    one partition per scene or prefab, and reachability and the report run partition
+    by partition. C# script transitions need every file's objects at once, so they are
+    not linked here, and the graph can be neither rendered nor queried.
+    """
+
+    def __init__(self, project_root, partition_dir=DEFAULT_PARTITION_DIR, **options):
+        options['scripts'] = False
+        super().__init__(project_root, **options)
+        self.partition_dir = partition_dir
+        self.reachable_count = None
+        self.dead_count = None
+
+    def build_graph(self):
+        if self.graph is None:
+            self.discover()
+            with self.timings.stage('graph'):
+                self.graph = build_partitioned_graph(self.files, self.partition_dir, self.jobs, self.cache,
+                                                     self.script_index, instrumentation=self.instrumentation)
+            if self.instrumentation is not None:
+                self.instrumentation.count('partitions', self.graph.number_of_partitions())
+                self.instrumentation.count('boundary_edges', self.graph.boundary_count)
+                self.instrumentation.count('nodes', self.graph.number_of_nodes())
+                self.instrumentation.count('edges', self.graph.number_of_edges())
+        return self.graph
+
+    def reach(self):
+        """(reachable, dead) node counts; ids are not collected, they would span every partition."""
+        if self.reachable_count is None:
+            graph = self.build_graph()
+            with self.timings.stage('reach'):
+                self.reachable_count, self.dead_count = graph.reach(self.entry_keywords)
+            if self.instrumentation is not None:
+                self.instrumentation.count('entry_nodes', len(graph.entry_labels))
+                self.instrumentation.count('reachable', self.reachable_count)
+                self.instrumentation.count('dead', self.dead_count)
+        return self.reachable_count, self.dead_count
+
+    def reach_counts(self):
+        return self.reach()
+
+    def report(self, output_path, fmt=None):
+        self.reach()
+        os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
+        with self.timings.stage('report'):
+            rows = write_report_rows(self.graph.iter_report_rows(), output_path, fmt)
+        if self.instrumentation is not None:
+            self.instrumentation.count('report_rows', rows)
+
+    def query(self):
+        raise ValueError("querying needs the whole graph in memory; run without partitioning")
+
+    def render(self, output_path):
+        raise ValueError("rendering needs the whole graph in memory; run without partitioning")
@@ -0,0 +1,163 @@
+# parsers/reference_resolver.py
+
+import os
+from parsers.unity_model import UnityProjectModel, GameObject, StrippedObject, PrefabInstance, Button
+from parsers.script_index import read_meta_guid
+from parsers.asset_discovery import find_unity_files
+
+MAX_PREFAB_DEPTH = 32  # guards against reference cycles in broken projects
+
+
+class ReferenceResolver:
+    """
+    Global (asset GUID, fileID) -> object index over scenes and prefabs.
+    Asset GUIDs come from the .meta file next to each asset; objects are looked up
+    through a UnityProjectModel, so every file is still parsed at most once.
+    Stripped prefab-instance objects are followed to the object they stand for in
+    the source prefab, through any number of nesting levels.
+    """
+
+    def __init__(self, model=None, project_root=None):
+        self.model = model if model is not None else UnityProjectModel()
+        self.path_by_guid = {}
+        self.guid_by_path = {}
+        paths = list(self.model.files)
+        if project_root is not None:
+            paths.extend(find_unity_files(project_root))
+        for path in paths:
+            self._register(path)
+
+    def _register(self, path):
+        if path in self.guid_by_path:
+            return
+        meta_path = path + '.meta'
+        guid = read_meta_guid(meta_path) if os.path.exists(meta_path) else None
+        self.guid_by_path[path] = guid
+        if guid:
+            self.path_by_guid[guid] = path
+
+    def _file(self, path):
+        self._register(path)
+        return self.model.get(path)
+
+    def resolve(self, file_path, file_id, guid=None):
+        """Return (path, record) of the real object a reference points at, or None."""
+        if not file_id:
+            return None
+        path = file_path if guid is None else self.path_by_guid.get(guid)
+        for _ in range(MAX_PREFAB_DEPTH):
+            if path is None:
+                return None
+            obj = self._file(path).objects.get(file_id)
+            if not isinstance(obj, StrippedObject):
+                return (path, obj) if obj is not None else None
+            path, file_id = self.path_by_guid.get(obj.source_guid), obj.source_file_id
+        return None
+
+    def resolve_game_object(self, file_path, file_id, guid=None):
+        """Like resolve(), but components are replaced by the GameObject that owns them."""
+        resolved = self.resolve(file_path, file_id, guid)
+        if resolved is None:
+            return None
+        path, obj = resolved
+        if isinstance(obj, GameObject):
+            return resolved
+        return self.resolve(path, obj.game_object_id)
+
+    def label(self, file_path, file_id, guid=None):
+        """Graph node label "file::GameObjectName" of a reference, or None if unresolved."""
+        resolved = self.resolve_game_object(file_path, file_id, guid)
+        if resolved is None or not resolved[1].name:
+            return None
+        path, obj = resolved
+        return f"{os.path.basename(path)}::{obj.name}"
+
+    def call_target_label(self, file_path, call):
+        """Node label of a unity_model.PersistentCall's m_Target."""
+        return self.label(file_path, call.target_file_id, call.target_guid)
+
+    def root_game_object(self, path):
+        unity_file = self._file(path)
+        roots = unity_file.root_game_objects()
+        if roots:
+            return roots[0]
+        game_objects = unity_file.game_objects()
+        return game_objects[0] if game_objects else None
+
+    def prefab_instance_edges(self, file_path):
+        """
+        Edges linking each PrefabInstance in file_path to the root of its source prefab:
+        ("scene::<instance name>", "Source.prefab::<root name>").
+        """
+        edges = []
+        for instance in self._file(file_path).prefab_instances():
+            source_path = self.path_by_guid.get(instance.source_prefab_guid)
+            if source_path is None:
+                continue
+            root = self.root_game_object(source_path)
+            if root is None or not root.name:
+                continue
+            instance_name = instance.modified_name(root.file_id) or root.name
+            edges.append((f"{os.path.basename(file_path)}::{instance_name}",
+                          f"{os.path.basename(source_path)}::{root.name}"))
+        return edges
+
+    def prefab_call_edges(self, file_path):
+        """
+        m_OnClick calls that the PrefabInstances in file_path override on buttons of their
+        source prefabs, as ("Source.prefab::<button>", "file::<target>", method) edges. The
+        button's own calls are replayed with the overrides of every nesting level applied,
+        innermost first, so a target or method set in the scene or in an intermediate
+        prefab wins. Calls that no level overrides are left to the source prefab's own
+        edges; null or unresolved targets are dropped.
+        """
+        edges = []
+        for instance in self._file(file_path).prefab_instances():
+            for source_file_id, source_guid in instance.call_override_targets():
+                edges.extend(self._overridden_calls(file_path, instance, source_file_id, source_guid))
+        return edges
+
+    def _overridden_calls(self, file_path, instance, file_id, guid):
+        levels = [(file_path, instance.call_overrides(file_id))]  # outermost first
+        path = self.path_by_guid.get(guid) if guid else None
+        for _ in range(MAX_PREFAB_DEPTH):
+            if path is None:
+                return []
+            unity_file = self._file(path)
+            obj = unity_file.objects.get(file_id)
+            if not isinstance(obj, StrippedObject):
+                break
+            nested = unity_file.objects.get(obj.prefab_instance_id)
+            if isinstance(nested, PrefabInstance):
+                levels.append((path, nested.call_overrides(obj.source_file_id)))
+            path, file_id = self.path_by_guid.get(obj.source_guid), obj.source_file_id
+        else:
+            return []
+        if obj is None:
+            return []
+
+        # [file the target reference is relative to, target fileID, target guid, method, overridden]
+        calls = [[path, call.target_file_id, call.target_guid, call.method_name, False]
+                 for call in obj.persistent_calls] if isinstance(obj, Button) else []
+        for level_path, (size, overrides) in reversed(levels):
+            if size is not None:
+                del calls[size:]
+            for index, fields in sorted(overrides.items()):
+                while len(calls) <= index:
+                    calls.append([level_path, None, None, None, False])
+                call = calls[index]
+                if 'm_Target' in fields:
+                    call[0], (call[1], call[2]) = level_path, fields['m_Target']
+                if 'm_MethodName' in fields:
+                    call[3] = fields['m_MethodName']
+                call[4] = True
+
+        button = self.label(path, file_id)
+        edges = []
+        for target_path, target_file_id, target_guid, method, overridden in calls:
+            if not overridden or not method or button is None:
+                continue
+            target = self.label(target_path, target_file_id, target_guid)
+            if target is not None:
+                edges.append((button, target, method))
+        return edges
@@ -0,0 +1,209 @@
+# parsers/revision_diff.py
+
+import os
+from parsers.git_objects import GitRepository
+from parsers.asset_discovery import UNITY_ASSET_PATTERNS, select_paths
+from parsers.parallel_parse import map_blobs, BLOB_BATCH_FILES
+from parsers.unity_model import UnityProjectModel, parse_unity_blob
+from parsers.script_index import ScriptIndex, UI_TYPE_BY_CLASS, meta_guid, base_ui_type
+from parsers.deep_ui_parser import parse_ui_connections
+from parsers.compact_graph import CompactGraph
+from parsers.ui_reachability_analyzer import ENTRY_KEYWORDS
+from parsers.dead_ui_report import iter_report_rows, write_report_rows
+from parsers.pipeline import StageTimings
+
+DEFAULT_DIFF_REPORT = 'outputs/dead_ui_diff.csv'
+SCRIPT_META_PATTERNS = ('*.cs.meta',)
+# Changes to anything else cannot change the asset navigation graph
+RELEVANT_PATTERNS = UNITY_ASSET_PATTERNS + SCRIPT_META_PATTERNS + ('*.cs',)
+DIFF_FIELDS = ['element', 'change', 'base_status', 'status', 'source_file', 'component_type', 'file_id',
+               'reached_from', 'dead_reason']
+
+NEWLY_DEAD = 'newly dead'
+NEWLY_REACHABLE = 'newly reachable'
+ABSENT = 'absent'  # base_status of a node the head revision added
+
+
+def _path_batches(blobs, batch_files):
+    """Split sorted (path, blob id) pairs into batches of about batch_files, never splitting one path's versions."""
+    batch = []
+    for blob in blobs:
+        if len(batch) >= batch_files and blob[0] != batch[-1][0]:
+            yield batch
+            batch = []
+        batch.append(blob)
+    if batch:
+        yield batch
+
+
+def meta_guid_blob(blob):
+    return meta_guid(blob[1][:4096].decode('utf-8', errors='ignore'))
+
+
+def base_ui_type_blob(blob):
+    return base_ui_type(blob[1].decode('utf-8', errors='ignore'))
+
+
+class Revision:
+    """One side of a RevisionDiff: its commit, file tree, navigation graph and BFS origins."""
+
+    def __init__(self, name, commit, tree):
+        self.name = name
+        self.commit = commit
+        self.tree = tree  # project-relative path -> blob id
+        paths = sorted(tree)
+        self.unity_files = select_paths(paths)
+        self.script_metas = select_paths(paths, SCRIPT_META_PATTERNS)
+        # Scripts whose UI type depends on the class they derive from (see script_index._script_ui_type)
+        self.script_sources = [meta[:-len('.meta')] for meta in self.script_metas
+                               if os.path.basename(meta)[:-len('.cs.meta')] not in UI_TYPE_BY_CLASS
+                               and meta[:-len('.meta')] in tree]
+        self.graph = None
+        self.origins = None
+
+
+class RevisionDiff:
+    """
+    UI nodes that became dead or reachable between two git revisions of a project,
+    read from the local object store without checking either revision out.
+
+    Scenes, prefabs, script .meta files and scripts are parsed per (path, blob id), so
+    a file unchanged between the revisions is parsed once, and with a ParseCache not
+    at all after any earlier run has seen that version: the parse cost of a pull
+    request follows the size of its diff. If no scene, prefab, script or script .meta
+    file changed, nothing is read. The graphs compared are deep_ui_parser's asset
+    navigation graphs, classified by each revision's own script index; C# script
+    transitions are not linked in this mode.
+
+    Scenes and prefabs are read and parsed batch_files at a time, and each batch's object
+    model is dropped once both revisions' nodes and edges are taken from it, so memory
+    follows the two graphs rather than the size of the trees.
+    """
+
+    def __init__(self, project_root, base, head='HEAD', entry_keywords=ENTRY_KEYWORDS, jobs=1, cache=None,
+                 timings=None, batch_files=BLOB_BATCH_FILES):
+        self.project_root = project_root
+        self.batch_files = batch_files
+        self.names = (base, head)
+        self.entry_keywords = list(entry_keywords)
+        self.jobs = jobs
+        self.cache = cache
+        self.timings = timings if timings is not None else StageTimings()
+        self.repository = None
+        self.changed = None  # relevant project-relative paths that differ
+        self.revisions = None
+        self.newly_dead = 0
+        self.newly_reachable = 0
+
+    def _path(self, rel_path):
+        return os.path.join(self.project_root, *rel_path.split('/'))
+
+    def run(self):
+        if self.changed is not None:
+            return self
+        with self.timings.stage('git'):
+            repository = self.repository = GitRepository(self.project_root)
+            commits = [repository.resolve(name) for name in self.names]
+            self.changed = select_paths(repository.changed_paths(*commits), RELEVANT_PATTERNS)
+            if not self.changed:
+                return self
+            self.revisions = [Revision(name, commit, repository.list_tree(commit))
+                              for name, commit in zip(self.names, commits)]
+
+        with self.timings.stage('parse'):
+            with repository.blob_reader() as read_blob:
+                guids = self._map(meta_guid_blob, 'script_metas', read_blob)
+                base_types = self._map(base_ui_type_blob, 'script_sources', read_blob)
+                indexes = [self._script_index(revision, guids, base_types) for revision in self.revisions]
+                connections = self._connections(read_blob, indexes)
+
+        for revision, results in zip(self.revisions, connections):
+            with self.timings.stage(f"graph {revision.name}"):
+                # Same merge order as deep_ui_parser.build_compact_navigation_graph
+                graph = CompactGraph()
+                for rel_path in revision.unity_files:
+                    graph.add_parse_result(*results.pop(self._path(rel_path)))
+                revision.graph = graph.drop_lookups()
+            with self.timings.stage(f"reach {revision.name}"):
+                _, revision.origins = revision.graph.reachability_tree(
+                    revision.graph.entry_node_ids(self.entry_keywords))
+        return self
+
+    def _map(self, parse_func, selection, read_blob):
+        """{(path, blob id): result} for the selected files of both revisions, each version parsed once."""
+        blobs = sorted({(self._path(rel_path), revision.tree[rel_path])
+                        for revision in self.revisions for rel_path in getattr(revision, selection)})
+        return dict(zip(blobs, map_blobs(parse_func, blobs, read_blob, cache=self.cache)))
+
+    def _connections(self, read_blob, indexes):
+        """
+        deep_ui_parser.parse_ui_connections() of every scene and prefab version, as one
+        {path: (nodes, edges, details)} per revision, classified by that revision's index.
+        """
+        revisions_of = {}  # (path, blob id) -> indices of the revisions containing that version
+        for number, revision in enumerate(self.revisions):
+            for rel_path in revision.unity_files:
+                revisions_of.setdefault((self._path(rel_path), revision.tree[rel_path]), []).append(number)
+        connections = [{} for _ in self.revisions]
+        for batch in _path_batches(sorted(revisions_of), self.batch_files):
+            parsed = map_blobs(parse_unity_blob, batch, read_blob, self.jobs, cache=self.cache,
+                               batch_files=self.batch_files)
+            for blob, unity_file in zip(batch, parsed):
+                model = UnityProjectModel()
+                model.files[blob[0]] = unity_file
+                for number in revisions_of[blob]:
+                    connections[number][blob[0]] = parse_ui_connections(blob[0], model, indexes[number])
+        return connections
+
+    def _script_index(self, revision, guids, base_types):
+        """build_script_index() of a revision, from parsed blobs instead of the file system."""
+        index = ScriptIndex(root=os.path.abspath(self.project_root))
+        for meta in revision.script_metas:
+            guid = guids[self._path(meta), revision.tree[meta]]
+            if guid is None:
+                continue
+            script = meta[:-len('.meta')]
+            script_path = self._path(script)
+            class_name = os.path.basename(script)[:-len('.cs')]
+            ui_type = UI_TYPE_BY_CLASS.get(class_name)
+            if ui_type is None and script in revision.tree:
+                ui_type = base_types[script_path, revision.tree[script]]
+            index.add(guid, script_path, class_name, ui_type)
+        return index
+
+    def rows(self):
+        """
+        Head-revision report rows (see dead_ui_report.iter_report_rows) of the nodes whose
+        status changed, in DIFF_FIELDS order: dead nodes that were reachable or did not
+        exist in the base revision, and reachable nodes that were dead.
+        """
+        self.run()
+        self.newly_dead = self.newly_reachable = 0
+        if not self.changed:
+            return
+        base, head = self.revisions
+        label = base.graph.node_label
+        base_status = {label(node_id): 'reachable' if origin >= 0 else 'dead'
+                       for node_id, origin in enumerate(base.origins)}
+        for row in iter_report_rows(head.graph, head.origins):
+            before = base_status.get(row[0], ABSENT)
+            if row[1] == 'dead' and before != 'dead':
+                self.newly_dead += 1
+                change = NEWLY_DEAD
+            elif row[1] == 'reachable' and before == 'dead':
+                self.newly_reachable += 1
+                change = NEWLY_REACHABLE
+            else:
+                continue
+            yield (row[0], change, before) + row[1:]
+
+    def report(self, output_path, fmt=None):
+        """Write the changed rows as CSV, JSON Lines, Parquet or Arrow; returns the row count."""
+        self.run()
+        os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
+        with self.timings.stage('report'):
+            count = write_report_rows(self.rows(), output_path, fmt, DIFF_FIELDS)
+        base, head = self.names
+        print(f"🔀 {len(self.changed)} scene, prefab and script files changed between {base} and {head}: "
+              f"{self.newly_dead} newly dead, {self.newly_reachable} newly reachable UI nodes")
+        return count
@@ -0,0 +1,157 @@
+# parsers/script_index.py
+
+import os
+import re
+import json
+from parsers.asset_discovery import discover_assets
+
+DEFAULT_INDEX_PATH = 'outputs/.cache/script_index.json'
+CANVAS_CLASS_ID = 223
+
+# Unity UI scripts ship in the package cache rather than under Assets/, so their
+# well-known GUIDs are listed here instead of being discovered from .meta files.
+BUILTIN_UI_SCRIPTS = {
+    '4e29b1a8efbd4b44bb3f3716e73f07ff': 'Button',
+    '9085046f02f69544eb97fd06b6048fe2': 'Toggle',
+    '67db9e8f0e2ae9c40bc1e2b64352a6b4': 'Slider',
+    '0d0b652f32a2cc243917e4028fa0aed4': 'Dropdown',
+    '7b743370ac3e4ec2a1668f5455a8ef8a': 'TMP_Dropdown',
+    'd0b148fe25e99eb48b9724523833bab1': 'EventTrigger',
+}
+
+# Script class -> UI component type used for graph nodes and statistics
+UI_TYPE_BY_CLASS = {
+    'Button': 'Button',
+    'Toggle': 'Toggle',
+    'Slider': 'Slider',
+    'Dropdown': 'Dropdown',
+    'TMP_Dropdown': 'Dropdown',
+    'EventTrigger': 'EventTrigger',
+}
+
+META_GUID_PATTERN = re.compile(r'^guid: ([0-9a-fA-F]+)', re.MULTILINE)
+UI_BASE_CLASS_PATTERN = re.compile(
+    r'class\s+\w+\s*:\s*(?:UnityEngine\.UI\.|TMPro\.)?(' + '|'.join(UI_TYPE_BY_CLASS) + r')\b'
+)
+
+
+def read_meta_guid(meta_path):
+    with open(meta_path, 'r', encoding='utf-8', errors='ignore') as f:
+        return meta_guid(f.read(4096))
+
+
+def meta_guid(text):
+    match = META_GUID_PATTERN.search(text)
+    return match.group(1) if match else None
+
+
+def base_ui_type(source):
+    """UI type of the UI class a script's source derives from, or None."""
+    match = UI_BASE_CLASS_PATTERN.search(source)
+    return UI_TYPE_BY_CLASS[match.group(1)] if match else None
+
+
+def _script_ui_type(script_path, class_name):
+    """UI type of a project script: its own class name, or the UI class it derives from."""
+    if class_name in UI_TYPE_BY_CLASS:
+        return UI_TYPE_BY_CLASS[class_name]
+    try:
+        with open(script_path, 'r', encoding='utf-8', errors='ignore') as f:
+            return base_ui_type(f.read())
+    except OSError:
+        return None
+
+
+class ScriptIndex:
+    """
+    GUID -> (script path, class name, UI type) for every MonoBehaviour script.
+    Classifying a component is then a single dictionary lookup on its m_Script GUID.
+    sources holds the script_sources() the index was built from, to tell when it is stale.
+    """
+
+    def __init__(self, scripts=None, root=None, sources=None):
+        self.root = root
+        self.sources = sources
+        self.scripts = {}
+        self._ui_types = {}
+        for guid, class_name in BUILTIN_UI_SCRIPTS.items():
+            self.add(guid, None, class_name, UI_TYPE_BY_CLASS[class_name])
+        for guid, (path, class_name, ui_type) in (scripts or {}).items():
+            self.add(guid, path, class_name, ui_type)
+
+    def add(self, guid, path, class_name, ui_type=None):
+        self.scripts[guid] = (path, class_name, ui_type)
+        if ui_type:
+            self._ui_types[guid] = ui_type
+        else:
+            self._ui_types.pop(guid, None)
+
+    def class_name(self, guid):
+        entry = self.scripts.get(guid)
+        return entry[1] if entry else None
+
+    def ui_type(self, obj):
+        """UI component type of a unity_model record, or None if it is not a UI component."""
+        if obj.class_id == CANVAS_CLASS_ID:
+            return 'Canvas'
+        guid = getattr(obj, 'script_guid', None)
+        if guid is None:
+            return None
+        return self._ui_types.get(guid)
+
+    def save(self, index_path):
+        os.makedirs(os.path.dirname(index_path) or '.', exist_ok=True)
+        project_scripts = {guid: list(entry) for guid, entry in self.scripts.items() if guid not in BUILTIN_UI_SCRIPTS}
+        with open(index_path, 'w', encoding='utf-8') as f:
+            json.dump({'root': self.root, 'sources': self.sources, 'scripts': project_scripts}, f)
+
+    @classmethod
+    def load(cls, index_path):
+        with open(index_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return cls({guid: tuple(entry) for guid, entry in data['scripts'].items()}, data.get('root'),
+                   data.get('sources'))
+
+
+def script_sources(project_root):
+    """
+    {.cs.meta path relative to project_root: [mtime_ns, size, script mtime_ns or None]}
+    of every script, from one directory walk. A script added, removed or edited (its
+    base class may have changed) or a .meta file rewritten changes this signature.
+    """
+    manifest = discover_assets(project_root, include=('*.cs.meta', '*.cs'))
+    script_mtimes = {entry.path: entry.mtime_ns for entry in manifest if entry.path.endswith('.cs')}
+    return {os.path.relpath(entry.path, project_root): [entry.mtime_ns, entry.size,
+                                                         script_mtimes.get(entry.path[:-len('.meta')])]
+            for entry in manifest if entry.path.endswith('.cs.meta')}
+
+
+def build_script_index(project_root, sources=None):
+    """Read every .cs.meta file under project_root once and index its GUID."""
+    if sources is None:
+        sources = script_sources(project_root)
+    index = ScriptIndex(root=os.path.abspath(project_root), sources=sources)
+    for rel_path in sorted(sources):
+        meta_path = os.path.join(project_root, rel_path)
+        guid = read_meta_guid(meta_path)
+        if guid is None:
+            continue
+        script_path = meta_path[:-len('.meta')]
+        class_name = os.path.basename(script_path)[:-len('.cs')]
+        index.add(guid, script_path, class_name, _script_ui_type(script_path, class_name))
+    return index
+
+
+def load_script_index(project_root, index_path=DEFAULT_INDEX_PATH, rebuild=False):
+    """
+    Return the persisted index for project_root, building and saving it when it is
+    missing, was built for another root, or any script or .meta file changed since.
+    """
+    sources = script_sources(project_root)
+    if not rebuild and os.path.exists(index_path):
+        index = ScriptIndex.load(index_path)
+        if index.root == os.path.abspath(project_root) and index.sources == sources:
+            return index
+    index = build_script_index(project_root, sources)
+    index.save(index_path)
+    return index
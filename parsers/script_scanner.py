@@ -0,0 +1,376 @@
+# parsers/script_scanner.py
+
+import os
+import re
+from parsers.asset_discovery import discover_assets
+from parsers.parallel_parse import map_files
+from parsers.script_index import read_meta_guid
+from parsers.reference_resolver import ReferenceResolver
+from parsers.unity_model import GameObject, MonoBehaviour, Transform
+
+SCRIPT_PATTERNS = ('*.cs',)
+SCENE_NODE_NAME = '(scene)'
+CHANNEL_NODE_NAME = '(channel)'
+SCRIPTABLE_OBJECT_FILE_ID = 11400000  # main object of a ScriptableObject .asset
+
+# Comments are blanked out; strings are kept for arguments but masked for structure
+COMMENT_OR_STRING_PATTERN = re.compile(
+    r'//[^\n]*|/\*.*?\*/|@"(?:[^"]|"")*"|\$?"(?:\\.|[^"\\\n])*"|\'(?:\\.|[^\'\\\n])*\'', re.DOTALL
+)
+CLASS_PATTERN = re.compile(r'\b(?:class|struct)\s+(\w+)[^{;]*\{')
+METHOD_PATTERN = re.compile(
+    r'[\w\]>?]\s+(\w+)\s*(?:<[^<>(){};]*>)?\s*\(((?:[^(){};]|\([^(){};]*\))*)\)\s*(?:where\s[^{;]*)?(\{|=>)'
+)
+NOT_METHODS = {'if', 'for', 'foreach', 'while', 'switch', 'catch', 'using', 'lock', 'fixed', 'return',
+               'new', 'typeof', 'nameof', 'sizeof', 'default', 'when'}
+
+# Transitions inside a method body
+LOAD_SCENE_PATTERN = re.compile(r'\bLoadScene(?:Async)?\s*\(\s*(?:"([^"]*)"|(\d+)\b|([\w.]+))')
+SET_ACTIVE_PATTERN = re.compile(r'\b(\w+)(?:\.gameObject)?\.SetActive\s*\(\s*([^)]*?)\s*\)')
+RAISE_PATTERN = re.compile(r'\b(\w+)\??\.Raise(?:Event)?\s*\(')
+# Subscriptions anywhere in a class: `field.OnEventRaised += Handler;`, `field.onClick.AddListener(Handler)`
+SUBSCRIBE_PATTERN = re.compile(r'\b(\w+)\.\w+\s*\+=\s*(\w+)\s*;')
+ADD_LISTENER_PATTERN = re.compile(r'\b(\w+)(?:\.\w+)?\.AddListener\s*\(\s*(\w+)\s*\)')
+STRING_CONSTANT_PATTERN = re.compile(r'\b(\w+)\s*=\s*"([^"]*)"\s*;')
+
+SCENE, ACTIVATE, RAISE = 'scene', 'activate', 'raise'
+SELF = 'gameObject'
+BUILD_SCENE_PATTERN = re.compile(r'^\s*- enabled: (\d)\s*\r?\n\s*path: ([^\r\n]*)', re.MULTILINE)
+
+
+class ScriptClass:
+    """
+    What one C# class does, as far as navigation goes. methods maps a method name to its
+    (kind, target) transitions: (SCENE, scene name or build index), (ACTIVATE, field
+    name or SELF) and (RAISE, field name). listeners holds (field, handler method) pairs
+    for events the class subscribes to on the objects its fields refer to.
+    """
+    __slots__ = ('name', 'methods', 'listeners')
+
+    def __init__(self, name, methods=None, listeners=()):
+        self.name = name
+        self.methods = methods or {}
+        self.listeners = listeners
+
+
+class ScriptFile:
+    """The classes declared in one .cs file."""
+    __slots__ = ('path', 'classes')
+
+    def __init__(self, path, classes):
+        self.path = path
+        self.classes = classes
+
+    def main_class(self):
+        """The class Unity binds the script asset to: the one named like the file."""
+        name = os.path.basename(self.path)[:-len('.cs')]
+        for script_class in self.classes:
+            if script_class.name == name:
+                return script_class
+        return self.classes[0] if self.classes else None
+
+
+# --- Scanning ---
+
+def _mask(source):
+    """(code, masked): comments blanked in both, string contents also blanked in masked."""
+    code, masked = [], []
+    position = 0
+    for match in COMMENT_OR_STRING_PATTERN.finditer(source):
+        start, end = match.span()
+        code.append(source[position:start])
+        masked.append(source[position:start])
+        token = match.group()
+        if token.startswith('/'):
+            blank = re.sub(r'[^\n]', ' ', token)
+            code.append(blank)
+            masked.append(blank)
+        else:
+            code.append(token)
+            masked.append(token[0] + ' ' * (len(token) - 2) + token[-1])
+        position = end
+    code.append(source[position:])
+    masked.append(source[position:])
+    return ''.join(code), ''.join(masked)
+
+
+def _matching_braces(masked):
+    """Map the offset of every '{' to the offset of its '}', and give each '{' its depth."""
+    close_of, depth_of, stack = {}, {}, []
+    for match in re.finditer(r'[{}]', masked):
+        if match.group() == '{':
+            depth_of[match.start()] = len(stack)
+            stack.append(match.start())
+        elif stack:
+            close_of[stack.pop()] = match.start()
+    return close_of, depth_of
+
+
+def _method_transitions(body, constants):
+    transitions = []
+    for literal, build_index, identifier in LOAD_SCENE_PATTERN.findall(body):
+        scene = literal or (f"#{build_index}" if build_index else constants.get(identifier.rsplit('.', 1)[-1]))
+        if scene:
+            transitions.append((SCENE, scene))
+    for receiver, argument in SET_ACTIVE_PATTERN.findall(body):
+        if argument != 'false':
+            transitions.append((ACTIVATE, receiver))
+    for field in RAISE_PATTERN.findall(body):
+        transitions.append((RAISE, field))
+    return transitions
+
+
+def scan_script(script_path):
+    """
+    Scan one .cs file with regular expressions and brace matching only: no C# parser,
+    and no more than one pass of each pattern over the file.
+    """
+    with open(script_path, 'r', encoding='utf-8', errors='ignore') as f:
+        code, masked = _mask(f.read())
+    close_of, depth_of = _matching_braces(masked)
+
+    classes = []
+    for class_match in CLASS_PATTERN.finditer(masked):
+        open_brace = class_match.end() - 1
+        close_brace = close_of.get(open_brace, len(masked))
+        member_depth = depth_of.get(open_brace, 0) + 1
+        class_code = code[open_brace:close_brace]
+        constants = dict(STRING_CONSTANT_PATTERN.findall(class_code))
+
+        methods = {}
+        for method_match in METHOD_PATTERN.finditer(masked, open_brace, close_brace):
+            name = method_match.group(1)
+            if name in NOT_METHODS:
+                continue
+            if method_match.group(3) == '{':
+                body_start = method_match.end() - 1
+                if depth_of.get(body_start) != member_depth:
+                    continue  # local function, lambda or a nested class member
+                body_end = close_of.get(body_start, close_brace)
+            else:
+                body_start = method_match.end()
+                body_end = masked.find(';', body_start)
+                body_end = close_brace if body_end < 0 else body_end
+            transitions = _method_transitions(code[body_start:body_end], constants)
+            if transitions:
+                methods.setdefault(name, []).extend(transitions)
+
+        listeners = SUBSCRIBE_PATTERN.findall(class_code) + ADD_LISTENER_PATTERN.findall(class_code)
+        classes.append(ScriptClass(class_match.group(1), methods, tuple(listeners)))
+    return ScriptFile(script_path, classes)
+
+
+def find_scripts(project_root, threads=1):
+    """Paths of every Assets/**/*.cs file."""
+    return discover_assets(os.path.join(project_root, 'Assets'), include=SCRIPT_PATTERNS, threads=threads).paths()
+
+
+def scan_scripts(project_root, jobs=1, cache=None, threads=1):
+    """ScriptFile of every Assets/**/*.cs, scanned in parallel and cached like scenes and prefabs."""
+    return map_files(scan_script, find_scripts(project_root, threads), jobs, cache=cache)
+
+
+def build_scene_names(project_root):
+    """Scene names by build index, from the enabled scenes of ProjectSettings/EditorBuildSettings.asset."""
+    settings = os.path.join(project_root, 'ProjectSettings', 'EditorBuildSettings.asset')
+    try:
+        with open(settings, 'r', encoding='utf-8', errors='ignore') as f:
+            text = f.read()
+    except OSError:
+        return []
+    return [os.path.splitext(os.path.basename(path.strip()))[0]
+            for enabled, path in BUILD_SCENE_PATTERN.findall(text) if enabled == '1']
+
+
+# --- Linking into the navigation graph ---
+
+class ScriptLinker:
+    """
+    Adds the transitions found by scan_script() to a compact_graph.CompactGraph.
+
+    Method-name nodes are shared by every class, so transitions are attached to
+    handler nodes instead: one per (MonoBehaviour, method), labelled
+    "file::GameObject Class.Method()". A button whose m_OnClick calls a method with
+    transitions gets an edge to that handler; the handler then links to a scene node
+    (which links to every UI node of the scene), to the UI nodes under a GameObject it
+    activates, or to the event-channel asset it raises. Channels and UI objects link to
+    the handlers that subscribe to them.
+    """
+
+    def __init__(self, graph, model, script_index, resolver, scripts, project_root=None):
+        self.graph = graph
+        self.model = model
+        self.script_index = script_index
+        self.resolver = resolver
+        self.project_root = project_root
+        self.classes = {}  # script path -> main ScriptClass
+        for script in scripts:
+            main_class = script.main_class()
+            if main_class is not None and (main_class.methods or main_class.listeners):
+                self.classes[script.path] = main_class
+        self.build_scenes = build_scene_names(project_root) if project_root else []
+        self._handlers = {}
+        self._scene_nodes = {}
+        self._nodes_by_file = None
+        self._asset_paths = None
+        self._children = {}
+
+    def script_class(self, obj):
+        guid = getattr(obj, 'script_guid', None)
+        entry = self.script_index.scripts.get(guid) if guid else None
+        return self.classes.get(entry[0]) if entry and entry[0] else None
+
+    def link(self):
+        """Add every script edge; returns the number of handler nodes created."""
+        self.nodes_by_file()  # scene members are the UI nodes, not the handlers added below
+        instances = []
+        for path, unity_file in self.model.files.items():
+            for obj in unity_file.objects.values():
+                if isinstance(obj, MonoBehaviour):
+                    script_class = self.script_class(obj)
+                    if script_class is not None:
+                        instances.append((path, obj, script_class))
+
+        for path, obj, script_class in instances:
+            for field, handler in script_class.listeners:
+                if handler in script_class.methods:
+                    for source in self._field_nodes(path, obj, field):
+                        self.graph.add_edge(source, self.handler(path, obj, script_class, handler))
+
+        for path, unity_file in self.model.files.items():
+            for button in unity_file.buttons():
+                button_node = None
+                for call in button.persistent_calls:
+                    resolved = self.resolver.resolve(path, call.target_file_id, call.target_guid)
+                    if resolved is None:
+                        continue
+                    target_path, target = resolved
+                    script_class = self.script_class(target)
+                    if script_class is None or call.method_name not in script_class.methods:
+                        continue
+                    if button_node is None:
+                        button_node = self.graph.node_id(
+                            f"{os.path.basename(path)}::{unity_file.owner_name(button)}")
+                        if button_node is None:
+                            break
+                    self.graph.add_edge(button_node,
+                                        self.handler(target_path, target, script_class, call.method_name))
+        return len(self._handlers)
+
+    def handler(self, path, obj, script_class, method):
+        key = (path, obj.file_id, method)
+        node = self._handlers.get(key)
+        if node is not None:
+            return node
+        owner = self.model.get(path).owner_name(obj) or script_class.name
+        node = self._handlers[key] = self.graph.add_node(
+            os.path.basename(path), f"{owner} {script_class.name}.{method}()")
+        self.graph.set_details(node, path, 'handler', obj.file_id)
+        for kind, target in script_class.methods[method]:
+            if kind == SCENE:
+                scene_node = self.scene_node(target)
+                if scene_node is not None:
+                    self.graph.add_edge(node, scene_node)
+            elif kind == ACTIVATE:
+                if target == SELF:
+                    game_objects = [(path, self.model.get(path).objects.get(obj.game_object_id))]
+                else:
+                    game_objects = [self.resolver.resolve_game_object(path, file_id, guid)
+                                    for file_id, guid in obj.field_references(target)]
+                for resolved in game_objects:
+                    if resolved is not None and isinstance(resolved[1], GameObject):
+                        for ui_node in self.subtree_ui_nodes(*resolved):
+                            self.graph.add_edge(node, ui_node)
+            elif kind == RAISE:
+                for channel in self._field_nodes(path, obj, target):
+                    self.graph.add_edge(node, channel)
+        return node
+
+    def scene_node(self, scene):
+        if scene.startswith('#'):
+            index = int(scene[1:])
+            if index >= len(self.build_scenes):
+                return None
+            scene = self.build_scenes[index]
+        file_label = os.path.basename(scene)
+        if not file_label.endswith('.unity'):
+            file_label += '.unity'
+        node = self._scene_nodes.get(file_label)
+        if node is None:
+            members = self.nodes_by_file().get(file_label)
+            if not members:
+                return None  # not a scene of this project
+            node = self._scene_nodes[file_label] = self.graph.add_node(file_label, SCENE_NODE_NAME)
+            self.graph.set_details(node, kind='scene')
+            for member in members:
+                self.graph.add_edge(node, member)
+        return node
+
+    def nodes_by_file(self):
+        """UI node ids grouped by the file label of their scene or prefab."""
+        if self._nodes_by_file is None:
+            graph = self.graph
+            self._nodes_by_file = {}
+            for node_id, file_sid in enumerate(graph.node_file):
+                if file_sid >= 0:
+                    self._nodes_by_file.setdefault(graph.strings[file_sid], []).append(node_id)
+        return self._nodes_by_file
+
+    def subtree_ui_nodes(self, path, game_object):
+        """UI nodes of game_object and every GameObject below it in its file's hierarchy."""
+        unity_file = self.model.get(path)
+        children = self._children.get(path)
+        if children is None:
+            children = self._children[path] = {}
+            for obj in unity_file.objects.values():
+                if isinstance(obj, Transform) and obj.father_id:
+                    father = unity_file.objects.get(obj.father_id)
+                    if father is not None:
+                        children.setdefault(father.game_object_id, []).append(obj.game_object_id)
+        file_label = os.path.basename(path)
+        nodes, stack, seen = [], [game_object.file_id], set()
+        while stack:
+            game_object_id = stack.pop()
+            if game_object_id in seen:
+                continue
+            seen.add(game_object_id)
+            obj = unity_file.objects.get(game_object_id)
+            if obj is not None and obj.name:
+                node = self.graph.node_id(f"{file_label}::{obj.name}")
+                if node is not None:
+                    nodes.append(node)
+            stack.extend(children.get(game_object_id, ()))
+        return nodes
+
+    def _field_nodes(self, path, obj, field):
+        """Nodes for what a serialized field refers to: a channel asset, or a UI object already in the graph."""
+        nodes = []
+        for file_id, guid in obj.field_references(field):
+            if guid and file_id == SCRIPTABLE_OBJECT_FILE_ID and guid not in self.resolver.path_by_guid:
+                nodes.append(self.channel_node(guid))
+                continue
+            label = self.resolver.label(path, file_id, guid)
+            node = self.graph.node_id(label) if label else None
+            if node is not None:
+                nodes.append(node)
+        return nodes
+
+    def channel_node(self, guid):
+        if self._asset_paths is None:
+            self._asset_paths = {}
+            if self.project_root:
+                for meta_path in discover_assets(self.project_root, include=('*.asset.meta',)).paths():
+                    asset_guid = read_meta_guid(meta_path)
+                    if asset_guid:
+                        self._asset_paths[asset_guid] = meta_path[:-len('.meta')]
+        path = self._asset_paths.get(guid)
+        node = self.graph.add_node(os.path.basename(path) if path else guid, CHANNEL_NODE_NAME)
+        self.graph.set_details(node, path, 'channel', SCRIPTABLE_OBJECT_FILE_ID)
+        return node
+
+
+def link_script_transitions(graph, model, script_index, scripts, project_root=None, resolver=None):
+    """Link the scanned scripts' transitions into graph; returns the number of handler nodes added."""
+    if resolver is None:
+        resolver = ReferenceResolver(model)
+    return ScriptLinker(graph, model, script_index, resolver, scripts, project_root).link()
@@ -0,0 +1,33 @@
+# parsers/ui_analysis.py
+
+import csv
+
+UI_ANALYSIS_CSV = 'ui_analysis.csv'
+UI_ANALYSIS_FIELDS = ['file', 'ui_element_count', 'ui_element_types', 'file_type', 'directory_level']
+INT_FIELDS = ('ui_element_count', 'directory_level')
+
+
+def write_ui_analysis(rows, output_csv=UI_ANALYSIS_CSV):
+    with open(output_csv, 'w', newline='', encoding='utf-8') as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=UI_ANALYSIS_FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def read_ui_analysis(path=UI_ANALYSIS_CSV):
+    """Rows of a ui_analysis.csv as dicts, counts as ints; ui_element_types stays the written string."""
+    with open(path, newline='', encoding='utf-8') as csvfile:
+        rows = list(csv.DictReader(csvfile))
+    for row in rows:
+        for field in INT_FIELDS:
+            if row.get(field):
+                row[field] = int(row[field])
+    return rows
+
+
+def ui_analysis_files(path=UI_ANALYSIS_CSV, min_ui_elements=None):
+    """File paths listed in a ui_analysis.csv, in order; with min_ui_elements, only files with more UI elements."""
+    rows = read_ui_analysis(path)
+    if min_ui_elements is not None:
+        rows = [row for row in rows if (row.get('ui_element_count') or 0) > min_ui_elements]
+    return [row['file'] for row in rows]
@@ -1,33 +1,27 @@
 import os
-import yaml
-import networkx as nx
-import matplotlib.pyplot as plt
-import pandas as pd
+from parsers.unity_model import load_unity_file
+from parsers.ui_analysis import UI_ANALYSIS_CSV, ui_analysis_files
 
-def parse_ui_elements(filepath):
-    with open(filepath, 'r', encoding='utf-8') as f:
-        data = f.read()
-    
-    raw_objects = data.split('--- !u!')
+UI_WIDGETS = ['Button', 'Dropdown', 'Toggle', 'Slider']
+
+def parse_ui_elements(filepath, model=None):
     ui_objects = []
 
-    for obj in raw_objects:
-        if 'Button' in obj or 'Dropdown' in obj or 'Toggle' in obj or 'Slider' in obj:
-            lines = obj.splitlines()
-            for line in lines:
-                if 'm_Name:' in line:
-                    name = line.split(':',1)[1].strip()
-                    if name:
-                        ui_objects.append(name)
+    for obj in load_unity_file(filepath, model).objects.values():
+        if any(widget in obj.ui_components for widget in UI_WIDGETS):
+            if obj.name:
+                ui_objects.append(obj.name)
     return ui_objects
 
-def build_ui_graph(file_list):
+def build_ui_graph(file_list, model=None, instrumentation=None):
+    import networkx as nx
     G = nx.DiGraph()
     
     for filepath in file_list:
         filename = os.path.basename(filepath)
-        ui_objects = parse_ui_elements(filepath)
-        print(f"[DEBUG] {filename}: {len(ui_objects)} UI Objects")
+        ui_objects = parse_ui_elements(filepath, model)
+        if instrumentation is not None:
+            instrumentation.record_graph_output(filepath, len(ui_objects), 0)
 
         for obj in ui_objects:
             G.add_node(obj, file=filename)
@@ -37,9 +31,7 @@ def build_ui_graph(file_list):
     return G
 
 def visualize_graph(G, output_path='outputs/ui_graph_colored_v2.png'):
-    plt.figure(figsize=(20, 20))
-    pos = nx.spring_layout(G, seed=42)
-
+    from parsers.graph_render import render_graph, SPRING_LAYOUT_LIMIT
     reachable_nodes = set()
     for node in G.nodes:
         if G.in_degree(node) > 0 or G.out_degree(node) > 0:
@@ -52,6 +44,15 @@ def visualize_graph(G, output_path='outputs/ui_graph_colored_v2.png'):
         else:
             colors.append('lightcoral')
 
+    if G.number_of_nodes() > SPRING_LAYOUT_LIMIT:
+        render_graph(G, output_path, colors=dict(zip(G.nodes, colors)),
+                     title='UI Graph (Reachable vs Unreachable Nodes)')
+        return
+
+    import networkx as nx
+    import matplotlib.pyplot as plt
+    plt.figure(figsize=(20, 20))
+    pos = nx.spring_layout(G, seed=42)
     nx.draw_networkx_nodes(G, pos, node_color=colors, node_size=100)
     nx.draw_networkx_edges(G, pos, arrows=True, arrowstyle='->')
     nx.draw_networkx_labels(G, pos, font_size=8)
@@ -63,15 +64,14 @@ def visualize_graph(G, output_path='outputs/ui_graph_colored_v2.png'):
     print(f"\u2705 Colored graph saved to {output_path}")
 
 def export_graph_gephi(G, output_path='outputs/ui_graph_v2.gexf'):
+    import networkx as nx
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
     nx.write_gexf(G, output_path)
     print(f"\u2705 GEXF file for Gephi saved: {output_path}")
 
 if __name__ == "__main__":
     # Corrected: Read only UI files from analysis csv
-    df = pd.read_csv('ui_analysis.csv')
-    df_ui = df[df['ui_element_count'] > 0]
-    file_list = df_ui['file'].tolist()
+    file_list = ui_analysis_files(UI_ANALYSIS_CSV, min_ui_elements=0)
 
     G = build_ui_graph(file_list)
     visualize_graph(G)
@@ -1,48 +1,43 @@
 import os
-import yaml
-import csv
-import matplotlib.pyplot as plt
-import pandas as pd
-import networkx as nx
+import argparse
+from parsers.unity_model import UnityProjectModel, load_unity_file
+from parsers.asset_discovery import find_unity_files
+from parsers.parallel_parse import map_files
+from parsers.parse_cache import ParseCache, DEFAULT_CACHE_DIR
+from parsers.ui_reachability_analyzer import find_reachable_ui_nodes
+from parsers.script_index import load_script_index
+from parsers.ui_analysis import UI_ANALYSIS_CSV, write_ui_analysis, ui_analysis_files
+from parsers.compact_graph import CompactGraph
+from parsers.graph_snapshot import save_snapshot, export_graph
 
 # -----------------------------------
 # Phase 1: Identify UI Components
 # -----------------------------------
 
-UI_COMPONENTS = ['Button', 'Toggle', 'Dropdown', 'Slider', 'Canvas', 'EventTrigger']
+def ui_components_of(obj, script_index=None):
+    """UI component types of a unity_model record: by script GUID if an index is given, else by keyword."""
+    if script_index is None:
+        return obj.ui_components
+    ui_type = script_index.ui_type(obj)
+    return (ui_type,) if ui_type else ()
 
-TRANSITION_KEYWORDS = ['LoadScene', 'SetActive', 'Play', 'Trigger']
-
-def find_unity_files(folder):
-    unity_files = []
-    for root, dirs, files in os.walk(folder):
-        for file in files:
-            if file.endswith('.prefab') or file.endswith('.unity'):
-                full_path = os.path.join(root, file)
-                print(f"[DEBUG] Found Unity file: {full_path}")
-                unity_files.append(full_path)
-    return unity_files
-
-def parse_file_for_ui(filepath):
-    with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-        data = f.read()
-
-    raw_objects = data.split('--- !u!')
+def parse_file_for_ui(filepath, model=None, script_index=None):
     ui_elements = []
 
-    for obj in raw_objects:
-        for comp in UI_COMPONENTS:
-            if comp in obj:
-                ui_elements.append(comp)
+    for obj in load_unity_file(filepath, model).objects.values():
+        ui_elements.extend(ui_components_of(obj, script_index))
 
     return ui_elements
 
-def analyze_dataset(dataset_folder, output_csv='ui_analysis.csv'):
+def analyze_dataset(dataset_folder, output_csv=UI_ANALYSIS_CSV, model=None, jobs=1, cache=None,
+                    script_index=None):
     files = find_unity_files(dataset_folder)
     results = []
+    if model is not None:
+        model.parse_all(files, jobs, cache)
 
     for file in files:
-        ui_elements = parse_file_for_ui(file)
+        ui_elements = parse_file_for_ui(file, model, script_index)
         file_type = 'prefab' if file.endswith('.prefab') else 'unity'
         directory_level = len(os.path.relpath(file, dataset_folder).split(os.sep)) - 1
 
@@ -55,13 +50,7 @@ def analyze_dataset(dataset_folder, output_csv='ui_analysis.csv'):
                 'directory_level': directory_level
             })
 
-    with open(output_csv, 'w', newline='', encoding='utf-8') as csvfile:
-        fieldnames = ['file', 'ui_element_count', 'ui_element_types', 'file_type', 'directory_level']
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-
-        writer.writeheader()
-        for row in results:
-            writer.writerow(row)
+    write_ui_analysis(results, output_csv)
 
     print(f"Analysis complete! Found {len(results)} files with UI elements.")
 
@@ -69,43 +58,42 @@ def analyze_dataset(dataset_folder, output_csv='ui_analysis.csv'):
 # Phase 2: Build Graph from UI Files
 # -----------------------------------
 
-def parse_ui_nodes_and_edges(file_path):
+def parse_ui_nodes_and_edges(file_path, model=None, script_index=None):
     nodes = []
     edges = []
     file_label = os.path.basename(file_path)
 
-    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-        content = f.read()
+    for obj in load_unity_file(file_path, model).objects.values():
+        for comp in ui_components_of(obj, script_index):
+            node_name = f"{file_label}::{comp}"
+            nodes.append(node_name)
 
-    raw_objects = content.split('--- !u!')
+            for keyword in obj.transitions:
+                edges.append((node_name, f"{keyword}_Target"))
 
-    for obj in raw_objects:
-        for comp in UI_COMPONENTS:
-            if comp in obj:
-                node_name = f"{file_label}::{comp}"
-                nodes.append(node_name)
+    return nodes, edges
 
-                for keyword in TRANSITION_KEYWORDS:
-                    if keyword in obj:
-                        edges.append((node_name, f"{keyword}_Target"))
+def build_ui_graph(file_list, model=None, jobs=1, cache=None, script_index=None):
+    if script_index is not None and model is None:
+        model = UnityProjectModel()
 
-    return nodes, edges
+    if model is None:
+        # Workers return compact node/edge lists, merged below in file order
+        results = map_files(parse_ui_nodes_and_edges, file_list, jobs, cache=cache)
+    else:
+        model.parse_all(file_list, jobs, cache)
+        results = [parse_ui_nodes_and_edges(file, model, script_index) for file in file_list]
 
-def build_ui_graph(file_list):
+    import networkx as nx
     G = nx.DiGraph()
-    for file in file_list:
-        nodes, edges = parse_ui_nodes_and_edges(file)
+    for nodes, edges in results:
         G.add_nodes_from(nodes)
         G.add_edges_from(edges)
     return G
 
 def color_by_reachability(G, entry_keyword="MainMenu"):
     entry_nodes = [n for n in G.nodes if entry_keyword in n]
-    reachable = set()
-
-    for start in entry_nodes:
-        reachable |= nx.descendants(G, start)
-        reachable.add(start)
+    reachable = find_reachable_ui_nodes(G, entry_nodes)
 
     node_colors = []
     for node in G.nodes:
@@ -115,11 +103,18 @@ def color_by_reachability(G, entry_keyword="MainMenu"):
             node_colors.append("lightcoral")
     return node_colors
 
-def visualize_graph(G, output_path='outputs/ui_graph_colored.png'):
+def visualize_graph(G, output_path='outputs/ui_graph_colored.png', headless=False):
+    from parsers.graph_render import render_graph, SPRING_LAYOUT_LIMIT
+    node_colors = color_by_reachability(G)
+    if headless or G.number_of_nodes() > SPRING_LAYOUT_LIMIT:
+        render_graph(G, output_path, colors=dict(zip(G.nodes, node_colors)),
+                     title="UI Navigation Graph: Reachable vs Unreachable UI")
+        return
+
+    import networkx as nx
+    import matplotlib.pyplot as plt
     plt.figure(figsize=(24, 14))
     pos = nx.spring_layout(G, k=0.45, iterations=50)
-
-    node_colors = color_by_reachability(G)
     nx.draw(G, pos, with_labels=True, node_color=node_colors, edge_color="gray",
             node_size=500, font_size=7, arrows=True)
     plt.title("UI Navigation Graph: Reachable vs Unreachable UI")
@@ -132,21 +127,30 @@ def visualize_graph(G, output_path='outputs/ui_graph_colored.png'):
 # -----------------------------------
 
 if __name__ == "__main__":
-    dataset_folder = "datasets/open-project-1-main/"   # Adjust path as needed
-    analyze_dataset(dataset_folder)  # This creates ui_analysis.csv
-
-    df = pd.read_csv('ui_analysis.csv')
-    file_list = df['file'].tolist()
-
-    G = build_ui_graph(file_list)
-    visualize_graph(G)
-
-        # Save graph to GEXF
-    gexf_output_path = 'outputs/ui_graph.gexf'
-    nx.write_gexf(G, gexf_output_path)
-    print(f"✅ GEXF file for Gephi saved: {gexf_output_path}")
-
-    # (Optional) Save also to GraphML
-    graphml_output_path = 'outputs/ui_graph.graphml'
-    nx.write_graphml(G, graphml_output_path)
-    print(f"✅ GraphML file also saved: {graphml_output_path}")
+    parser = argparse.ArgumentParser(description="Identify Unity UI components and build the UI graph.")
+    parser.add_argument('dataset_folder', nargs='?', default="datasets/open-project-1-main/")
+    parser.add_argument('--jobs', type=int, default=1, help="Number of worker processes used for parsing")
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR, help="Directory of the persistent parse cache")
+    parser.add_argument('--no-cache', action='store_true', help="Reparse every file")
+    parser.add_argument('--hash', action='store_true', help="Also compare content hashes when mtime/size changed")
+    parser.add_argument('--headless', action='store_true', help="Render with the fast layered layout and don't open a window")
+    parser.add_argument('--export', nargs='*', choices=['gexf', 'graphml'], default=['gexf', 'graphml'],
+                        help="XML exports written next to the binary snapshot (none if given without values)")
+    args = parser.parse_args()
+    cache = None if args.no_cache else ParseCache(args.cache_dir, hash_contents=args.hash)
+    script_index = load_script_index(args.dataset_folder)
+
+    model = UnityProjectModel()  # Shared by both phases so each file is parsed once
+    analyze_dataset(args.dataset_folder, model=model, jobs=args.jobs, cache=cache,
+                    script_index=script_index)  # This creates ui_analysis.csv
+
+    file_list = ui_analysis_files(UI_ANALYSIS_CSV)
+
+    G = build_ui_graph(file_list, model, jobs=args.jobs, script_index=script_index)
+    if cache is not None:
+        cache.close()
+    visualize_graph(G, headless=args.headless)
+
+    # Binary snapshot for later stages; GEXF/GraphML for Gephi
+    save_snapshot(CompactGraph.from_networkx(G), 'outputs/ui_graph.uigraph')
+    export_graph(G, 'outputs/ui_graph', args.export)
@@ -0,0 +1,176 @@
+# parsers/ui_matcher.py
+
+import re
+import heapq
+from collections import namedtuple
+
+UI_COMPONENTS = ['Button', 'Toggle', 'Dropdown', 'Slider', 'Canvas', 'EventTrigger']
+INTERACTION_EVENTS = ['onClick', 'onValueChanged', 'onSelect', 'onDeselect']
+TRANSITION_KEYWORDS = ['LoadScene', 'SetActive', 'Play', 'Trigger']
+
+# YAML keys whose values the analyses need, matched at the start of a line
+FIELDS = ['m_Name', 'm_MethodName', 'm_Target', 'm_GameObject', 'm_Script', 'component', 'm_Father',
+          'm_CorrespondingSourceObject', 'm_PrefabInstance', 'm_SourcePrefab']
+
+KEYWORD_KINDS = {}
+for _kind, _keywords in (('ui_component', UI_COMPONENTS), ('event', INTERACTION_EVENTS),
+                         ('transition', TRANSITION_KEYWORDS)):
+    for _keyword in _keywords:
+        KEYWORD_KINDS[_keyword] = _kind
+
+# Longest keyword first; a consumed keyword also implies the keywords it contains
+# ("EventTrigger" -> "Trigger") so results match plain substring tests.
+KEYWORD_PATTERN = re.compile('|'.join(map(re.escape, sorted(KEYWORD_KINDS, key=len, reverse=True))))
+IMPLIED_KEYWORDS = {
+    keyword: tuple(other for other in KEYWORD_KINDS if other != keyword and other in keyword)
+    for keyword in KEYWORD_KINDS
+}
+FIELD_PATTERN = re.compile(
+    r'^[ \t]*(?:- )?(' + '|'.join(FIELDS) + r'):[ \t]*([^\r\n]*)',
+    re.MULTILINE,
+)
+FILE_ID_PATTERN = re.compile(r'fileID: (-?\d+)')
+GUID_PATTERN = re.compile(r'guid: ([0-9a-fA-F]+)')
+# One `m_Modifications` entry of a PrefabInstance: target, propertyPath, value and objectReference
+MODIFICATION_PATTERN = re.compile(
+    r'- target: \{([^}\r\n]*)\}[ \t]*\r?\n[ \t]*propertyPath: ([^\r\n]*)\r?\n[ \t]*value: ([^\r\n]*)'
+    r'(?:\r?\n[ \t]*objectReference: \{([^}\r\n]*)\})?'
+)
+# propertyPath of a modification overriding a Button's m_OnClick persistent calls
+CALL_OVERRIDE_PATTERN = re.compile(
+    r'^m_OnClick\.m_PersistentCalls\.m_Calls\.Array\.(?:size|data\[(\d+)\]\.(m_Target|m_MethodName))$'
+)
+
+# Top-level serialized object-reference fields of a MonoBehaviour (`  panel: {fileID: ...}`),
+# single or as list items; Unity's own m_ fields are skipped
+REFERENCE_PATTERN = re.compile(r'^  (?!m_)(\w+): \{(fileID: -?\d+[^}\r\n]*)\}', re.MULTILINE)
+REFERENCE_LIST_PATTERN = re.compile(r'^  (?!m_)(\w+):[ \t]*\r?\n((?:  - \{fileID: [^}\r\n]*\}[ \t]*\r?\n)+)',
+                                    re.MULTILINE)
+REFERENCE_ITEM_PATTERN = re.compile(r'\{(fileID: [^}\r\n]*)\}')
+
+Hit = namedtuple('Hit', ['offset', 'kind', 'value'])
+
+
+def _keyword_hits(text):
+    for match in KEYWORD_PATTERN.finditer(text):
+        keyword = match.group()
+        yield Hit(match.start(), KEYWORD_KINDS[keyword], keyword)
+        for implied in IMPLIED_KEYWORDS[keyword]:
+            yield Hit(match.start() + keyword.index(implied), KEYWORD_KINDS[implied], implied)
+
+
+def _field_hits(text):
+    for match in FIELD_PATTERN.finditer(text):
+        yield Hit(match.start(1), match.group(1), match.group(2).strip())
+
+
+def iter_hits(text):
+    """
+    Yield every keyword and field hit of a document in offset order.
+    Keyword hits have kind 'ui_component', 'event' or 'transition'; field hits use
+    the YAML key (e.g. 'm_Name') as kind and the stripped value as value.
+    """
+    return heapq.merge(_keyword_hits(text), _field_hits(text))
+
+
+class DocumentMatches:
+    """Everything the parsers read from one document, collected in a single scan."""
+    __slots__ = ('components', 'events', 'transitions', 'name', 'calls', 'game_object_id',
+                 'script_guid', 'component_ids', 'father_id', 'source_file_id', 'source_guid',
+                 'prefab_instance_id', 'source_prefab_guid')
+
+    def __init__(self):
+        self.components = ()
+        self.events = ()
+        self.transitions = ()
+        self.name = None
+        self.calls = []  # [raw_target, method_name] pairs in document order
+        self.game_object_id = None
+        self.script_guid = None
+        self.component_ids = []
+        self.father_id = None
+        self.source_file_id = None  # m_CorrespondingSourceObject of prefab instance objects
+        self.source_guid = None
+        self.prefab_instance_id = None
+        self.source_prefab_guid = None  # m_SourcePrefab of a PrefabInstance
+
+
+def parse_reference(value):
+    """Return (fileID, guid) of a `{fileID: ..., guid: ...}` reference; either may be None."""
+    file_id = FILE_ID_PATTERN.search(value)
+    guid = GUID_PATTERN.search(value)
+    return (int(file_id.group(1)) if file_id else None), (guid.group(1) if guid else None)
+
+
+def extract_modifications(text):
+    """
+    Return (target_file_id, target_guid, property_path, value, reference_file_id,
+    reference_guid) for each PrefabInstance modification; the reference is the
+    objectReference, (None, None) when the entry has none.
+    """
+    modifications = []
+    for target, property_path, value, reference in MODIFICATION_PATTERN.findall(text):
+        file_id, guid = parse_reference(target)
+        modifications.append((file_id, guid, property_path.strip(), value.strip()) + parse_reference(reference))
+    return modifications
+
+
+def extract_references(text):
+    """Return (field, fileID, guid) for each serialized object reference of a MonoBehaviour document."""
+    references = []
+    for field, value in REFERENCE_PATTERN.findall(text):
+        references.append((field,) + parse_reference(value))
+    for field, items in REFERENCE_LIST_PATTERN.findall(text):
+        for value in REFERENCE_ITEM_PATTERN.findall(items):
+            references.append((field,) + parse_reference(value))
+    return references
+
+
+def extract(text):
+    """
+    Collect keywords and field values of one document. Both patterns are precompiled
+    and run in C, so a document is scanned once per pattern regardless of how many
+    keywords there are.
+    """
+    result = DocumentMatches()
+
+    keywords = set(KEYWORD_PATTERN.findall(text))
+    if keywords:
+        for keyword in list(keywords):
+            keywords.update(IMPLIED_KEYWORDS[keyword])
+        result.components = tuple(k for k in UI_COMPONENTS if k in keywords)
+        result.events = tuple(k for k in INTERACTION_EVENTS if k in keywords)
+        result.transitions = tuple(k for k in TRANSITION_KEYWORDS if k in keywords)
+
+    calls = result.calls
+    for field, value in FIELD_PATTERN.findall(text):
+        if field == 'm_Name':
+            if result.name is None:
+                result.name = value.strip() or None
+        elif field == 'm_Target':
+            calls.append([value.strip().replace('"', ''), None])
+        elif field == 'm_MethodName':
+            method = value.strip().replace('"', '')
+            if calls and calls[-1][1] is None:
+                calls[-1][1] = method
+            else:
+                calls.append([None, method])
+        elif field == 'm_GameObject':
+            match = FILE_ID_PATTERN.search(value)
+            result.game_object_id = int(match.group(1)) if match else None
+        elif field == 'm_Script':
+            match = GUID_PATTERN.search(value)
+            result.script_guid = match.group(1) if match else None
+        elif field == 'component':
+            match = FILE_ID_PATTERN.search(value)
+            if match:
+                result.component_ids.append(int(match.group(1)))
+        elif field == 'm_Father':
+            result.father_id = parse_reference(value)[0]
+        elif field == 'm_CorrespondingSourceObject':
+            result.source_file_id, result.source_guid = parse_reference(value)
+        elif field == 'm_PrefabInstance':
+            result.prefab_instance_id = parse_reference(value)[0]
+        elif field == 'm_SourcePrefab':
+            result.source_prefab_guid = parse_reference(value)[1]
+    return result
@@ -1,38 +1,205 @@
 # parsers/ui_reachability_analyzer.py
 
-import networkx as nx
+from array import array
+
+# Naming heuristics for nodes the player can always reach
+ENTRY_KEYWORDS = ['Canvas', 'MainMenu', 'Persistent']
+
+def is_entry_node(node, keywords=ENTRY_KEYWORDS):
+    return any(keyword in node for keyword in keywords)
+
+def find_entry_nodes(G, keywords=ENTRY_KEYWORDS):
+    """
+    Return the nodes of G whose names match one of the entry keywords.
+    """
+    return [n for n in G.nodes if is_entry_node(n, keywords)]
+
+# --- Integer adjacency ---
+
+def build_csr(G):
+    """
+    Return (nodes, index, offsets, targets): G's adjacency as int32 CSR arrays, where the
+    successors of nodes[i] are targets[offsets[i]:offsets[i + 1]].
+    """
+    nodes = list(G.nodes)
+    index = {node: i for i, node in enumerate(nodes)}
+    offsets = array('i', [0])
+    targets = array('i')
+    adjacency = G.adj
+    for node in nodes:
+        targets.extend(index[v] for v in adjacency[node])
+        offsets.append(len(targets))
+    return nodes, index, offsets, targets
+
+def multi_source_bfs(offsets, targets, sources):
+    """
+    Visit everything reachable from any of the source indices in a single pass.
+    Returns a bytearray with 1 for every visited index.
+    """
+    visited = bytearray(len(offsets) - 1)
+    queue = []
+    for source in sources:
+        if not visited[source]:
+            visited[source] = 1
+            queue.append(source)
+    for node in queue:  # queue grows while iterating
+        for w in targets[offsets[node]:offsets[node + 1]]:
+            if not visited[w]:
+                visited[w] = 1
+                queue.append(w)
+    return visited
+
+def bfs_tree(offsets, targets, sources):
+    """
+    multi_source_bfs that also records how each index was reached. Returns int32
+    arrays (parent, origin): the BFS parent of every visited index and the source its
+    shortest path starts from. Sources have parent -1; unvisited indices have -1 in both.
+    """
+    parent = array('i', [-1]) * (len(offsets) - 1)
+    origin = array('i', [-1]) * (len(offsets) - 1)
+    queue = []
+    for source in sources:
+        if origin[source] < 0:
+            origin[source] = source
+            queue.append(source)
+    for node in queue:  # queue grows while iterating
+        start = origin[node]
+        for w in targets[offsets[node]:offsets[node + 1]]:
+            if origin[w] < 0:
+                origin[w] = start
+                parent[w] = node
+                queue.append(w)
+    return parent, origin
+
+def strongly_connected_components(offsets, targets):
+    """
+    Iterative Tarjan over CSR arrays. Returns (component, count) where component[i]
+    is the SCC id of node i; ids come out in reverse topological order.
+    """
+    n = len(offsets) - 1
+    order = [-1] * n
+    low = [0] * n
+    on_stack = bytearray(n)
+    component = array('i', [-1]) * n
+    stack = []
+    counter = 0
+    count = 0
+
+    for root in range(n):
+        if order[root] != -1:
+            continue
+        order[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = 1
+        work = [(root, offsets[root])]
+        while work:
+            v, pos = work[-1]
+            if pos < offsets[v + 1]:
+                work[-1] = (v, pos + 1)
+                w = targets[pos]
+                if order[w] == -1:
+                    order[w] = low[w] = counter
+                    counter += 1
+                    stack.append(w)
+                    on_stack[w] = 1
+                    work.append((w, offsets[w]))
+                elif on_stack[w] and order[w] < low[v]:
+                    low[v] = order[w]
+                continue
+
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                if low[v] < low[parent]:
+                    low[parent] = low[v]
+            if low[v] == order[v]:
+                while True:
+                    w = stack.pop()
+                    on_stack[w] = 0
+                    component[w] = count
+                    if w == v:
+                        break
+                count += 1
+
+    return component, count
+
+# --- Reachability ---
+
+def compute_reachability(G, entry_nodes):
+    """
+    Given a graph G and entry nodes, return (reachable, dead) from one multi-source BFS.
+    Entry nodes that are not in G are ignored.
+    """
+    nodes, index, offsets, targets = build_csr(G)
+    visited = multi_source_bfs(offsets, targets, [index[e] for e in entry_nodes if e in index])
+    reachable = set()
+    dead = set()
+    for node, seen in zip(nodes, visited):
+        (reachable if seen else dead).add(node)
+    return reachable, dead
+
+class ReachabilityIndex:
+    """
+    Precomputed condensation DAG of G's strongly connected components, for answering
+    many reachability queries against the same graph. Each query walks the (smaller)
+    DAG once and expands the reached components back to nodes.
+    """
+
+    def __init__(self, G):
+        self.nodes, self.index, offsets, targets = build_csr(G)
+        self.component, count = strongly_connected_components(offsets, targets)
+
+        self.members = [[] for _ in range(count)]
+        for i, c in enumerate(self.component):
+            self.members[c].append(i)
+
+        dag_offsets = array('i', [0])
+        dag_targets = array('i')
+        for c in range(count):
+            successors = set()
+            for i in self.members[c]:
+                successors.update(self.component[w] for w in targets[offsets[i]:offsets[i + 1]])
+            successors.discard(c)
+            dag_targets.extend(sorted(successors))
+            dag_offsets.append(len(dag_targets))
+        self.dag_offsets = dag_offsets
+        self.dag_targets = dag_targets
+
+    def query(self, entry_nodes):
+        """Return (reachable, dead) for the given entry nodes."""
+        sources = {self.component[self.index[e]] for e in entry_nodes if e in self.index}
+        visited = multi_source_bfs(self.dag_offsets, self.dag_targets, sorted(sources))
+        reachable = set()
+        dead = set()
+        for c, seen in enumerate(visited):
+            target = reachable if seen else dead
+            target.update(self.nodes[i] for i in self.members[c])
+        return reachable, dead
 
 def find_reachable_ui_nodes(G, entry_nodes):
     """
     Given a graph G and entry nodes, return all nodes reachable from those entries.
     """
-    reachable = set()
-    for entry in entry_nodes:
-        if G.has_node(entry):
-            reachable |= nx.descendants(G, entry)
-            reachable.add(entry)
-    return reachable
+    return compute_reachability(G, entry_nodes)[0]
 
 def find_dead_ui_nodes(G, entry_nodes):
     """
     Given a graph G and entry nodes, return nodes that are not reachable from those entries.
     """
-    all_nodes = set(G.nodes())
-    reachable = find_reachable_ui_nodes(G, entry_nodes)
-    return all_nodes - reachable
+    return compute_reachability(G, entry_nodes)[1]
 
 if __name__ == "__main__":
     import sys
+    from parsers.graph_snapshot import load_graph
+
     if len(sys.argv) < 3:
-        print("Usage: python ui_reachability_analyzer.py <gexf_file> <entry_node_index,...>")
+        print("Usage: python ui_reachability_analyzer.py <graph_file (.uigraph/.gexf/.graphml)> <entry_node,...>")
         exit(1)
 
-    gexf_path = sys.argv[1]
-    entry_nodes = sys.argv[2].split(',')
-
-    G = nx.read_gexf(gexf_path)
-    reachable = find_reachable_ui_nodes(G, entry_nodes)
-    dead = find_dead_ui_nodes(G, entry_nodes)
+    graph = load_graph(sys.argv[1])
+    entry_ids = [graph.node_id(label) for label in sys.argv[2].split(',')]
+    reachable, dead = graph.reachability([i for i in entry_ids if i is not None])
 
     print(f"Reachable UI nodes: {len(reachable)}")
     print(f"Dead UI nodes: {len(dead)}")
@@ -0,0 +1,162 @@
+# parsers/ui_watch.py
+
+import os
+import time
+import argparse
+from collections import Counter
+import networkx as nx
+from parsers.deep_ui_parser import parse_ui_connections
+from parsers.asset_discovery import discover_assets
+from parsers.ui_reachability_analyzer import ENTRY_KEYWORDS, is_entry_node, find_reachable_ui_nodes
+from parsers.script_index import load_script_index
+
+
+class IncrementalNavigationGraph:
+    """
+    The navigation graph of deep_ui_parser plus its reachable/dead sets, kept up to date
+    one file at a time. Each file's contributed nodes and edges are remembered and
+    reference-counted, since method nodes are shared between files.
+    """
+
+    def __init__(self, entry_keywords=ENTRY_KEYWORDS, script_index=None):
+        self.graph = nx.DiGraph()
+        self.entry_keywords = entry_keywords
+        self.script_index = script_index
+        self.contributions = {}  # path -> (nodes, edges)
+        self.reachable = set()
+        self.dead = set()
+        self._node_refs = Counter()
+        self._edge_refs = Counter()
+
+    def entry_nodes(self):
+        return [n for n in self.graph.nodes if is_entry_node(n, self.entry_keywords)]
+
+    def update_file(self, file_path):
+        """(Re)parse file_path and patch its nodes and edges into the graph."""
+        if os.path.exists(file_path):
+            nodes, edges, _ = parse_ui_connections(file_path, script_index=self.script_index)
+            self._replace(file_path, set(nodes) | {n for edge in edges for n in edge}, set(edges))
+        else:
+            self.remove_file(file_path)
+
+    def remove_file(self, file_path):
+        self._replace(file_path, set(), set())
+
+    def _replace(self, file_path, new_nodes, new_edges):
+        old_nodes, old_edges = self.contributions.pop(file_path, (set(), set()))
+        if new_nodes or new_edges:
+            self.contributions[file_path] = (new_nodes, new_edges)
+
+        removed_edges = []
+        for edge in old_edges - new_edges:
+            self._edge_refs[edge] -= 1
+            if not self._edge_refs[edge]:
+                del self._edge_refs[edge]
+                self.graph.remove_edge(*edge)
+                removed_edges.append(edge)
+        removed_nodes = []
+        for node in old_nodes - new_nodes:
+            self._node_refs[node] -= 1
+            if not self._node_refs[node]:
+                del self._node_refs[node]
+                self.graph.remove_node(node)
+                removed_nodes.append(node)
+
+        added_nodes = []
+        for node in new_nodes - old_nodes:
+            if not self._node_refs[node]:
+                self.graph.add_node(node)
+                added_nodes.append(node)
+            self._node_refs[node] += 1
+        added_edges = []
+        for edge in new_edges - old_edges:
+            if not self._edge_refs[edge]:
+                self.graph.add_edge(*edge)
+                added_edges.append(edge)
+            self._edge_refs[edge] += 1
+
+        self._update_reachability(removed_nodes, removed_edges, added_nodes, added_edges)
+
+    def _update_reachability(self, removed_nodes, removed_edges, added_nodes, added_edges):
+        # Losing a reachable entry or an edge out of the reachable set can shrink it;
+        # anything else only ever grows it, which a BFS from the new frontier covers.
+        shrinks = any(u in self.reachable for u, v in removed_edges) or \
+            any(n in self.reachable and is_entry_node(n, self.entry_keywords) for n in removed_nodes)
+        self.reachable.difference_update(removed_nodes)
+        self.dead.difference_update(removed_nodes)
+
+        if shrinks:
+            self.recompute()
+            return
+
+        frontier = [n for n in added_nodes if is_entry_node(n, self.entry_keywords)]
+        frontier += [v for u, v in added_edges if u in self.reachable and v not in self.reachable]
+        self.dead.update(n for n in added_nodes if n not in self.reachable)
+        while frontier:
+            node = frontier.pop()
+            if node in self.reachable:
+                continue
+            self.reachable.add(node)
+            self.dead.discard(node)
+            frontier.extend(v for v in self.graph.successors(node) if v not in self.reachable)
+
+    def recompute(self):
+        self.reachable = find_reachable_ui_nodes(self.graph, self.entry_nodes())
+        self.dead = set(self.graph.nodes) - self.reachable
+
+
+def snapshot_mtimes(root_folder):
+    return {entry.path: entry.mtime_ns for entry in discover_assets(root_folder)}
+
+
+def diff_snapshots(old, new):
+    """Return the paths that were added, modified or deleted between two snapshots."""
+    changed = [path for path, mtime in new.items() if old.get(path) != mtime]
+    deleted = [path for path in old if path not in new]
+    return changed + deleted
+
+
+def watch(root_folder, interval=1.0, on_update=None):
+    """
+    Build the navigation graph once, then poll root_folder every interval seconds and
+    patch in changed .prefab/.unity files. on_update(state, changed_paths, seconds)
+    is called after the initial build and after every batch of changes.
+    """
+    state = IncrementalNavigationGraph(script_index=load_script_index(root_folder))
+    mtimes = snapshot_mtimes(root_folder)
+    start = time.perf_counter()
+    for file_path in mtimes:
+        state.update_file(file_path)
+    state.recompute()
+    if on_update:
+        on_update(state, list(mtimes), time.perf_counter() - start)
+
+    while True:
+        time.sleep(interval)
+        current = snapshot_mtimes(root_folder)
+        changed = diff_snapshots(mtimes, current)
+        mtimes = current
+        if not changed:
+            continue
+        start = time.perf_counter()
+        for file_path in changed:
+            state.update_file(file_path)
+        if on_update:
+            on_update(state, changed, time.perf_counter() - start)
+
+
+def print_update(state, changed_paths, seconds):
+    print(f"🔄 {len(changed_paths)} file(s) updated in {seconds * 1000:.1f} ms: "
+          f"{state.graph.number_of_nodes()} nodes, {len(state.reachable)} reachable, "
+          f"{len(state.dead)} dead")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Watch a Unity project and keep the dead-UI set up to date.")
+    parser.add_argument('project_path', nargs='?', default="datasets/open-project-1-main/")
+    parser.add_argument('--interval', type=float, default=1.0, help="Polling interval in seconds")
+    args = parser.parse_args()
+    try:
+        watch(args.project_path, args.interval, on_update=print_update)
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,260 @@
+# parsers/unity_model.py
+
+import io
+import time
+from parsers.unity_yaml_scanner import iter_documents, read_documents
+from parsers.parallel_parse import map_files
+from parsers.ui_matcher import (
+    CALL_OVERRIDE_PATTERN, extract, extract_modifications, extract_references, parse_reference,
+)
+
+GAME_OBJECT_CLASS_ID = 1
+TRANSFORM_CLASS_IDS = (4, 224)  # Transform, RectTransform
+MONO_BEHAVIOUR_CLASS_ID = 114
+PREFAB_INSTANCE_CLASS_ID = 1001
+
+
+# --- Records ---
+
+class UnityObject:
+    """One `--- !u!` document of a Unity file, reduced to the fields the analyses use."""
+    __slots__ = ('file_id', 'class_id', 'name', 'game_object_id', 'ui_components', 'events',
+                 'transitions', 'persistent_calls')
+
+    def __init__(self, file_id, class_id, name=None, game_object_id=None, ui_components=(),
+                 events=(), transitions=(), persistent_calls=()):
+        self.file_id = file_id
+        self.class_id = class_id
+        self.name = name
+        self.game_object_id = game_object_id  # owning GameObject, for components
+        self.ui_components = ui_components
+        self.events = events
+        self.transitions = transitions
+        self.persistent_calls = persistent_calls
+
+    def method_names(self):
+        return [call.method_name for call in self.persistent_calls if call.method_name]
+
+    def __repr__(self):
+        return f"{type(self).__name__}(file_id={self.file_id}, name={self.name!r})"
+
+
+class GameObject(UnityObject):
+    __slots__ = ('component_ids',)
+
+    def __init__(self, file_id, class_id, component_ids=(), **fields):
+        super().__init__(file_id, class_id, **fields)
+        self.component_ids = component_ids
+
+
+class MonoBehaviour(UnityObject):
+    __slots__ = ('script_guid', 'references')
+
+    def __init__(self, file_id, class_id, script_guid=None, references=(), **fields):
+        super().__init__(file_id, class_id, **fields)
+        self.script_guid = script_guid
+        self.references = references  # (field, fileID, guid) of serialized object references
+
+    def field_references(self, field):
+        """(fileID, guid) of every object the serialized field refers to."""
+        return [(file_id, guid) for name, file_id, guid in self.references if name == field and file_id]
+
+
+class Button(MonoBehaviour):
+    """A MonoBehaviour carrying an `m_OnClick` persistent-call list."""
+    __slots__ = ()
+
+
+class Transform(UnityObject):
+    __slots__ = ('father_id',)
+
+    def __init__(self, file_id, class_id, father_id=None, **fields):
+        super().__init__(file_id, class_id, **fields)
+        self.father_id = father_id
+
+
+class StrippedObject(UnityObject):
+    """Placeholder for an object that lives in a source prefab (`--- !u!... stripped`)."""
+    __slots__ = ('source_file_id', 'source_guid', 'prefab_instance_id')
+
+    def __init__(self, file_id, class_id, source_file_id=None, source_guid=None,
+                 prefab_instance_id=None, **fields):
+        super().__init__(file_id, class_id, **fields)
+        self.source_file_id = source_file_id
+        self.source_guid = source_guid
+        self.prefab_instance_id = prefab_instance_id
+
+
+class PrefabInstance(UnityObject):
+    __slots__ = ('source_prefab_guid', 'modifications')
+
+    def __init__(self, file_id, class_id, source_prefab_guid=None, modifications=(), **fields):
+        super().__init__(file_id, class_id, **fields)
+        self.source_prefab_guid = source_prefab_guid
+        # (target_file_id, target_guid, property_path, value, reference_file_id, reference_guid)
+        self.modifications = modifications
+
+    def modified_name(self, source_file_id):
+        for file_id, _, property_path, value, _, _ in self.modifications:
+            if file_id == source_file_id and property_path == 'm_Name':
+                return value
+        return None
+
+    def call_override_targets(self):
+        """(fileID, guid) of each source object whose m_OnClick calls this instance overrides, in order."""
+        targets = {}
+        for file_id, guid, property_path, _, _, _ in self.modifications:
+            if CALL_OVERRIDE_PATTERN.match(property_path):
+                targets.setdefault((file_id, guid))
+        return list(targets)
+
+    def call_overrides(self, source_file_id):
+        """
+        m_OnClick overrides of one source object as (call count or None, {call index:
+        {'m_Target': (fileID, guid), 'm_MethodName': name}}), with only the fields overridden.
+        """
+        size, calls = None, {}
+        for file_id, _, property_path, value, reference_file_id, reference_guid in self.modifications:
+            match = CALL_OVERRIDE_PATTERN.match(property_path) if file_id == source_file_id else None
+            if match is None:
+                continue
+            index, field = match.groups()
+            if index is None:
+                size = int(value) if value.isdigit() else size
+            elif field == 'm_Target':
+                calls.setdefault(int(index), {})[field] = (reference_file_id, reference_guid)
+            else:
+                calls.setdefault(int(index), {})[field] = value.replace('"', '')
+        return size, calls
+
+
+class PersistentCall:
+    __slots__ = ('target_file_id', 'target_guid', 'raw_target', 'method_name')
+
+    def __init__(self, raw_target=None, method_name=None):
+        self.raw_target = raw_target
+        self.method_name = method_name
+        self.target_file_id = None
+        self.target_guid = None
+        if raw_target:
+            self.target_file_id, self.target_guid = parse_reference(raw_target)
+
+    def __repr__(self):
+        return f"PersistentCall({self.raw_target!r}, {self.method_name!r})"
+
+
+class UnityFile:
+    """All objects of one .prefab/.unity file, keyed by fileID."""
+    __slots__ = ('path', 'objects', 'documents', 'parse_seconds')
+
+    def __init__(self, path, objects, documents=None, parse_seconds=None):
+        self.path = path
+        self.objects = objects
+        self.documents = documents  # `--- !u!` documents read, duplicates included
+        self.parse_seconds = parse_seconds  # time the parse took, in whichever process ran it
+
+    def game_objects(self):
+        return [obj for obj in self.objects.values() if isinstance(obj, GameObject)]
+
+    def mono_behaviours(self):
+        return [obj for obj in self.objects.values() if isinstance(obj, MonoBehaviour)]
+
+    def buttons(self):
+        return [obj for obj in self.objects.values() if isinstance(obj, Button)]
+
+    def prefab_instances(self):
+        return [obj for obj in self.objects.values() if isinstance(obj, PrefabInstance)]
+
+    def root_game_objects(self):
+        """GameObjects whose Transform has no parent."""
+        roots = []
+        for obj in self.objects.values():
+            if isinstance(obj, Transform) and not obj.father_id:
+                owner = self.objects.get(obj.game_object_id)
+                if isinstance(owner, GameObject):
+                    roots.append(owner)
+        return roots
+
+    def owner_name(self, obj):
+        """Name of the GameObject a component belongs to, falling back to its own m_Name."""
+        owner = self.objects.get(obj.game_object_id)
+        if owner is not None and owner.name:
+            return owner.name
+        return obj.name
+
+
+# --- Parsing ---
+
+def _parse_document(doc):
+    matches = extract(doc.text)
+    fields = dict(
+        name=matches.name,
+        game_object_id=matches.game_object_id,
+        ui_components=matches.components,
+        events=matches.events,
+        transitions=matches.transitions,
+        persistent_calls=tuple(PersistentCall(raw_target, method) for raw_target, method in matches.calls),
+    )
+
+    if doc.stripped:
+        return StrippedObject(doc.file_id, doc.class_id, source_file_id=matches.source_file_id,
+                              source_guid=matches.source_guid,
+                              prefab_instance_id=matches.prefab_instance_id, **fields)
+    if doc.class_id == PREFAB_INSTANCE_CLASS_ID:
+        return PrefabInstance(doc.file_id, doc.class_id, source_prefab_guid=matches.source_prefab_guid,
+                              modifications=tuple(extract_modifications(doc.text)), **fields)
+    if doc.class_id in TRANSFORM_CLASS_IDS:
+        return Transform(doc.file_id, doc.class_id, father_id=matches.father_id, **fields)
+    if doc.class_id == GAME_OBJECT_CLASS_ID:
+        return GameObject(doc.file_id, doc.class_id, component_ids=tuple(matches.component_ids), **fields)
+    if doc.class_id == MONO_BEHAVIOUR_CLASS_ID:
+        record_type = Button if 'm_OnClick:' in doc.text else MonoBehaviour
+        return record_type(doc.file_id, doc.class_id, script_guid=matches.script_guid,
+                           references=tuple(extract_references(doc.text)), **fields)
+    return UnityObject(doc.file_id, doc.class_id, **fields)
+
+
+def parse_unity_file(file_path, data=None):
+    """Parse a .prefab/.unity file, or with data, that content (bytes) recorded under file_path."""
+    start = time.perf_counter()
+    objects = {}
+    documents = 0
+    for doc in iter_documents(file_path) if data is None else read_documents(io.BytesIO(data)):
+        record = _parse_document(doc)
+        objects[record.file_id] = record
+        documents += 1
+    return UnityFile(file_path, objects, documents, time.perf_counter() - start)
+
+
+def parse_unity_blob(blob):
+    """parse_unity_file() of a (path, bytes) pair, for parallel_parse.map_blobs."""
+    return parse_unity_file(*blob)
+
+
+class UnityProjectModel:
+    """
+    Parsed Unity files keyed by path. Every analysis that is handed the same model
+    shares one parse of each file, so a full run reads each file from disk once.
+    """
+
+    def __init__(self):
+        self.files = {}
+
+    def get(self, file_path):
+        unity_file = self.files.get(file_path)
+        if unity_file is None:
+            unity_file = parse_unity_file(file_path)
+            self.files[file_path] = unity_file
+        return unity_file
+
+    def parse_all(self, file_paths, jobs=1, cache=None):
+        missing = [path for path in file_paths if path not in self.files]
+        for unity_file in map_files(parse_unity_file, missing, jobs, cache=cache):
+            self.files[unity_file.path] = unity_file
+        return self
+
+
+def load_unity_file(file_path, model=None):
+    if model is None:
+        return parse_unity_file(file_path)
+    return model.get(file_path)
@@ -0,0 +1,68 @@
+# parsers/unity_yaml_scanner.py
+
+import re
+from collections import namedtuple
+
+DOCUMENT_MARKER = b'--- !u!'
+DEFAULT_CHUNK_SIZE = 1 << 20  # 1 MiB
+HEADER_PATTERN = re.compile(rb'^(\d+) &(-?\d+)( stripped)?')
+
+UnityDocument = namedtuple('UnityDocument', ['class_id', 'file_id', 'stripped', 'text'])
+
+
+def _make_document(segment):
+    header_end = segment.find(b'\n')
+    if header_end < 0:
+        header_end = len(segment)
+    header = HEADER_PATTERN.match(segment[:header_end])
+    if header:
+        class_id = int(header.group(1))
+        file_id = int(header.group(2))
+        stripped = header.group(3) is not None
+    else:
+        class_id, file_id, stripped = None, None, False
+    text = bytes(segment[header_end + 1:]).decode('utf-8', errors='ignore')
+    return UnityDocument(class_id, file_id, stripped, text)
+
+
+def iter_documents(file_path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Yield the `--- !u!<classID> &<fileID>` documents of a Unity YAML file one at a time.
+    The file is read in chunk_size pieces, so memory stays bounded by the largest
+    single document instead of growing with the size of the scene.
+    """
+    with open(file_path, 'rb') as f:
+        yield from read_documents(f, chunk_size)
+
+
+def read_documents(stream, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Same as iter_documents(), from an open binary stream (e.g. io.BytesIO over a git blob)."""
+    buffer = bytearray()
+    search_from = 0
+    started = False
+
+    while True:
+        chunk = stream.read(chunk_size)
+        if chunk:
+            buffer += chunk
+
+        while True:
+            idx = buffer.find(DOCUMENT_MARKER, search_from)
+            if idx < 0:
+                search_from = max(0, len(buffer) - len(DOCUMENT_MARKER) + 1)
+                break
+            if idx and buffer[idx - 1] != 0x0A:
+                # Marker text inside a value, not at the start of a line
+                search_from = idx + 1
+                continue
+            if started:
+                yield _make_document(buffer[:idx])
+            started = True
+            del buffer[:idx + len(DOCUMENT_MARKER)]
+            search_from = 0
+
+        if not chunk:
+            break
+
+    if started:
+        yield _make_document(buffer)
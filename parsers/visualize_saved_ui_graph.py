@@ -1,76 +1,71 @@
 # visualize_ui_transitions.py
 
 import os
-import yaml
-import networkx as nx
-import matplotlib.pyplot as plt
-import pandas as pd
-
-UI_COMPONENTS = ['Button', 'Toggle', 'Dropdown', 'Slider', 'Canvas', 'EventTrigger']
-
-# -- Helper Functions --
-def extract_gameobject_name(obj_text):
-    for line in obj_text.splitlines():
-        if line.strip().startswith('m_Name:'):
-            return line.split(':', 1)[1].strip()
-    return None
-
-def extract_method_name(obj_text):
-    for line in obj_text.splitlines():
-        if 'm_MethodName:' in line:
-            return line.split(':', 1)[1].strip().replace('"', '')
-    return None
-
-def extract_target_name(obj_text):
-    for line in obj_text.splitlines():
-        if 'm_Target:' in line:
-            return line.split(':', 1)[1].strip().replace('"', '')
-    return None
+import argparse
+from parsers.unity_model import Button, UnityProjectModel, load_unity_file
+from parsers.ui_reachability_analyzer import find_reachable_ui_nodes
+from parsers.reference_resolver import ReferenceResolver
+from parsers.ui_analysis import UI_ANALYSIS_CSV, ui_analysis_files
 
 # -- Parsing Files --
-def parse_ui_nodes_and_edges(file_path):
+def parse_ui_nodes_and_edges(file_path, model=None, resolver=None):
+    """
+    Without a resolver, targets are labelled with their raw `m_Target` text. With a
+    reference_resolver.ReferenceResolver, source and target nodes are the real
+    GameObjects, possibly in another scene or prefab, and null targets are dropped.
+    """
     nodes = []
     edges = []
     file_label = os.path.basename(file_path)
-
-    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-        content = f.read()
-
-    raw_objects = content.split('--- !u!')
-
-    for obj in raw_objects:
-        if any(comp in obj for comp in UI_COMPONENTS):
-            gameobject_name = extract_gameobject_name(obj) or "Unnamed"
-            full_node_name = f"{file_label}::{gameobject_name}"
+    if resolver is not None:
+        model = resolver.model
+
+    for obj in load_unity_file(file_path, model).objects.values():
+        if obj.ui_components:
+            full_node_name = None
+            if resolver is not None:
+                full_node_name = resolver.label(file_path, obj.file_id)
+            if full_node_name is None:
+                gameobject_name = obj.name or "Unnamed"
+                full_node_name = f"{file_label}::{gameobject_name}"
             nodes.append(full_node_name)
 
-            if 'Button' in obj and 'm_OnClick:' in obj:
-                method_name = extract_method_name(obj)
-                target_name = extract_target_name(obj) or "UnknownTarget"
+            if 'Button' in obj.ui_components and isinstance(obj, Button) and obj.persistent_calls:
+                first_call = obj.persistent_calls[0]
+                method_name = first_call.method_name
+                if not method_name:
+                    continue
 
-                if method_name:
-                    edges.append((full_node_name, f"{file_label}::{target_name}", {'method': method_name}))
+                if resolver is None:
+                    target = f"{file_label}::{first_call.raw_target or 'UnknownTarget'}"
+                elif first_call.target_file_id:
+                    target = resolver.call_target_label(file_path, first_call) or f"{file_label}::UnknownTarget"
+                else:
+                    continue
+                edges.append((full_node_name, target, {'method': method_name}))
 
     return nodes, edges
 
 # -- Build Graph --
-def build_ui_graph(file_list):
+def build_ui_graph(file_list, model=None, resolver=None):
+    import networkx as nx
     G = nx.DiGraph()
     for file in file_list:
-        nodes, edges = parse_ui_nodes_and_edges(file)
+        nodes, edges = parse_ui_nodes_and_edges(file, model, resolver)
         G.add_nodes_from(nodes)
         for edge in edges:
             G.add_edge(edge[0], edge[1], method=edge[2]['method'])
+        if resolver is not None:
+            for instance, source_root in resolver.prefab_instance_edges(file):
+                G.add_edge(instance, source_root, method='PrefabInstance')
+            for button, target, method in resolver.prefab_call_edges(file):
+                G.add_edge(button, target, method=method)
     return G
 
 # -- Coloring Nodes --
 def color_by_reachability(G, entry_keyword="MainMenu"):
     entry_nodes = [n for n in G.nodes if entry_keyword.lower() in n.lower()]
-    reachable = set()
-
-    for start in entry_nodes:
-        reachable |= nx.descendants(G, start)
-        reachable.add(start)
+    reachable = find_reachable_ui_nodes(G, entry_nodes)
 
     node_colors = []
     for node in G.nodes:
@@ -81,11 +76,19 @@ def color_by_reachability(G, entry_keyword="MainMenu"):
     return node_colors
 
 # -- Visualization --
-def visualize_graph(G, output_path='outputs/ui_transition_graph.png'):
+def visualize_graph(G, output_path='outputs/ui_transition_graph.png', headless=False):
+    from parsers.graph_render import render_graph, SPRING_LAYOUT_LIMIT
+    node_colors = color_by_reachability(G)
+    if headless or G.number_of_nodes() > SPRING_LAYOUT_LIMIT:
+        # Edge labels are omitted here; the method of each edge stays in the GEXF export
+        render_graph(G, output_path, colors=dict(zip(G.nodes, node_colors)),
+                     title="UI Interaction Graph with Methods")
+        return
+
+    import networkx as nx
+    import matplotlib.pyplot as plt
     plt.figure(figsize=(24, 14))
     pos = nx.spring_layout(G, k=0.45, iterations=60)
-
-    node_colors = color_by_reachability(G)
     edge_labels = {(u, v): d['method'] for u, v, d in G.edges(data=True)}
 
     nx.draw(G, pos, with_labels=True, node_color=node_colors, edge_color="gray",
@@ -99,13 +102,20 @@ def visualize_graph(G, output_path='outputs/ui_transition_graph.png'):
 
 # -- Main --
 if __name__ == "__main__":
-    df = pd.read_csv('ui_analysis.csv')
-    file_list = df['file'].tolist()
+    parser = argparse.ArgumentParser(description="Build the UI interaction graph of the files in ui_analysis.csv.")
+    parser.add_argument('--project-root', default="datasets/open-project-1-main/",
+                        help="Unity project used to resolve m_Target references across files")
+    parser.add_argument('--headless', action='store_true', help="Render with the fast layered layout and don't open a window")
+    args = parser.parse_args()
+
+    file_list = ui_analysis_files(UI_ANALYSIS_CSV)
 
-    G = build_ui_graph(file_list)
-    visualize_graph(G)
+    resolver = ReferenceResolver(UnityProjectModel(), project_root=args.project_root)
+    G = build_ui_graph(file_list, resolver=resolver)
+    visualize_graph(G, headless=args.headless)
 
     # Optional: save the graph for Gephi use
+    import networkx as nx
     nx.write_gexf(G, 'outputs/ui_transition_graph.gexf')
     nx.write_graphml(G, 'outputs/ui_transition_graph.graphml')
     print("\u2705 GEXF and GraphML saved for Gephi.")
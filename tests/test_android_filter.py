@@ -0,0 +1,38 @@
+import os
+import pytest
+from parsers.android_filter import detect_platform
+
+PLAYER_SETTINGS = """%YAML 1.1
+--- !u!129 &1
+PlayerSettings:
+  productName: Game
+  applicationIdentifier:
+    Android: com.example.game
+"""
+
+
+def write(root, rel_path, text):
+    path = os.path.join(root, *rel_path.split('/'))
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as f:
+        f.write(text)
+
+
+@pytest.mark.parametrize('value, target', [
+    (13, 'Android'), (33, 'XboxOne'), (37, 'tvOS'), (38, 'Switch'),
+    (42, 'GameCoreXboxSeries'), (43, 'GameCoreXboxOne'), (44, 'PS5'),
+])
+def test_active_build_target_names(tmp_path, value, target):
+    write(str(tmp_path), 'Library/EditorUserBuildSettings.asset',
+          f"%YAML 1.1\n--- !u!1 &1\nEditorUserBuildSettings:\n  m_ActiveBuildTarget: {value}\n")
+    platform = detect_platform(str(tmp_path))
+    assert platform.target == target
+    assert platform.is_android == (target == 'Android')
+
+
+def test_unreadable_editor_settings_fall_back_to_project_settings(tmp_path):
+    os.makedirs(tmp_path / 'Library' / 'EditorUserBuildSettings.asset')  # open() fails with an OSError
+    write(str(tmp_path), 'ProjectSettings/ProjectSettings.asset', PLAYER_SETTINGS)
+    platform = detect_platform(str(tmp_path))
+    assert platform.is_android
+    assert platform.evidence == 'ProjectSettings.asset: applicationIdentifier.Android'
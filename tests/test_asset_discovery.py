@@ -0,0 +1,44 @@
+import os
+from parsers.asset_discovery import discover_assets, find_unity_files, select_paths
+
+PROJECT_FILES = [
+    'Assets/Scenes/Main.unity',
+    'Assets/UI/Build/BuildMenu.prefab',
+    'Assets/Logs/LogPanel.prefab',
+    'Assets/Temp/Popup.prefab',
+    'Assets/Samples~/Sample.prefab',
+    'Assets/.hidden/Hidden.prefab',
+    'Library/Cached.prefab',
+    'Build/Output.unity',
+    'Logs/Old.prefab',
+    'Temp/Scratch.unity',
+]
+EXPECTED = [
+    'Assets/Logs/LogPanel.prefab',
+    'Assets/Scenes/Main.unity',
+    'Assets/Temp/Popup.prefab',
+    'Assets/UI/Build/BuildMenu.prefab',
+]
+
+
+def make_project(root):
+    for rel_path in PROJECT_FILES:
+        path = os.path.join(root, *rel_path.split('/'))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as f:
+            f.write('%YAML 1.1\n')
+
+
+def test_editor_folders_are_pruned_only_at_the_root(tmp_path):
+    make_project(str(tmp_path))
+    paths = find_unity_files(str(tmp_path))
+    assert sorted(os.path.relpath(path, tmp_path).replace(os.sep, '/') for path in paths) == EXPECTED
+
+
+def test_threaded_discovery_lists_the_same_files(tmp_path):
+    make_project(str(tmp_path))
+    assert discover_assets(str(tmp_path), threads=4).paths() == discover_assets(str(tmp_path)).paths()
+
+
+def test_select_paths_matches_discovery():
+    assert sorted(select_paths(PROJECT_FILES)) == EXPECTED
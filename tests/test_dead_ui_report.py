@@ -0,0 +1,55 @@
+import csv
+import json
+import pytest
+from parsers import dead_ui_report
+from parsers.dead_ui_report import REPORT_FIELDS, write_report_rows, report_format
+
+ROWS = [
+    ('Menu.prefab::Play', 'reachable', 'Assets/UI/Menu.prefab', 'Button', 1234567890123, 'MainMenu.unity::Canvas', None),
+    ('Menu.prefab::Credits', 'dead', 'Assets/UI/Menu.prefab', 'Button', -42, None, 'not referenced by any node'),
+    ('StartGame', 'dead', None, 'method', None, None, 'referenced only by dead nodes'),
+]
+
+
+def as_dicts(rows):
+    return [dict(zip(REPORT_FIELDS, row)) for row in rows]
+
+
+def test_format_from_extension():
+    assert [report_format(p) for p in ('r.csv', 'r.jsonl', 'r.ndjson', 'r.parquet', 'r.ARROW', 'r')] == \
+        ['csv', 'jsonl', 'jsonl', 'parquet', 'arrow', 'csv']
+
+
+def test_csv_and_jsonl(tmp_path):
+    assert write_report_rows(iter(ROWS), str(tmp_path / 'r.csv')) == len(ROWS)
+    with open(tmp_path / 'r.csv', newline='') as f:
+        rows = list(csv.DictReader(f))
+    assert [row['element'] for row in rows] == [row[0] for row in ROWS]
+    assert rows[1]['file_id'] == '-42' and rows[1]['reached_from'] == ''
+
+    assert write_report_rows(iter(ROWS), str(tmp_path / 'r.jsonl')) == len(ROWS)
+    with open(tmp_path / 'r.jsonl', encoding='utf-8') as f:
+        assert [json.loads(line) for line in f] == as_dicts(ROWS)
+
+
+@pytest.mark.parametrize('fmt', ['parquet', 'arrow'])
+def test_columnar_formats_round_trip(tmp_path, monkeypatch, fmt):
+    pa = pytest.importorskip('pyarrow')
+    monkeypatch.setattr(dead_ui_report, 'CHUNK_ROWS', 2)  # more than one record batch
+    path = str(tmp_path / f'report.{fmt}')
+    assert write_report_rows(iter(ROWS), path) == len(ROWS)
+
+    if fmt == 'parquet':
+        import pyarrow.parquet as pq
+        table = pq.read_table(path)
+    else:
+        with pa.OSFile(path, 'rb') as source:
+            table = pa.ipc.open_file(source).read_all()
+    assert table.column_names == REPORT_FIELDS
+    assert table.schema.field('file_id').type == pa.int64()
+    assert table.to_pylist() == as_dicts(ROWS)
+
+
+def test_unknown_format(tmp_path):
+    with pytest.raises(ValueError):
+        write_report_rows(iter(ROWS), str(tmp_path / 'r.txt'), 'xml')
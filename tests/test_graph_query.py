@@ -0,0 +1,39 @@
+from parsers.compact_graph import CompactGraph
+from parsers.graph_query import GraphQuery, run_command
+
+
+def make_query():
+    graph = CompactGraph()
+    graph.add_parse_result(
+        ['MainMenu.unity::PlayButton', 'Shop.prefab::PlayButton', 'Shop.prefab::BuyButton', 'Pause.prefab::Resume'],
+        [('MainMenu.unity::PlayButton', 'StartGame')],
+        [('Assets/MainMenu.unity', 'Button', 1), ('Assets/Shop.prefab', 'Button', 2),
+         ('Assets/Shop.prefab', 'Button', 3), ('Assets/Pause.prefab', 'Button', 4)],
+    )
+    return GraphQuery(graph)
+
+
+def test_why_exact_label(capsys):
+    run_command(make_query(), ['why', 'StartGame'])
+    out = capsys.readouterr().out
+    assert out.startswith('✅ StartGame is reachable:')
+
+
+def test_why_lists_candidates_instead_of_guessing(capsys):
+    run_command(make_query(), ['why', 'Play'])
+    out = capsys.readouterr().out
+    assert out.startswith("❓ 2 nodes match 'Play'")
+    assert 'MainMenu.unity::PlayButton' in out and 'Shop.prefab::PlayButton' in out
+    assert 'is reachable' not in out and 'is dead' not in out
+
+
+def test_why_keeps_to_the_named_file(capsys):
+    run_command(make_query(), ['why', 'Shop.prefab::Play'])
+    out = capsys.readouterr().out
+    assert "explaining its only match, Shop.prefab::PlayButton" in out
+    assert '💀 Shop.prefab::PlayButton is dead' in out
+
+
+def test_why_without_match(capsys):
+    run_command(make_query(), ['why', 'Pause.prefab::Play'])
+    assert capsys.readouterr().out.startswith("❌ No node matches 'Pause.prefab::Play'")
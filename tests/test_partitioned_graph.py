@@ -0,0 +1,63 @@
+import os
+import pytest
+from benchmarks.synthetic_project import generate_project
+from parsers.compact_graph import CompactGraph
+from parsers.instrumentation import Instrumentation
+from parsers.pipeline import UIPipeline, PartitionedUIPipeline, StageTimings
+from parsers.partitioned_graph import PartitionedGraph, build_partitioned_graph, PARTITION_FILE_PATTERN
+from parsers.dead_ui_report import iter_report_rows
+
+
+@pytest.fixture(scope='module')
+def project(tmp_path_factory):
+    root = tmp_path_factory.mktemp('project')
+    generate_project(str(root), files=60, seed=5)
+    return root
+
+
+def comparable(rows):
+    """Report rows by element. Which entry reaches a node depends on visiting order, so only whether one does is kept."""
+    return {row[0]: row[1:5] + (row[5] is not None, row[6]) for row in rows}
+
+
+def in_memory_rows(root, index_path):
+    pipeline = UIPipeline(str(root), scripts=False, index_path=index_path, timings=StageTimings(verbose=False))
+    pipeline.reach()
+    return comparable(iter_report_rows(pipeline.graph, pipeline.origins))
+
+
+def test_report_matches_in_memory_no_scripts_report(project, tmp_path):
+    instrumentation = Instrumentation()
+    pipeline = PartitionedUIPipeline(str(project), partition_dir=str(tmp_path / 'partitions'),
+                                     index_path=str(tmp_path / 'index.json'), timings=StageTimings(verbose=False),
+                                     instrumentation=instrumentation)
+    pipeline.reach()
+    assert pipeline.graph.boundary_count > 0
+    assert comparable(pipeline.graph.iter_report_rows()) == in_memory_rows(project, str(tmp_path / 'index.json'))
+    assert instrumentation.counters['files_parsed'] == len(pipeline.files)
+    assert instrumentation.counters['documents'] > 0
+
+
+def test_small_batches_build_the_same_graph(project, tmp_path):
+    pipeline = UIPipeline(str(project), scripts=False, index_path=str(tmp_path / 'index.json'),
+                          timings=StageTimings(verbose=False))
+    pipeline.discover()
+    graph = build_partitioned_graph(pipeline.files, str(tmp_path / 'partitions'), script_index=pipeline.script_index,
+                                    batch_files=7)
+    graph.reach()
+    assert comparable(graph.iter_report_rows()) == in_memory_rows(project, str(tmp_path / 'index.json'))
+    assert all(os.path.splitext(name)[1] in ('.uigraph', '.origins', '.boundary', '.referred')
+               for name in os.listdir(tmp_path / 'partitions') if PARTITION_FILE_PATTERN.match(name))
+
+
+def test_repeated_edges_are_kept_once(tmp_path):
+    edges = [('Menu::Canvas/Play', 'Game::Root'), ('Menu::Canvas/Play', 'Menu::Canvas')]
+    graph = PartitionedGraph(str(tmp_path))
+    graph.add_parse_result(['Menu::Canvas/Play'], edges)
+    graph.add_parse_result(['Game::Root'], [])  # opens another partition, spilling Menu's
+    graph.add_parse_result(['Menu::Canvas'], edges)
+    graph.finish()
+    compact = CompactGraph()
+    compact.add_parse_result(['Menu::Canvas/Play', 'Game::Root', 'Menu::Canvas'], edges)
+    assert graph.number_of_edges() == compact.number_of_edges() == 2
+    assert graph.boundary_count == 1
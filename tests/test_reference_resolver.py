@@ -0,0 +1,134 @@
+import os
+from parsers.unity_model import UnityProjectModel
+from parsers.reference_resolver import ReferenceResolver
+from parsers.ui_matcher import extract_modifications
+from parsers.visualize_saved_ui_graph import build_ui_graph
+
+HEADER = "%YAML 1.1\n%TAG !u! tag:unity3d.com,2011:\n"
+BUTTON_GUID = '4e29b1a8efbd4b44bb3f3716e73f07ff'
+INNER_GUID = '11111111111111111111111111111111'
+OUTER_GUID = '22222222222222222222222222222222'
+SCENE_GUID = '33333333333333333333333333333333'
+CALL = 'm_OnClick.m_PersistentCalls.m_Calls.Array.data[0]'
+
+# Inner.prefab: PlayButton, whose own click calls Ping on itself
+INNER = HEADER + f"""--- !u!1 &100
+GameObject:
+  m_Component:
+  - component: {{fileID: 101}}
+  - component: {{fileID: 102}}
+  m_Name: PlayButton
+--- !u!224 &101
+RectTransform:
+  m_GameObject: {{fileID: 100}}
+  m_Father: {{fileID: 0}}
+--- !u!114 &102
+MonoBehaviour:
+  m_GameObject: {{fileID: 100}}
+  m_Script: {{fileID: 11500000, guid: {BUTTON_GUID}, type: 3}}
+  m_OnClick:
+    m_PersistentCalls:
+      m_Calls:
+      - m_Target: {{fileID: 100}}
+        m_MethodName: Ping
+"""
+
+
+def modification(file_id, guid, property_path, value='', reference='{fileID: 0}'):
+    return (f"    - target: {{fileID: {file_id}, guid: {guid}, type: 3}}\n"
+            f"      propertyPath: {property_path}\n      value: {value}\n      objectReference: {reference}\n")
+
+
+def outer_prefab(modifications=''):
+    """Outer.prefab: a Menu panel with a nested Inner.prefab instance and its stripped button."""
+    return HEADER + f"""--- !u!1 &200
+GameObject:
+  m_Component:
+  - component: {{fileID: 201}}
+  m_Name: Menu
+--- !u!224 &201
+RectTransform:
+  m_GameObject: {{fileID: 200}}
+  m_Father: {{fileID: 0}}
+--- !u!1001 &300
+PrefabInstance:
+  m_Modification:
+    m_TransformParent: {{fileID: 201}}
+    m_Modifications:
+{modification(100, INNER_GUID, 'm_Name', 'PlayButton')}{modifications}    m_RemovedComponents: []
+  m_SourcePrefab: {{fileID: 100100000, guid: {INNER_GUID}, type: 3}}
+--- !u!114 &301 stripped
+MonoBehaviour:
+  m_CorrespondingSourceObject: {{fileID: 102, guid: {INNER_GUID}, type: 3}}
+  m_PrefabInstance: {{fileID: 300}}
+"""
+
+
+def main_scene(modifications):
+    """Main.unity: a GameManager and an Outer.prefab instance with the given modifications."""
+    return HEADER + f"""--- !u!1 &400
+GameObject:
+  m_Component:
+  - component: {{fileID: 401}}
+  m_Name: GameManager
+--- !u!4 &401
+Transform:
+  m_GameObject: {{fileID: 400}}
+  m_Father: {{fileID: 0}}
+--- !u!1001 &500
+PrefabInstance:
+  m_Modification:
+    m_TransformParent: {{fileID: 0}}
+    m_Modifications:
+{modifications}    m_RemovedComponents: []
+  m_SourcePrefab: {{fileID: 100100000, guid: {OUTER_GUID}, type: 3}}
+"""
+
+
+def write_project(root, outer, scene):
+    for name, guid, text in (('Inner.prefab', INNER_GUID, INNER), ('Outer.prefab', OUTER_GUID, outer),
+                             ('Main.unity', SCENE_GUID, scene)):
+        path = os.path.join(root, name)
+        with open(path, 'w') as f:
+            f.write(text)
+        with open(path + '.meta', 'w') as f:
+            f.write(f"fileFormatVersion: 2\nguid: {guid}\n")
+    return os.path.join(root, 'Main.unity')
+
+
+def test_modifications_capture_object_references():
+    text = modification(301, OUTER_GUID, f'{CALL}.m_Target', reference='{fileID: 400}') + \
+        modification(301, OUTER_GUID, f'{CALL}.m_MethodName', 'StartGame')
+    assert extract_modifications(text) == [
+        (301, OUTER_GUID, f'{CALL}.m_Target', '', 400, None),
+        (301, OUTER_GUID, f'{CALL}.m_MethodName', 'StartGame', 0, None),
+    ]
+
+
+def test_scene_override_of_nested_prefab_button_target(tmp_path):
+    scene = write_project(str(tmp_path), outer_prefab(), main_scene(
+        modification(301, OUTER_GUID, f'{CALL}.m_Target', reference='{fileID: 400}') +
+        modification(301, OUTER_GUID, f'{CALL}.m_MethodName', 'StartGame')))
+    resolver = ReferenceResolver(UnityProjectModel(), project_root=str(tmp_path))
+    assert resolver.prefab_call_edges(scene) == [('Inner.prefab::PlayButton', 'Main.unity::GameManager', 'StartGame')]
+
+    G = build_ui_graph([scene], resolver=resolver)
+    assert G.edges['Inner.prefab::PlayButton', 'Main.unity::GameManager']['method'] == 'StartGame'
+
+
+def test_overrides_apply_innermost_first(tmp_path):
+    # Outer.prefab renames the call's method; the scene only retargets it
+    outer = outer_prefab(modification(102, INNER_GUID, f'{CALL}.m_MethodName', 'OpenMenu'))
+    scene = write_project(str(tmp_path), outer, main_scene(
+        modification(301, OUTER_GUID, f'{CALL}.m_Target', reference='{fileID: 400}')))
+    resolver = ReferenceResolver(UnityProjectModel(), project_root=str(tmp_path))
+    assert resolver.prefab_call_edges(scene) == [('Inner.prefab::PlayButton', 'Main.unity::GameManager', 'OpenMenu')]
+    assert resolver.prefab_call_edges(os.path.join(str(tmp_path), 'Outer.prefab')) == \
+        [('Inner.prefab::PlayButton', 'Inner.prefab::PlayButton', 'OpenMenu')]
+
+
+def test_instance_without_call_overrides_adds_no_call_edges(tmp_path):
+    scene = write_project(str(tmp_path), outer_prefab(), main_scene(modification(200, OUTER_GUID, 'm_Name', 'Pause')))
+    resolver = ReferenceResolver(UnityProjectModel(), project_root=str(tmp_path))
+    assert resolver.prefab_call_edges(scene) == []
+    assert resolver.prefab_instance_edges(scene) == [('Main.unity::Pause', 'Outer.prefab::Menu')]
@@ -0,0 +1,88 @@
+import os
+import shutil
+import subprocess
+import pytest
+from benchmarks.synthetic_project import generate_project
+from parsers.parse_cache import ParseCache
+from parsers.pipeline import UIPipeline, StageTimings
+from parsers.dead_ui_report import iter_report_rows
+from parsers.revision_diff import RevisionDiff, NEWLY_DEAD, NEWLY_REACHABLE, ABSENT
+
+pytestmark = pytest.mark.skipif(shutil.which('git') is None, reason="git is not installed")
+
+
+def git(root, *args):
+    command = ['git', '-c', 'user.name=test', '-c', 'user.email=test@example.com', *args]
+    return subprocess.run(command, cwd=root, check=True, capture_output=True, text=True).stdout.strip()
+
+
+def commit(root, message):
+    git(root, 'add', '-A')
+    git(root, 'commit', '-q', '-m', message)
+    return git(root, 'rev-parse', 'HEAD')
+
+
+def report_rows(root, index_path):
+    """Rows of a full single-revision report of the checked-out tree, as the diff compares them."""
+    pipeline = UIPipeline(root, scripts=False, index_path=index_path, timings=StageTimings(verbose=False))
+    pipeline.reach()
+    return list(iter_report_rows(pipeline.graph, pipeline.origins))
+
+
+def expected_diff(base_rows, head_rows):
+    base_status = {row[0]: row[1] for row in base_rows}
+    rows = []
+    for row in head_rows:
+        before = base_status.get(row[0], ABSENT)
+        if row[1] == 'dead' and before != 'dead':
+            rows.append((row[0], NEWLY_DEAD, before) + row[1:])
+        elif row[1] == 'reachable' and before == 'dead':
+            rows.append((row[0], NEWLY_REACHABLE, before) + row[1:])
+    return rows
+
+
+@pytest.fixture
+def project(tmp_path):
+    """A synthetic project with two commits: a scene deleted and a MainMenu button retargeted."""
+    root = str(tmp_path / 'Game')
+    generate_project(root, files=60, seed=3)
+    git(root, 'init', '-q')
+    base = commit(root, 'base')
+    base_rows = report_rows(root, str(tmp_path / 'base_index.json'))
+
+    os.remove(os.path.join(root, 'Assets', 'Scenes', 'Scene1.unity'))
+    main_menu = os.path.join(root, 'Assets', 'Scenes', 'MainMenu.unity')
+    with open(main_menu, encoding='utf-8') as f:
+        text = f.read()
+    with open(main_menu, 'w', encoding='utf-8', newline='\n') as f:
+        f.write(text.replace('m_MethodName: Show', 'm_MethodName: Retarget', 1))
+    head = commit(root, 'head')
+    head_rows = report_rows(root, str(tmp_path / 'head_index.json'))
+    return root, base, head, expected_diff(base_rows, head_rows)
+
+
+def test_diff_matches_full_reports_of_both_revisions(project):
+    root, base, head, expected = project
+    assert any(row[1] == NEWLY_DEAD for row in expected)
+    diff = RevisionDiff(root, base, head, timings=StageTimings(verbose=False), batch_files=7)
+    assert list(diff.rows()) == expected
+    assert diff.newly_dead == sum(row[1] == NEWLY_DEAD for row in expected)
+
+
+def test_diff_with_cache_cold_and_warm(project, tmp_path):
+    root, base, head, expected = project
+    with ParseCache(str(tmp_path / 'cache')) as cache:
+        for _ in range(2):
+            diff = RevisionDiff(root, base, head, cache=cache, timings=StageTimings(verbose=False), batch_files=7)
+            assert list(diff.rows()) == expected
+        assert cache.hits > 0
+
+
+def test_unrelated_change_reads_nothing(project):
+    root, _, head, _ = project
+    with open(os.path.join(root, 'notes.txt'), 'w') as f:
+        f.write('not an asset\n')
+    later = commit(root, 'notes')
+    diff = RevisionDiff(root, head, later, timings=StageTimings(verbose=False)).run()
+    assert diff.changed == [] and diff.revisions is None
+    assert list(diff.rows()) == []
@@ -0,0 +1,54 @@
+import os
+from types import SimpleNamespace
+from parsers.script_index import load_script_index
+from parsers.unity_model import MONO_BEHAVIOUR_CLASS_ID
+
+HEALTH_GUID = 'a1b2c3d4e5f60718293a4b5c6d7e8f90'
+MY_BUTTON_GUID = '0f1e2d3c4b5a69788796a5b4c3d2e1f0'
+
+
+def write_script(root, name, guid, source):
+    scripts = os.path.join(root, 'Assets', 'Scripts')
+    os.makedirs(scripts, exist_ok=True)
+    with open(os.path.join(scripts, f'{name}.cs'), 'w') as f:
+        f.write(source)
+    with open(os.path.join(scripts, f'{name}.cs.meta'), 'w') as f:
+        f.write(f'fileFormatVersion: 2\nguid: {guid}\n')
+
+
+def component(guid):
+    return SimpleNamespace(class_id=MONO_BEHAVIOUR_CLASS_ID, script_guid=guid)
+
+
+def test_added_script_is_classified_without_rebuild(tmp_path):
+    root, index_path = str(tmp_path / 'Project'), str(tmp_path / 'script_index.json')
+    write_script(root, 'Health', HEALTH_GUID, 'public class Health : MonoBehaviour {}')
+    index = load_script_index(root, index_path)
+    assert index.class_name(HEALTH_GUID) == 'Health'
+    assert index.ui_type(component(MY_BUTTON_GUID)) is None
+
+    write_script(root, 'MyButton', MY_BUTTON_GUID, 'public class MyButton : Button {}')
+    index = load_script_index(root, index_path)
+    assert index.class_name(MY_BUTTON_GUID) == 'MyButton'
+    assert index.ui_type(component(MY_BUTTON_GUID)) == 'Button'
+
+
+def test_unchanged_project_reuses_saved_index(tmp_path):
+    root, index_path = str(tmp_path / 'Project'), str(tmp_path / 'script_index.json')
+    write_script(root, 'MyButton', MY_BUTTON_GUID, 'public class MyButton : Button {}')
+    load_script_index(root, index_path)
+    saved = os.stat(index_path).st_mtime_ns
+    assert load_script_index(root, index_path).ui_type(component(MY_BUTTON_GUID)) == 'Button'
+    assert os.stat(index_path).st_mtime_ns == saved
+
+
+def test_edited_base_class_is_picked_up(tmp_path):
+    root, index_path = str(tmp_path / 'Project'), str(tmp_path / 'script_index.json')
+    write_script(root, 'MyButton', MY_BUTTON_GUID, 'public class MyButton : MonoBehaviour {}')
+    assert load_script_index(root, index_path).ui_type(component(MY_BUTTON_GUID)) is None
+    script = os.path.join(root, 'Assets', 'Scripts', 'MyButton.cs')
+    with open(script, 'w') as f:
+        f.write('public class MyButton : Toggle {}')
+    stat = os.stat(script)
+    os.utime(script, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert load_script_index(root, index_path).ui_type(component(MY_BUTTON_GUID)) == 'Toggle'
@@ -0,0 +1,163 @@
+import os
+from parsers.deep_ui_parser import build_compact_navigation_graph
+from parsers.pipeline import UIPipeline, StageTimings
+from parsers.script_scanner import scan_script, build_scene_names, SCENE, ACTIVATE, RAISE
+
+MENU_SCRIPT = """using UnityEngine;
+using UnityEngine.SceneManagement;
+
+public class Menu : MonoBehaviour
+{
+    const string Credits = "Credits";
+    public GameObject panel;
+    public GameObject options;
+    public VoidEventChannel onQuit;
+    public Button playButton;
+
+    // void Commented() { SceneManager.LoadScene("Commented"); }
+    /* } an unbalanced brace { in a comment */
+    string braces = "}{ SceneManager.LoadScene(\\"InString\\"); }";
+    char open = '{';
+
+    void Awake()
+    {
+        onQuit.OnEventRaised += Quit;
+        playButton.onClick.AddListener(Play);
+    }
+
+    public void Play() { SceneManager.LoadScene("Level1"); }
+    public void ShowCredits() => SceneManager.LoadScene(Credits);
+    public void Next() { SceneManager.LoadSceneAsync(1); }
+    public void Close() { panel.SetActive(false); }
+    public void Open() { options.gameObject.SetActive(true); }
+    public void Quit() { onQuit?.Raise(); }
+    public void Go<T>(T argument) where T : class { SceneManager.LoadScene("Generic"); }
+
+    public void Outer()
+    {
+        void Local() { SceneManager.LoadScene("Local"); }
+        Local();
+    }
+
+    class Nested
+    {
+        public void Inner() { SceneManager.LoadScene("Nested"); }
+    }
+}
+"""
+
+HEADER = "%YAML 1.1\n%TAG !u! tag:unity3d.com,2011:\n"
+BUTTON_GUID = '4e29b1a8efbd4b44bb3f3716e73f07ff'
+MENU_GUID = '44444444444444444444444444444444'
+
+
+def button(file_id, name, calls=''):
+    """A GameObject (file_id) with a built-in Button (file_id + 1) whose m_OnClick has calls."""
+    return f"""--- !u!1 &{file_id}
+GameObject:
+  m_Name: {name}
+--- !u!114 &{file_id + 1}
+MonoBehaviour:
+  m_GameObject: {{fileID: {file_id}}}
+  m_Script: {{fileID: 11500000, guid: {BUTTON_GUID}, type: 3}}
+  m_OnClick:
+    m_PersistentCalls:
+      m_Calls:{calls or ' []'}
+"""
+
+
+def call(target_id, method):
+    return f"\n      - m_Target: {{fileID: {target_id}}}\n        m_MethodName: {method}"
+
+
+MAIN_MENU = HEADER + f"""--- !u!1 &100
+GameObject:
+  m_Name: Menu
+--- !u!114 &101
+MonoBehaviour:
+  m_GameObject: {{fileID: 100}}
+  m_Script: {{fileID: 11500000, guid: {MENU_GUID}, type: 3}}
+""" + button(200, 'Play', call(101, 'Play')) + button(300, 'Next', call(101, 'Next'))
+
+LEVEL = HEADER + button(400, 'Quit')
+
+BUILD_SETTINGS = """EditorBuildSettings:
+  m_Scenes:
+  - enabled: 1
+    path: Assets/MainMenu.unity
+  - enabled: 0
+    path: Assets/Old.unity
+  - enabled: 1
+    path: Assets/Level1.unity
+"""
+
+
+def write(path, text):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+
+def write_project(root):
+    write(os.path.join(root, 'Assets', 'MainMenu.unity'), MAIN_MENU)
+    write(os.path.join(root, 'Assets', 'Level1.unity'), LEVEL)
+    write(os.path.join(root, 'Assets', 'Menu.cs'), MENU_SCRIPT)
+    write(os.path.join(root, 'Assets', 'Menu.cs.meta'), f"fileFormatVersion: 2\nguid: {MENU_GUID}\n")
+    write(os.path.join(root, 'ProjectSettings', 'EditorBuildSettings.asset'), BUILD_SETTINGS)
+    return str(root)
+
+
+def edges(graph):
+    label = graph.node_label
+    return {(label(src), label(dst)) for src, dst in zip(graph.edge_src, graph.edge_dst)}
+
+
+def test_scan_script(tmp_path):
+    path = tmp_path / 'Menu.cs'
+    path.write_text(MENU_SCRIPT)
+    script = scan_script(str(path))
+    assert [script_class.name for script_class in script.classes] == ['Menu', 'Nested']
+    menu = script.main_class()
+    assert menu.methods == {
+        'Play': [(SCENE, 'Level1')],
+        'ShowCredits': [(SCENE, 'Credits')],
+        'Next': [(SCENE, '#1')],
+        'Open': [(ACTIVATE, 'options')],
+        'Quit': [(RAISE, 'onQuit')],
+        'Go': [(SCENE, 'Generic')],
+        'Outer': [(SCENE, 'Local')],  # the local function's call, not a method of its own
+    }
+    assert sorted(menu.listeners) == [('onQuit', 'Quit'), ('playButton', 'Play')]
+    assert script.classes[1].methods == {'Inner': [(SCENE, 'Nested')]}
+
+
+def test_build_scene_names_skip_disabled_scenes(tmp_path):
+    assert build_scene_names(write_project(tmp_path)) == ['MainMenu', 'Level1']
+    assert build_scene_names(str(tmp_path / 'missing')) == []
+
+
+def test_buttons_link_through_handlers_to_scenes(tmp_path):
+    root = write_project(tmp_path)
+    pipeline = UIPipeline(root, index_path=str(tmp_path / 'index.json'), timings=StageTimings(verbose=False))
+    linked = edges(pipeline.build_graph())
+    for method, button_name in (('Play', 'Play'), ('Next', 'Next')):  # a literal and a build index
+        handler = f"MainMenu.unity::Menu Menu.{method}()"
+        assert (f"MainMenu.unity::{button_name}", handler) in linked
+        assert (handler, 'Level1.unity::(scene)') in linked
+    assert ('Level1.unity::(scene)', 'Level1.unity::Quit') in linked
+    reachable, _ = pipeline.reach()
+    assert 'Level1.unity::Quit' in {pipeline.graph.node_label(node) for node in reachable}
+
+
+def test_without_scripts_the_graph_is_unchanged(tmp_path):
+    root = write_project(tmp_path)
+    pipeline = UIPipeline(root, scripts=False, index_path=str(tmp_path / 'index.json'),
+                          timings=StageTimings(verbose=False))
+    graph = pipeline.build_graph()
+    expected = build_compact_navigation_graph(pipeline.files, script_index=pipeline.script_index)
+    assert [graph.node_label(i) for i in range(graph.number_of_nodes())] == \
+        [expected.node_label(i) for i in range(expected.number_of_nodes())]
+    assert [graph.node_details(i) for i in range(graph.number_of_nodes())] == \
+        [expected.node_details(i) for i in range(expected.number_of_nodes())]
+    assert edges(graph) == edges(expected)
+    assert not any('(scene)' in label or '()' in label for edge in edges(graph) for label in edge)
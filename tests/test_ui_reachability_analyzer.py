@@ -0,0 +1,42 @@
+import random
+import pytest
+from parsers.ui_reachability_analyzer import (build_csr, strongly_connected_components, ReachabilityIndex,
+                                              compute_reachability)
+
+nx = pytest.importorskip('networkx')
+
+
+def random_graphs(count=300, seed=0):
+    rng = random.Random(seed)
+    for _ in range(count):
+        n = rng.randint(1, 30)
+        G = nx.DiGraph()
+        G.add_nodes_from(f"n{i}" for i in range(n))
+        for _ in range(rng.randint(0, 3 * n)):
+            G.add_edge(f"n{rng.randrange(n)}", f"n{rng.randrange(n)}")
+        yield rng, G
+
+
+def test_components_match_networkx():
+    for _, G in random_graphs():
+        nodes, _, offsets, targets = build_csr(G)
+        component, count = strongly_connected_components(offsets, targets)
+        groups = {}
+        for node, c in zip(nodes, component):
+            groups.setdefault(c, set()).add(node)
+        assert len(groups) == count
+        assert sorted(map(sorted, groups.values())) == sorted(map(sorted, nx.strongly_connected_components(G)))
+        for u, v in G.edges:  # reverse topological order
+            assert component[nodes.index(u)] >= component[nodes.index(v)]
+
+
+def test_index_queries_match_networkx_descendants():
+    for rng, G in random_graphs(seed=1):
+        index = ReachabilityIndex(G)
+        for _ in range(3):
+            entries = rng.sample(list(G.nodes), rng.randint(0, min(3, len(G))))
+            expected = set(entries).union(*(nx.descendants(G, entry) for entry in entries))
+            reachable, dead = index.query(entries + ['missing'])
+            assert reachable == expected
+            assert dead == set(G.nodes) - expected
+            assert compute_reachability(G, entries) == (reachable, dead)
@@ -0,0 +1,62 @@
+import os
+import pytest
+
+pytest.importorskip('networkx')
+
+from benchmarks.synthetic_project import generate_project
+from parsers.asset_discovery import discover_assets
+from parsers.script_index import load_script_index
+from parsers.ui_watch import IncrementalNavigationGraph
+
+
+def assert_matches_recompute(state):
+    reachable, dead = set(state.reachable), set(state.dead)
+    state.recompute()
+    assert (reachable, dead) == (state.reachable, state.dead)
+    return len(reachable)
+
+
+def edit(path, old, new):
+    with open(path, encoding='utf-8') as f:
+        text = f.read()
+    assert old in text
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text.replace(old, new))
+
+
+def test_updates_and_removals_match_a_full_recompute(tmp_path):
+    root = str(tmp_path)
+    generate_project(root, files=12, seed=2)
+    state = IncrementalNavigationGraph(script_index=load_script_index(root, str(tmp_path / 'index.json')))
+    for path in discover_assets(root).paths():
+        state.update_file(path)
+    counts = [assert_matches_recompute(state)]
+
+    menu = os.path.join(root, 'Assets', 'Scenes', 'MainMenu.unity')
+    panel = os.path.join(root, 'Assets', 'Prefabs', 'Group0', 'Panel3.prefab')
+    with open(menu, encoding='utf-8') as f:
+        menu_text = f.read()
+
+    edit(menu, 'm_MethodName: Show', 'm_MethodName: Reopen')  # an edge out of the reachable set moves
+    state.update_file(menu)
+    counts.append(assert_matches_recompute(state))
+
+    os.remove(menu)  # entry nodes go away
+    state.update_file(menu)
+    counts.append(assert_matches_recompute(state))
+
+    with open(menu, 'w', encoding='utf-8') as f:
+        f.write(menu_text)
+    state.update_file(menu)
+    counts.append(assert_matches_recompute(state))
+
+    edit(panel, 'm_Name: Panel3 Button 1', 'm_Name: Panel3 Canvas Button')  # a new entry node
+    state.update_file(panel)
+    counts.append(assert_matches_recompute(state))
+
+    state.remove_file(panel)
+    counts.append(assert_matches_recompute(state))
+    assert panel not in state.contributions
+
+    assert counts[2] < counts[0] == counts[3] < counts[4]
+    assert counts[5] < counts[4]
@@ -0,0 +1,34 @@
+import io
+import pytest
+from parsers.unity_yaml_scanner import read_documents, iter_documents
+
+SCENE = (
+    "%YAML 1.1\n"
+    "%TAG !u! tag:unity3d.com,2011:\n"
+    "--- !u!1 &100\n"
+    "GameObject:\n"
+    "  m_Name: Play Button\n"
+    "--- !u!114 &-200 stripped\n"
+    "MonoBehaviour:\n"
+    "  m_Text: see --- !u!1 &300 inside a value\n"
+    "--- !u!224 &400\n"
+    "RectTransform:\n"
+    "  m_GameObject: {fileID: 100}\n"
+)
+
+
+@pytest.mark.parametrize('newline', ['\n', '\r\n'])
+def test_one_byte_chunks_match_the_default(newline):
+    data = SCENE.replace('\n', newline).encode('utf-8')
+    documents = list(read_documents(io.BytesIO(data)))
+    assert [(d.class_id, d.file_id, d.stripped) for d in documents] == [(1, 100, False), (114, -200, True),
+                                                                        (224, 400, False)]
+    assert 'see --- !u!1 &300 inside a value' in documents[1].text
+    for chunk_size in (1, 2, 3, 7, 8, 64):
+        assert list(read_documents(io.BytesIO(data), chunk_size)) == documents
+
+
+def test_file_without_documents_yields_nothing(tmp_path):
+    path = tmp_path / 'Empty.prefab'
+    path.write_bytes(b"%YAML 1.1\n")
+    assert list(iter_documents(str(path), chunk_size=1)) == []